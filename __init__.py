@@ -27,11 +27,15 @@ bl_info = {
 
 import bpy
 from bpy.types import Scene
-from bpy.props import StringProperty, IntProperty, BoolProperty, EnumProperty, PointerProperty
+from bpy.props import StringProperty, IntProperty, FloatProperty, BoolProperty, EnumProperty, PointerProperty
 
 from . import preferences
 from . import ui_panel
 from . import operators
+from . import import_workers
+from . import import_queue
+from . import asset_library
+from . import persistence
 
 
 # Register order matters
@@ -54,6 +58,10 @@ def register():
 
 def unregister():
     """Unregister addon."""
+    import_workers.shutdown_worker_pool()
+    import_queue.clear_import_queue()
+    asset_library.shutdown_asset_library()
+    persistence.flush_all()
     ui_panel.unregister()
     operators.unregister()
     unregister_properties()
@@ -111,6 +119,7 @@ def register_properties():
             ('OBJ', "OBJ", "OBJ format"),
             ('FBX', "FBX", "FBX format"),
             ('STL', "STL", "STL format"),
+            ('PLY', "PLY (Splat)", "Gaussian splat / point cloud PLY format"),
         ],
         default='GLB'
     )
@@ -141,6 +150,230 @@ def register_properties():
         description="Tipe generasi terakhir (text atau image)",
         default=""
     )
+    
+    # Import options
+    Scene.ai3d_import_max_file_mb = IntProperty(
+        name="Max File Size (MB)",
+        description="Tolak import GLB di atas ukuran ini (0 = tanpa batas)",
+        default=0,
+        min=0
+    )
+    
+    Scene.ai3d_import_max_triangles = IntProperty(
+        name="Max Triangles",
+        description="Tolak import GLB dengan triangle di atas jumlah ini (0 = tanpa batas)",
+        default=0,
+        min=0
+    )
+    
+    Scene.ai3d_optimize_mesh = BoolProperty(
+        name="Optimize Mesh",
+        description="Merge by distance, hapus geometry degenerate/loose, dan decimate setelah import",
+        default=False
+    )
+    
+    Scene.ai3d_triangle_budget = IntProperty(
+        name="Triangle Budget",
+        description="Total triangle maksimum setelah optimasi (0 = berdasarkan Quality)",
+        default=0,
+        min=0
+    )
+    
+    Scene.ai3d_generate_lods = BoolProperty(
+        name="Generate LODs",
+        description="Buat LOD chain dalam satu collection untuk setiap model yang di-import",
+        default=False
+    )
+    
+    Scene.ai3d_lod_ratios = StringProperty(
+        name="LOD Levels (%)",
+        description="Persentase triangle per level LOD, dipisah koma",
+        default="100,50,25,10"
+    )
+    
+    Scene.ai3d_texture_max_resolution = EnumProperty(
+        name="Max Texture Size",
+        description="Downscale texture hasil import ke resolusi maksimum ini",
+        items=[
+            ('0', "Original", "Jangan downscale texture"),
+            ('4096', "4096", "Maksimum 4096 px"),
+            ('2048', "2048", "Maksimum 2048 px"),
+            ('1024', "1024", "Maksimum 1024 px"),
+            ('512', "512", "Maksimum 512 px"),
+        ],
+        default='0'
+    )
+    
+    Scene.ai3d_texture_vram_budget_mb = IntProperty(
+        name="Texture VRAM Budget (MB)",
+        description="Total estimasi memory GPU texture per import (0 = tanpa batas)",
+        default=0,
+        min=0
+    )
+    
+    Scene.ai3d_texture_repack = BoolProperty(
+        name="Repack Textures",
+        description="Pack ulang texture yang di-downscale sebagai JPEG/PNG",
+        default=False
+    )
+    
+    Scene.ai3d_fast_obj_import = BoolProperty(
+        name="Fast OBJ Import",
+        description="Import OBJ lewat fast path NumPy (geometry + UV, tanpa material)",
+        default=False
+    )
+    
+    Scene.ai3d_point_budget = IntProperty(
+        name="Point Budget",
+        description="Subsample splat/point cloud PLY ke jumlah point ini (0 = semua)",
+        default=0,
+        min=0
+    )
+    
+    Scene.ai3d_dedupe_datablocks = BoolProperty(
+        name="Deduplicate Materials",
+        description="Remap material dan image identik dari import ke satu datablock",
+        default=True
+    )
+    
+    Scene.ai3d_background_import = BoolProperty(
+        name="Background Import",
+        description="Import dan optimasi model di proses Blender terpisah (blender -b)",
+        default=False
+    )
+    
+    Scene.ai3d_background_link = BoolProperty(
+        name="Link Result",
+        description="Link hasil background import (bukan append)",
+        default=False
+    )
+    
+    Scene.ai3d_time_sliced_import = BoolProperty(
+        name="Time-Sliced Import",
+        description="Jalankan import dan post-processing bertahap lewat timer supaya UI tidak freeze",
+        default=False
+    )
+    
+    Scene.ai3d_queue_budget_ms = IntProperty(
+        name="Tick Budget (ms)",
+        description="Waktu kerja import maksimum per timer tick",
+        default=50,
+        min=5,
+        max=1000
+    )
+    
+    Scene.ai3d_link_duplicates = BoolProperty(
+        name="Link Duplicates",
+        description="Model yang sama di-import ulang sebagai linked duplicate (share mesh). Matikan untuk unique copy",
+        default=True
+    )
+    
+    Scene.ai3d_asset_library = BoolProperty(
+        name="Export to Asset Library",
+        description="Tandai model hasil import sebagai asset dan simpan ke asset library; job yang sudah ada di library di-link tanpa download",
+        default=False
+    )
+    
+    Scene.ai3d_external_storage = BoolProperty(
+        name="External Storage",
+        description="Simpan setiap model di .blend sendiri dan link ke scene supaya file kerja tetap kecil",
+        default=False
+    )
+    
+    Scene.ai3d_storage_override = BoolProperty(
+        name="Library Override",
+        description="Buat library override yang bisa diedit alih-alih instance collection",
+        default=False
+    )
+    
+    Scene.ai3d_normalize_import = BoolProperty(
+        name="Normalize",
+        description="Samakan skala, ground alignment, dan origin model hasil import",
+        default=False
+    )
+    
+    Scene.ai3d_normalize_size = FloatProperty(
+        name="Target Size",
+        description="Dimensi terbesar model setelah import (0 = pertahankan skala provider)",
+        default=0.0,
+        min=0.0,
+        unit='LENGTH'
+    )
+    
+    Scene.ai3d_normalize_ground = BoolProperty(
+        name="Align to Ground",
+        description="Letakkan titik terendah model di Z = 0",
+        default=True
+    )
+    
+    Scene.ai3d_normalize_center = BoolProperty(
+        name="Center",
+        description="Pusatkan model di origin world (XY)",
+        default=True
+    )
+    
+    Scene.ai3d_normalize_origin = EnumProperty(
+        name="Origin",
+        description="Penempatan origin object hasil import",
+        items=[
+            ('NONE', "Keep", "Pertahankan origin dari file"),
+            ('BOTTOM', "Bottom", "Origin di tengah bawah bounds"),
+            ('CENTER', "Center", "Origin di tengah bounds"),
+        ],
+        default='NONE'
+    )
+    
+    Scene.ai3d_record_metrics = BoolProperty(
+        name="Record Quality Metrics",
+        description="Analisis geometry hasil import dan simpan metrics di history generasi",
+        default=True
+    )
+    
+    Scene.ai3d_model_cache = BoolProperty(
+        name="Model Cache",
+        description="Simpan file model hasil download di cache lokal (hot raw + cold terkompresi)",
+        default=True
+    )
+    
+    Scene.ai3d_cache_hot_mb = IntProperty(
+        name="Hot Tier (MB)",
+        description="Ukuran maksimum file mentah di cache (0 = tanpa batas); model yang jarang dipakai dikompres ke cold tier",
+        default=2048,
+        min=0
+    )
+    
+    Scene.ai3d_cache_codec = EnumProperty(
+        name="Cold Codec",
+        description="Codec kompresi untuk cold tier",
+        items=[
+            ('lzma', "LZMA", "Rasio kompresi terbaik, lebih lambat"),
+            ('zlib', "Zlib", "Kompresi dan dekompresi lebih cepat"),
+        ],
+        default='lzma'
+    )
+    
+    Scene.ai3d_max_downloads = IntProperty(
+        name="Max Downloads",
+        description="Jumlah download model bersamaan maksimum",
+        default=4,
+        min=1,
+        max=32
+    )
+    
+    Scene.ai3d_max_downloads_per_host = IntProperty(
+        name="Per Host",
+        description="Jumlah download bersamaan maksimum ke satu host",
+        default=2,
+        min=1,
+        max=16
+    )
+    
+    Scene.ai3d_bandwidth_limit_mbps = FloatProperty(
+        name="Bandwidth Limit (Mbit/s)",
+        description="Batas total bandwidth download (0 = tanpa batas)",
+        default=0.0,
+        min=0.0
+    )
 
 
 def unregister_properties():
@@ -155,6 +388,38 @@ def unregister_properties():
         'ai3d_background_removal',
         'ai3d_current_job_id',
         'ai3d_generation_type',
+        'ai3d_import_max_file_mb',
+        'ai3d_import_max_triangles',
+        'ai3d_optimize_mesh',
+        'ai3d_triangle_budget',
+        'ai3d_generate_lods',
+        'ai3d_lod_ratios',
+        'ai3d_texture_max_resolution',
+        'ai3d_texture_vram_budget_mb',
+        'ai3d_texture_repack',
+        'ai3d_fast_obj_import',
+        'ai3d_link_duplicates',
+        'ai3d_point_budget',
+        'ai3d_dedupe_datablocks',
+        'ai3d_background_import',
+        'ai3d_background_link',
+        'ai3d_time_sliced_import',
+        'ai3d_queue_budget_ms',
+        'ai3d_asset_library',
+        'ai3d_external_storage',
+        'ai3d_storage_override',
+        'ai3d_normalize_import',
+        'ai3d_normalize_size',
+        'ai3d_normalize_ground',
+        'ai3d_normalize_center',
+        'ai3d_normalize_origin',
+        'ai3d_record_metrics',
+        'ai3d_model_cache',
+        'ai3d_cache_hot_mb',
+        'ai3d_cache_codec',
+        'ai3d_max_downloads',
+        'ai3d_max_downloads_per_host',
+        'ai3d_bandwidth_limit_mbps',
     ]
     
     for prop in props:
@@ -0,0 +1,234 @@
+"""
+Asset Library Export
+
+Addon ini hanya bertindak sebagai client untuk layanan AI 3D pihak ketiga.
+User harus mendaftar dan menyediakan API key sendiri.
+
+Tandai model hasil import sebagai asset dan tulis secara batch ke folder
+Blender Asset Library. Metadata generation (provider, prompt, style, job ID)
+disimpan di asset, preview dirender belakangan lewat timer, dan index
+job ID -> .blend memungkinkan re-import lewat link lokal tanpa download.
+"""
+
+import bpy
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+
+from .persistence import atomic_write, dumps
+
+
+LIBRARY_NAME = "AI 3D Generator"
+INDEX_FILENAME = "asset_index.json"
+
+BATCH_SIZE = 10
+FLUSH_DELAY = 10.0
+PREVIEW_INTERVAL = 0.2
+
+
+def get_default_library_dir():
+    """Get folder asset library default di folder user Blender."""
+    library_dir = Path(bpy.utils.resource_path('USER')) / 'ai_3d_generator' / 'asset_library'
+    library_dir.mkdir(parents=True, exist_ok=True)
+    return library_dir
+
+
+def ensure_asset_library(library_dir):
+    """Daftarkan folder sebagai asset library di preferences jika belum ada."""
+    try:
+        libraries = bpy.context.preferences.filepaths.asset_libraries
+    except AttributeError:
+        return
+    target = os.path.normcase(os.path.abspath(str(library_dir)))
+    for library in libraries:
+        if os.path.normcase(os.path.abspath(bpy.path.abspath(library.path))) == target:
+            return
+    try:
+        libraries.new(name=LIBRARY_NAME, directory=str(library_dir))
+    except (AttributeError, TypeError, RuntimeError) as e:
+        print(f"Could not register asset library: {str(e)}")
+
+
+class AssetLibraryWriter:
+    """Kumpulkan asset baru dan tulis ke asset library secara batch."""
+
+    def __init__(self, library_dir=None):
+        """Initialize writer.
+
+        Args:
+            library_dir (str): Folder asset library (default: folder user)
+        """
+        self.library_dir = Path(library_dir) if library_dir else get_default_library_dir()
+        self.library_dir.mkdir(parents=True, exist_ok=True)
+        self.index_file = self.library_dir / INDEX_FILENAME
+        self.index = self._load_index()
+        self.pending = []
+        self.preview_queue = []
+        # bpy.app.timers membandingkan callback berdasarkan identitas object
+        self._flush_callback = self._flush_timer
+        self._preview_callback = self._preview_timer
+
+    def _load_index(self):
+        """Load index job ID -> lokasi asset."""
+        if self.index_file.exists():
+            try:
+                with open(self.index_file, 'r') as f:
+                    return json.load(f)
+            except Exception as e:
+                print(f"Error loading asset index: {str(e)}")
+        return {'assets': {}}
+
+    def _save_index(self):
+        """Save index asset (atomic: crash saat menulis tidak merusak index lama)."""
+        try:
+            atomic_write(self.index_file, dumps(self.index))
+        except Exception as e:
+            print(f"Error saving asset index: {str(e)}")
+
+    def add(self, objects, name, metadata):
+        """
+        Tandai model sebagai asset dan antrikan untuk ditulis ke library.
+
+        Args:
+            objects: Object hasil import
+            name (str): Nama asset
+            metadata (dict): provider, prompt, style, quality, job_id
+
+        Returns:
+            Collection asset
+        """
+        collection = bpy.data.collections.new(name)
+        for obj in objects:
+            collection.objects.link(obj)
+        return self.add_collection(collection, metadata)
+
+    def add_collection(self, collection, metadata):
+        """Tandai collection yang sudah ada sebagai asset dan antrikan."""
+        collection.asset_mark()
+        asset_data = collection.asset_data
+        asset_data.description = metadata.get('prompt', '')
+        asset_data.author = metadata.get('provider', '')
+        for key in ('provider', 'style', 'job_id'):
+            if metadata.get(key):
+                asset_data.tags.new(f"{key}:{metadata[key]}", skip_if_exists=True)
+        for key, value in metadata.items():
+            collection[f"ai3d_{key}"] = value
+
+        self.pending.append((collection, dict(metadata)))
+        self.preview_queue.append(collection.name)
+
+        # Batch penuh ditulis segera setelah preview selesai, batch kecil
+        # menunggu jeda supaya import berikutnya ikut masuk file yang sama
+        delay = 0.0 if len(self.pending) >= BATCH_SIZE else FLUSH_DELAY
+        if bpy.app.timers.is_registered(self._flush_callback):
+            bpy.app.timers.unregister(self._flush_callback)
+        bpy.app.timers.register(self._flush_callback, first_interval=delay)
+
+        if not bpy.app.timers.is_registered(self._preview_callback):
+            bpy.app.timers.register(self._preview_callback, first_interval=PREVIEW_INTERVAL)
+
+        return collection
+
+    def flush(self):
+        """Tulis semua asset pending ke satu file .blend baru di library."""
+        if not self.pending:
+            return None
+
+        filename = f"ai3d_assets_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.blend"
+        blend_path = self.library_dir / filename
+        collections = {collection for collection, _ in self.pending}
+
+        try:
+            bpy.data.libraries.write(str(blend_path), collections, fake_user=True, compress=True)
+        except Exception as e:
+            print(f"Error writing asset library batch: {str(e)}")
+            return None
+
+        for collection, metadata in self.pending:
+            if metadata.get('job_id'):
+                self.index['assets'][metadata['job_id']] = {
+                    'blend': filename,
+                    'collection': collection.name,
+                    'metadata': metadata,
+                }
+        self._save_index()
+
+        print(f"Wrote {len(self.pending)} assets to: {blend_path}")
+        self.pending = []
+        ensure_asset_library(self.library_dir)
+        return str(blend_path)
+
+    def _flush_timer(self):
+        """Timer callback: flush batch setelah semua preview-nya dirender."""
+        if self.preview_queue:
+            return PREVIEW_INTERVAL
+        self.flush()
+        return None
+
+    def _preview_timer(self):
+        """Timer callback: render satu preview asset per tick."""
+        while self.preview_queue:
+            collection = bpy.data.collections.get(self.preview_queue.pop(0))
+            if collection is None:
+                continue
+            try:
+                collection.asset_generate_preview()
+            except (AttributeError, RuntimeError) as e:
+                print(f"Asset preview skipped for {collection.name}: {str(e)}")
+            return PREVIEW_INTERVAL
+        return None
+
+    def find(self, job_id):
+        """Cari asset di library berdasarkan job ID."""
+        entry = self.index['assets'].get(job_id)
+        if entry and (self.library_dir / entry['blend']).exists():
+            return entry
+        return None
+
+    def link(self, job_id):
+        """
+        Link asset dari library ke scene (tanpa download ulang).
+
+        Returns:
+            Collection yang ter-link, atau None jika job tidak ada di library
+        """
+        from .import_workers import load_worker_result
+
+        entry = self.find(job_id)
+        if not entry:
+            return None
+        return load_worker_result(
+            str(self.library_dir / entry['blend']), entry['collection'], link=True
+        )
+
+    def shutdown(self):
+        """Flush asset pending dan hentikan timer (dipanggil saat unregister)."""
+        self.flush()
+        for callback in (self._flush_callback, self._preview_callback):
+            if bpy.app.timers.is_registered(callback):
+                bpy.app.timers.unregister(callback)
+
+
+# Global asset library writer instance
+_asset_library_instance = None
+
+
+def get_asset_library(library_dir=None):
+    """Get global asset library writer instance."""
+    global _asset_library_instance
+    if _asset_library_instance is None or (
+        library_dir and Path(library_dir) != _asset_library_instance.library_dir
+    ):
+        if _asset_library_instance is not None:
+            _asset_library_instance.shutdown()
+        _asset_library_instance = AssetLibraryWriter(library_dir)
+    return _asset_library_instance
+
+
+def shutdown_asset_library():
+    """Flush dan hentikan global asset library writer jika ada."""
+    global _asset_library_instance
+    if _asset_library_instance is not None:
+        _asset_library_instance.shutdown()
+        _asset_library_instance = None
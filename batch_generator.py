@@ -5,10 +5,12 @@ Mengelola batch generation dengan queue system dan progress tracking.
 """
 
 import bpy
-import json
+import uuid
 from pathlib import Path
 from datetime import datetime
 
+from .persistence import keyed_merge, register_store
+
 
 class BatchJob:
     """Representasi satu batch job."""
@@ -63,6 +65,9 @@ class BatchGenerator:
     def __init__(self):
         """Initialize batch generator."""
         self.jobs_file = self._get_jobs_file()
+        self._store = register_store(
+            self.jobs_file, lambda: self.jobs_data, 'batch jobs', keyed_merge({'jobs': 'job_id'})
+        )
         self.jobs_data = self._load_jobs()
         self.current_batch = None
     
@@ -74,22 +79,22 @@ class BatchGenerator:
     
     def _load_jobs(self):
         """Load jobs dari file."""
-        if self.jobs_file.exists():
-            try:
-                with open(self.jobs_file, 'r') as f:
-                    return json.load(f)
-            except Exception as e:
-                print(f"Error loading batch jobs: {str(e)}")
-                return {'jobs': []}
-        return {'jobs': []}
+        return self._store.load({'jobs': []})
     
-    def _save_jobs(self):
-        """Save jobs ke file."""
-        try:
-            with open(self.jobs_file, 'w') as f:
-                json.dump(self.jobs_data, f, indent=2)
-        except Exception as e:
-            print(f"Error saving batch jobs: {str(e)}")
+    def _refresh(self):
+        """Muat ulang jobs jika file diubah proses Blender lain."""
+        data = self._store.refresh()
+        if data is not None:
+            self.jobs_data = data
+    
+    def _save_jobs(self, job_id=None, removed=False):
+        """Tandai jobs berubah; file ditulis oleh persistence layer (debounced, atomic).
+        
+        Args:
+            job_id (str): Batch yang berubah (None = semua), untuk merge antar proses
+            removed (bool): Batch dihapus
+        """
+        self._store.mark_dirty(('jobs', job_id) if job_id else None, removed)
     
     def create_batch(self, name, generation_configs):
         """Create batch job baru.
@@ -109,17 +114,20 @@ class BatchGenerator:
         Returns:
             BatchJob: Batch job yang dibuat
         """
-        job_id = f"batch_{int(datetime.now().timestamp())}"
+        # Suffix acak mencegah ID bentrok antar proses Blender yang berbagi file jobs
+        job_id = f"batch_{int(datetime.now().timestamp())}_{uuid.uuid4().hex[:8]}"
         batch = BatchJob(job_id, name, generation_configs)
         
+        self._refresh()
         self.jobs_data['jobs'].append(batch.to_dict())
-        self._save_jobs()
+        self._save_jobs(job_id)
         self.current_batch = batch
         
         return batch
     
     def get_batch(self, job_id):
         """Get batch job berdasarkan ID."""
+        self._refresh()
         for job_data in self.jobs_data['jobs']:
             if job_data['job_id'] == job_id:
                 return BatchJob.from_dict(job_data)
@@ -127,6 +135,7 @@ class BatchGenerator:
     
     def get_all_batches(self):
         """Get semua batch jobs."""
+        self._refresh()
         return [BatchJob.from_dict(j) for j in self.jobs_data['jobs']]
     
     def update_batch_status(self, job_id, status, completed=None, failed=None):
@@ -138,6 +147,7 @@ class BatchGenerator:
             completed (int): Total completed items
             failed (int): Total failed items
         """
+        self._refresh()
         for job_data in self.jobs_data['jobs']:
             if job_data['job_id'] == job_id:
                 job_data['status'] = status
@@ -145,7 +155,7 @@ class BatchGenerator:
                     job_data['completed_items'] = completed
                 if failed is not None:
                     job_data['failed_items'] = failed
-                self._save_jobs()
+                self._save_jobs(job_id)
                 return
     
     def update_item_status(self, job_id, item_index, item_status):
@@ -160,6 +170,7 @@ class BatchGenerator:
                 - error: error message jika ada
                 - model_url: URL model jika completed
         """
+        self._refresh()
         for job_data in self.jobs_data['jobs']:
             if job_data['job_id'] == job_id:
                 # Ensure item_statuses list cukup besar
@@ -167,15 +178,35 @@ class BatchGenerator:
                     job_data['item_statuses'].append(None)
                 
                 job_data['item_statuses'][item_index] = item_status
-                self._save_jobs()
+                self._save_jobs(job_id)
+                if item_status.get('status') == 'completed' and item_status.get('model_url'):
+                    self._prefetch_item(job_data, item_index, item_status)
                 return
     
+    def _prefetch_item(self, job_data, item_index, item_status):
+        """Download model item yang selesai ke model cache di background (prioritas prefetch)."""
+        from .downloader import get_import_settings, prefetch_model_file
+        settings = get_import_settings(getattr(bpy.context, 'scene', None))
+        if not settings.get('model_cache'):
+            return
+        config = _item_config(job_data, item_index)
+        try:
+            prefetch_model_file(
+                item_status['model_url'],
+                config.get('format', 'glb').lower(),
+                item_status.get('job_id'),
+                settings,
+            )
+        except Exception as e:
+            print(f"Error prefetching batch item: {str(e)}")
+    
     def delete_batch(self, job_id):
         """Delete batch job."""
+        self._refresh()
         self.jobs_data['jobs'] = [
             j for j in self.jobs_data['jobs'] if j['job_id'] != job_id
         ]
-        self._save_jobs()
+        self._save_jobs(job_id, removed=True)
         if self.current_batch and self.current_batch.job_id == job_id:
             self.current_batch = None
     
@@ -226,7 +257,7 @@ class BatchGenerator:
                     job_data['generation_configs'].append(generation_config)
                     job_data['total_items'] = len(job_data['generation_configs'])
             
-            self._save_jobs()
+            self._save_jobs(job_id)
     
     def get_pending_items(self, job_id):
         """Get pending items dari batch.
@@ -244,6 +275,34 @@ class BatchGenerator:
                 pending.append((i, batch.generation_configs[i]))
         
         return pending
+    
+    def get_completed_models(self, job_id):
+        """Get model item yang sudah selesai untuk downloader.download_models_batch().
+        
+        Returns:
+            list: Dict dengan 'model_url', 'import_type', 'object_name', 'job_id'
+        """
+        self._refresh()
+        for job_data in self.jobs_data['jobs']:
+            if job_data['job_id'] != job_id:
+                continue
+            models = []
+            for i, status in enumerate(job_data['item_statuses']):
+                if status and status.get('status') == 'completed' and status.get('model_url'):
+                    models.append({
+                        'model_url': status['model_url'],
+                        'import_type': _item_config(job_data, i).get('format', 'glb').lower(),
+                        'object_name': f"{job_data['name']}_{i + 1}",
+                        'job_id': status.get('job_id'),
+                    })
+            return models
+        return []
+
+
+def _item_config(job_data, item_index):
+    """Generation config item batch (dict kosong jika index di luar range)."""
+    configs = job_data['generation_configs']
+    return configs[item_index] if item_index < len(configs) else {}
 
 
 # Global batch generator instance
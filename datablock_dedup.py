@@ -0,0 +1,144 @@
+"""
+Datablock Deduplication
+
+Addon ini hanya bertindak sebagai client untuk layanan AI 3D pihak ketiga.
+User harus mendaftar dan menyediakan API key sendiri.
+
+Deduplikasi image dan material hasil import.
+Image di-hash dari data pixel/packed file, material dari setup node-nya.
+Duplikat di-remap ke satu datablock kanonik lalu dihapus. Index hash
+disimpan per session sehingga import berikutnya ikut di-dedup.
+"""
+
+import bpy
+import hashlib
+
+import numpy as np
+
+
+# Index per session: hash -> nama datablock kanonik
+_image_index = {}
+_material_index = {}
+
+# Property node yang ikut menentukan hasil shading
+NODE_SETTINGS = (
+    'operation', 'blend_type', 'data_type', 'interpolation', 'projection',
+    'extension', 'distribution', 'subsurface_method', 'use_clamp', 'space',
+    'uv_map', 'attribute_name', 'label',
+)
+
+
+def image_hash(image) -> str:
+    """
+    Hash isi image.
+
+    Packed file di-hash langsung dari bytes-nya (tanpa decode). Image lain
+    di-hash dari buffer pixel lewat foreach_get.
+    """
+    digest = hashlib.sha1()
+    digest.update(repr((tuple(image.size), image.colorspace_settings.name, image.alpha_mode)).encode())
+
+    if image.packed_file is not None:
+        digest.update(image.packed_file.data)
+    else:
+        width, height = image.size
+        if width and height:
+            pixels = np.empty(width * height * image.channels, dtype=np.float32)
+            image.pixels.foreach_get(pixels)
+            digest.update(pixels.tobytes())
+        else:
+            digest.update(bpy.path.abspath(image.filepath).encode())
+
+    return digest.hexdigest()
+
+
+def _value_repr(value):
+    """Representasi stabil untuk default_value socket/property."""
+    if hasattr(value, '__len__') and not isinstance(value, str):
+        return tuple(round(v, 6) if isinstance(v, float) else v for v in value)
+    if isinstance(value, float):
+        return round(value, 6)
+    if isinstance(value, bpy.types.ID):
+        return value.name
+    return value
+
+
+def material_hash(material) -> str:
+    """Hash setup material: setting dasar, node, nilai input, image, dan link."""
+    digest = hashlib.sha1()
+    digest.update(repr((
+        _value_repr(material.diffuse_color),
+        _value_repr(material.metallic),
+        _value_repr(material.roughness),
+        getattr(material, 'blend_method', ''),
+        material.use_backface_culling,
+    )).encode())
+
+    if material.use_nodes and material.node_tree:
+        tree = material.node_tree
+        for node in sorted(tree.nodes, key=lambda n: n.name):
+            parts = [node.bl_idname, node.name]
+            for setting in NODE_SETTINGS:
+                if hasattr(node, setting):
+                    parts.append((setting, _value_repr(getattr(node, setting))))
+            image = getattr(node, 'image', None)
+            if image is not None:
+                # Image sudah di-dedup lebih dulu, jadi nama kanonik cukup
+                parts.append(('image', image.name))
+            for socket in node.inputs:
+                if not socket.is_linked and hasattr(socket, 'default_value'):
+                    parts.append((socket.identifier, _value_repr(socket.default_value)))
+            digest.update(repr(parts).encode())
+
+        links = sorted(
+            (l.from_node.name, l.from_socket.identifier, l.to_node.name, l.to_socket.identifier)
+            for l in tree.links
+        )
+        digest.update(repr(links).encode())
+
+    return digest.hexdigest()
+
+
+def _dedupe(datablocks, collection, index: dict, hash_func) -> int:
+    """Remap duplikat ke datablock kanonik dan hapus duplikatnya."""
+    removed = 0
+    for datablock in datablocks:
+        key = hash_func(datablock)
+        canonical = collection.get(index.get(key, ''))
+
+        if canonical is None or canonical == datablock:
+            index[key] = datablock.name
+            continue
+
+        datablock.user_remap(canonical)
+        if datablock.users == 0:
+            collection.remove(datablock)
+            removed += 1
+
+    return removed
+
+
+def deduplicate_imported(new_images, new_materials) -> dict:
+    """
+    Dedup image dan material yang dibuat oleh import.
+
+    Image diproses lebih dulu supaya material yang memakai image identik
+    menghasilkan hash yang sama.
+
+    Args:
+        new_images: Image datablock baru dari import
+        new_materials: Material datablock baru dari import
+
+    Returns:
+        Dict dengan kunci 'images_removed' dan 'materials_removed'
+    """
+    images_removed = _dedupe(new_images, bpy.data.images, _image_index, image_hash)
+    materials_removed = _dedupe(new_materials, bpy.data.materials, _material_index, material_hash)
+
+    if images_removed or materials_removed:
+        print(f"Deduplicated {images_removed} images and {materials_removed} materials")
+
+    return {
+        'images_removed': images_removed,
+        'materials_removed': materials_removed,
+    }
@@ -0,0 +1,273 @@
+"""
+Download Scheduler
+
+Addon ini hanya bertindak sebagai client untuk layanan AI 3D pihak ketiga.
+User harus mendaftar dan menyediakan API key sendiri.
+
+Scheduler di atas download_model_file() dengan kelas prioritas
+(interactive, batch, prefetch), batas download bersamaan global dan per
+host, serta batas bandwidth opsional. Download interactive mem-preempt
+download background: download batch/prefetch yang sedang berjalan di-pause
+sampai tidak ada download interactive yang aktif. Pause yang lebih lama dari
+MAX_PAUSE_SECONDS menutup koneksinya; download itu kembali ke antrian dan
+dilanjutkan dengan HTTP Range request dari file parsialnya.
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from urllib.parse import urlsplit
+
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BATCH = 1
+PRIORITY_PREFETCH = 2
+
+PRIORITY_NAMES = {
+    'interactive': PRIORITY_INTERACTIVE,
+    'batch': PRIORITY_BATCH,
+    'prefetch': PRIORITY_PREFETCH,
+}
+
+DEFAULT_MAX_CONCURRENT = 4
+DEFAULT_MAX_PER_HOST = 2
+
+# Socket download yang di-pause tidak ditahan terbuka lebih lama dari ini
+MAX_PAUSE_SECONDS = 30
+
+
+class DownloadPaused(Exception):
+    """Dilempar chunk hook saat pause melewati MAX_PAUSE_SECONDS.
+
+    download_model_file() mengisi partial_path dengan file yang sudah
+    ter-download supaya scheduler bisa melanjutkannya nanti.
+    """
+
+    def __init__(self, url):
+        super().__init__(f"Download paused too long: {url}")
+        self.partial_path = None
+
+
+class DownloadJob:
+    """Satu download yang dijadwalkan."""
+
+    def __init__(self, url, file_type, priority, on_complete=None):
+        """Initialize download job.
+
+        Args:
+            url (str): URL model
+            file_type (str): Ekstensi/format file
+            priority (int): PRIORITY_INTERACTIVE, PRIORITY_BATCH, atau PRIORITY_PREFETCH
+            on_complete (callable): Dipanggil dengan (job) dari thread download;
+                jangan akses bpy di dalamnya
+        """
+        self.url = url
+        self.file_type = file_type
+        self.priority = priority
+        self.host = urlsplit(url).netloc
+        self.on_complete = on_complete
+        self.path = None
+        self.partial_path = None
+        self.error = None
+        self.preempted = False
+        self.seq = None
+        self.done = threading.Event()
+
+    def wait(self, timeout=None):
+        """Tunggu sampai download selesai.
+
+        Returns:
+            Path file hasil download
+
+        Raises:
+            Exception dari download jika gagal
+        """
+        if not self.done.wait(timeout):
+            raise TimeoutError(f"Download timed out: {self.url}")
+        if self.error is not None:
+            raise self.error
+        return self.path
+
+
+class DownloadScheduler:
+    """Jadwalkan download model berdasarkan prioritas, concurrency, dan bandwidth."""
+
+    def __init__(self, max_concurrent=DEFAULT_MAX_CONCURRENT, max_per_host=DEFAULT_MAX_PER_HOST,
+                 bandwidth_limit=0):
+        """Initialize scheduler.
+
+        Args:
+            max_concurrent (int): Download aktif maksimum
+            max_per_host (int): Download aktif maksimum per host
+            bandwidth_limit (float): Batas total bandwidth (bytes/detik, 0 = tanpa batas)
+        """
+        self.max_concurrent = max_concurrent
+        self.max_per_host = max_per_host
+        self.bandwidth_limit = bandwidth_limit
+        self._pending = []
+        self._running = []
+        self._counter = itertools.count()
+        self._cond = threading.Condition()
+        self._next_send = 0.0
+
+    def configure(self, max_concurrent=None, max_per_host=None, bandwidth_limit=None):
+        """Update batas scheduler."""
+        with self._cond:
+            if max_concurrent:
+                self.max_concurrent = max_concurrent
+            if max_per_host:
+                self.max_per_host = max_per_host
+            if bandwidth_limit is not None:
+                self.bandwidth_limit = bandwidth_limit
+            self._dispatch()
+
+    def submit(self, url, file_type=None, priority=PRIORITY_INTERACTIVE, on_complete=None):
+        """Masukkan download ke antrian.
+
+        Returns:
+            DownloadJob
+        """
+        job = DownloadJob(url, file_type, priority, on_complete)
+        with self._cond:
+            job.seq = next(self._counter)
+            heapq.heappush(self._pending, (priority, job.seq, job))
+            self._dispatch()
+        return job
+
+    def download(self, url, file_type=None, priority=PRIORITY_INTERACTIVE, timeout=None):
+        """Download secara blocking lewat scheduler.
+
+        Returns:
+            Path file hasil download
+        """
+        return self.submit(url, file_type, priority).wait(timeout)
+
+    def queue_depth(self):
+        """Jumlah download pending + running."""
+        with self._cond:
+            return len(self._pending) + len(self._running)
+
+    def _active(self, host=None):
+        """Download yang berjalan dan tidak di-pause (opsional per host)."""
+        return [
+            job for job in self._running
+            if not job.preempted and (host is None or job.host == host)
+        ]
+
+    def _has_interactive(self):
+        """Cek apakah ada download interactive pending/running."""
+        return any(job.priority == PRIORITY_INTERACTIVE for job in self._running) or any(
+            item[2].priority == PRIORITY_INTERACTIVE for item in self._pending
+        )
+
+    def _can_start(self, job) -> bool:
+        """Cek batas global dan per host untuk job."""
+        return (len(self._active()) < self.max_concurrent
+                and len(self._active(job.host)) < self.max_per_host)
+
+    def _preempt_for(self, job) -> bool:
+        """Pause download background supaya job interactive bisa mulai."""
+        # Prefetch di-pause lebih dulu daripada batch
+        victims = sorted(
+            (j for j in self._active() if j.priority > job.priority),
+            key=lambda j: -j.priority,
+        )
+        for victim in victims:
+            if self._can_start(job):
+                break
+            global_full = len(self._active()) >= self.max_concurrent
+            if global_full or victim.host == job.host:
+                victim.preempted = True
+                print(f"Download paused for interactive job: {victim.url}")
+        return self._can_start(job)
+
+    def _dispatch(self):
+        """Mulai job pending yang boleh jalan. Harus dipanggil dengan lock."""
+        # Resume download yang di-pause jika tidak ada lagi job interactive
+        if not self._has_interactive():
+            for job in self._running:
+                if job.preempted:
+                    job.preempted = False
+            self._cond.notify_all()
+
+        blocked = []
+        while self._pending:
+            item = heapq.heappop(self._pending)
+            job = item[2]
+            can_start = self._can_start(job)
+            if not can_start and job.priority == PRIORITY_INTERACTIVE:
+                can_start = self._preempt_for(job)
+            if can_start:
+                self._running.append(job)
+                threading.Thread(target=self._run, args=(job,), daemon=True).start()
+            else:
+                blocked.append(item)
+        for item in blocked:
+            heapq.heappush(self._pending, item)
+
+    def _on_chunk(self, job, size):
+        """Hook per chunk: tunggu saat di-preempt dan terapkan batas bandwidth."""
+        with self._cond:
+            deadline = None
+            while job.preempted:
+                if deadline is None:
+                    deadline = time.monotonic() + MAX_PAUSE_SECONDS
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise DownloadPaused(job.url)
+                self._cond.wait(remaining)
+            limit = self.bandwidth_limit
+            if not limit:
+                return
+            now = time.monotonic()
+            start = max(now, self._next_send)
+            self._next_send = start + size / limit
+        delay = start - now
+        if delay > 0:
+            time.sleep(delay)
+
+    def _run(self, job):
+        """Thread download satu job."""
+        from .downloader import download_model_file
+
+        try:
+            job.path = download_model_file(
+                job.url, job.file_type, chunk_hook=lambda size: self._on_chunk(job, size),
+                resume_from=job.partial_path,
+            )
+        except DownloadPaused as e:
+            # Koneksi sudah ditutup; antri ulang di posisi semula, lanjut dari file parsial
+            print(f"Download closed after long pause, will resume: {job.url}")
+            with self._cond:
+                self._running.remove(job)
+                job.preempted = False
+                job.partial_path = e.partial_path
+                heapq.heappush(self._pending, (job.priority, job.seq, job))
+                self._dispatch()
+            return
+        except Exception as e:
+            job.error = e
+
+        with self._cond:
+            self._running.remove(job)
+            self._dispatch()
+
+        job.done.set()
+        if job.on_complete:
+            try:
+                job.on_complete(job)
+            except Exception as e:
+                print(f"Download callback error: {str(e)}")
+
+
+# Global download scheduler instance
+_scheduler_instance = None
+
+
+def get_download_scheduler():
+    """Get global download scheduler instance."""
+    global _scheduler_instance
+    if _scheduler_instance is None:
+        _scheduler_instance = DownloadScheduler()
+    return _scheduler_instance
@@ -13,8 +13,81 @@ import tempfile
 import requests
 from pathlib import Path
 
+from .glb_inspector import inspect_glb, select_import_profile, check_glb_budget
+from .mesh_optimizer import optimize_meshes, quality_to_triangle_budget
+from .lod_generator import generate_lod_chain, parse_lod_ratios, DEFAULT_LOD_RATIOS
+from .texture_optimizer import optimize_textures
+from .fast_mesh_io import import_stl_fast, import_obj_fast
+from .model_instancing import file_content_hash, register_source, instance_model
+from .ply_importer import import_ply
+from .datablock_dedup import deduplicate_imported
+from .import_workers import ImportJob, get_worker_pool
+from .import_queue import enqueue_import, PRIORITY_USER
+from .asset_library import get_asset_library
+from .model_storage import store_model
+from .model_normalizer import normalize_objects
+from .mesh_metrics import compute_metrics
+from .history import get_history
+from .model_cache import get_model_cache, cache_key
+from .download_scheduler import (
+    get_download_scheduler, DownloadPaused, PRIORITY_NAMES, PRIORITY_INTERACTIVE, PRIORITY_PREFETCH,
+)
 
-def download_and_import_model(model_url: str, import_type: str, object_name: str):
+
+# glTF importer options per optimization profile dari glb_inspector
+GLTF_PROFILE_OPTIONS = {
+    'light': {},
+    'standard': {},
+    'heavy': {'merge_vertices': True},
+}
+
+
+def get_import_settings(scene) -> dict:
+    """
+    Kumpulkan import settings dari scene properties.
+    
+    Returns:
+        Dict settings untuk download_and_import_model()
+    """
+    return {
+        'max_file_mb': getattr(scene, 'ai3d_import_max_file_mb', 0),
+        'max_triangles': getattr(scene, 'ai3d_import_max_triangles', 0),
+        'optimize_mesh': getattr(scene, 'ai3d_optimize_mesh', False),
+        'triangle_budget': getattr(scene, 'ai3d_triangle_budget', 0),
+        'quality': getattr(scene, 'ai3d_quality', 7),
+        'generate_lods': getattr(scene, 'ai3d_generate_lods', False),
+        'lod_ratios': getattr(scene, 'ai3d_lod_ratios', DEFAULT_LOD_RATIOS),
+        'texture_max_resolution': int(getattr(scene, 'ai3d_texture_max_resolution', '0')),
+        'texture_vram_budget_mb': getattr(scene, 'ai3d_texture_vram_budget_mb', 0),
+        'texture_repack': getattr(scene, 'ai3d_texture_repack', False),
+        'fast_obj_import': getattr(scene, 'ai3d_fast_obj_import', False),
+        'link_duplicates': getattr(scene, 'ai3d_link_duplicates', True),
+        'point_budget': getattr(scene, 'ai3d_point_budget', 0),
+        'dedupe_datablocks': getattr(scene, 'ai3d_dedupe_datablocks', True),
+        'background_import': getattr(scene, 'ai3d_background_import', False),
+        'background_link': getattr(scene, 'ai3d_background_link', False),
+        'time_sliced_import': getattr(scene, 'ai3d_time_sliced_import', False),
+        'queue_budget_ms': getattr(scene, 'ai3d_queue_budget_ms', 50),
+        'asset_library': getattr(scene, 'ai3d_asset_library', False),
+        'external_storage': getattr(scene, 'ai3d_external_storage', False),
+        'storage_override': getattr(scene, 'ai3d_storage_override', False),
+        'normalize': getattr(scene, 'ai3d_normalize_import', False),
+        'normalize_size': getattr(scene, 'ai3d_normalize_size', 0.0),
+        'normalize_ground': getattr(scene, 'ai3d_normalize_ground', True),
+        'normalize_center': getattr(scene, 'ai3d_normalize_center', True),
+        'normalize_origin': getattr(scene, 'ai3d_normalize_origin', 'NONE'),
+        'record_metrics': getattr(scene, 'ai3d_record_metrics', True),
+        'model_cache': getattr(scene, 'ai3d_model_cache', True),
+        'cache_hot_mb': getattr(scene, 'ai3d_cache_hot_mb', 2048),
+        'cache_codec': getattr(scene, 'ai3d_cache_codec', 'lzma'),
+        'max_downloads': getattr(scene, 'ai3d_max_downloads', 4),
+        'max_downloads_per_host': getattr(scene, 'ai3d_max_downloads_per_host', 2),
+        'bandwidth_limit_mbps': getattr(scene, 'ai3d_bandwidth_limit_mbps', 0.0),
+    }
+
+
+def download_and_import_model(model_url: str, import_type: str, object_name: str,
+                              settings: dict = None, metadata: dict = None):
     """
     Download model dari URL dan import ke Blender scene.
     
@@ -22,40 +95,558 @@ def download_and_import_model(model_url: str, import_type: str, object_name: str
         model_url: URL model file
         import_type: Tipe import (glb, obj, fbx, stl)
         object_name: Nama object di Blender scene
+        settings: Import settings (lihat get_import_settings())
+        metadata: Metadata generation (provider, prompt, style, job_id)
+            untuk asset library
+    
+    Returns:
+        Dict hasil import, lihat import_model_file(). Untuk background import
+        dan time-sliced import hanya berisi 'queued' (dan 'job_id'). Jika
+        model di-link dari asset library hanya berisi 'linked' dan 'collection'.
     """
+    settings = settings or {}
+    metadata = metadata or {}
+    use_library = settings.get('asset_library')
+    
     if not model_url:
         raise ValueError("Model URL is empty")
     
-    # Download model file
-    temp_path = download_model_file(model_url, import_type)
+    # LOD ratio invalid gagal sebelum download, bukan setelah import
+    if settings.get('generate_lods'):
+        parse_lod_ratios(settings.get('lod_ratios', DEFAULT_LOD_RATIOS))
+    
+    # Model sudah ada di asset library: link lokal tanpa download
+    if use_library and metadata.get('job_id'):
+        collection = get_asset_library().link(metadata['job_id'])
+        if collection is not None:
+            print(f"Linked from asset library: {collection.name}")
+            return {'linked': True, 'collection': collection}
     
-    if not temp_path or not os.path.exists(temp_path):
-        raise RuntimeError("Failed to download model file")
+    # Model cache: file hot tier dipakai langsung, cold tier didekompres
+    cache = None
+    temp_path, remove_source = None, True
+    if settings.get('model_cache'):
+        cache = get_model_cache(settings.get('cache_hot_mb'), settings.get('cache_codec'))
+        key = cache_key(model_url, import_type, metadata.get('job_id'))
+        temp_path, remove_source = cache.get(key, acquire=True)
+    
+    if not temp_path:
+        # Download model file lewat scheduler (prioritas, concurrency, bandwidth)
+        temp_path = _scheduled_download(model_url, import_type, settings)
+        
+        if not temp_path or not os.path.exists(temp_path):
+            raise RuntimeError("Failed to download model file")
+        
+        if cache is not None:
+            temp_path, remove_source = cache.put(key, temp_path, acquire=True), False
+    
+    def release_cache():
+        # File hot tier di-acquire supaya tidak diturunkan selama import memakainya
+        if cache is not None and not remove_source:
+            cache.release(key)
+    
+    # Import di proses Blender terpisah; worker menghapus file setelah selesai
+    if settings.get('background_import'):
+        def on_worker_done(job, status):
+            release_cache()
+            _finish_worker_import(job, status)
+        
+        try:
+            job = get_worker_pool().submit(ImportJob(
+                temp_path, import_type, object_name, settings,
+                link=settings.get('background_link', False),
+                remove_source=remove_source,
+                callback=on_worker_done,
+                metadata=metadata,
+            ))
+        except Exception:
+            release_cache()
+            raise
+        print(f"Queued background import: {object_name}")
+        return {'queued': True, 'job_id': job.job_id}
+    
+    # Import di main thread secara bertahap lewat timer queue
+    if settings.get('time_sliced_import'):
+        def on_imported(item, result, error):
+            release_cache()
+            if result:
+                _finish_import(result, object_name, settings, metadata)
+        
+        try:
+            enqueue_import(temp_path, import_type, object_name, settings,
+                           priority=PRIORITY_USER, remove_source=remove_source,
+                           callback=on_imported)
+        except Exception:
+            release_cache()
+            raise
+        print(f"Queued import: {object_name}")
+        return {'queued': True}
     
-    # Import berdasarkan format
     try:
-        if import_type.lower() in ['glb', 'gltf']:
-            _import_gltf(temp_path, object_name)
-        elif import_type.lower() == 'obj':
-            _import_obj(temp_path, object_name)
-        elif import_type.lower() == 'fbx':
-            _import_fbx(temp_path, object_name)
-        elif import_type.lower() == 'stl':
-            _import_stl(temp_path, object_name)
-        else:
-            raise ValueError(f"Unsupported format: {import_type}")
+        result = import_model_file(temp_path, import_type, object_name, settings)
+        return _finish_import(result, object_name, settings, metadata)
     finally:
-        # Cleanup temp file
+        release_cache()
+        # Cleanup temp file (file cache hot tier tetap disimpan)
+        if remove_source:
+            try:
+                os.remove(temp_path)
+            except:
+                pass
+
+
+def _scheduled_download(model_url: str, import_type: str, settings: dict,
+                        priority=None, on_complete=None, wait=True):
+    """Download lewat global DownloadScheduler dengan setting dari settings.
+    
+    Prioritas default diambil dari settings['download_priority']
+    ('interactive', 'batch', 'prefetch'; default interactive).
+    
+    Returns:
+        Path file hasil download, atau DownloadJob jika wait=False
+    """
+    scheduler = get_download_scheduler()
+    scheduler.configure(
+        max_concurrent=settings.get('max_downloads'),
+        max_per_host=settings.get('max_downloads_per_host'),
+        bandwidth_limit=settings.get('bandwidth_limit_mbps', 0.0) * 125_000,
+    )
+    if priority is None:
+        priority = PRIORITY_NAMES.get(settings.get('download_priority'), PRIORITY_INTERACTIVE)
+    job = scheduler.submit(model_url, import_type, priority, on_complete)
+    return job.wait() if wait else job
+
+
+def prefetch_model_file(model_url: str, import_type: str, job_id: str = None,
+                        settings: dict = None):
+    """
+    Download model ke model cache di background dengan prioritas prefetch.
+    
+    Import berikutnya untuk job yang sama memakai file cache tanpa download.
+    
+    Returns:
+        DownloadJob, atau None jika model sudah ada di cache
+    """
+    settings = settings or {}
+    cache = get_model_cache(settings.get('cache_hot_mb'), settings.get('cache_codec'))
+    key = cache_key(model_url, import_type, job_id)
+    if key in cache.index['entries']:
+        return None
+    
+    def on_complete(job):
+        if job.path:
+            cache.put(key, job.path)
+    
+    return _scheduled_download(model_url, import_type, settings, priority=PRIORITY_PREFETCH,
+                               on_complete=on_complete, wait=False)
+
+
+def download_models_batch(models, settings: dict = None) -> list:
+    """
+    Download banyak model dengan prioritas batch lalu import dalam satu pass.
+    
+    Download berjalan paralel lewat scheduler di bawah download interactive.
+    Model yang sudah ada di model cache (mis. hasil prefetch) tidak
+    di-download ulang.
+    
+    Args:
+        models: List dict dengan kunci 'model_url', 'import_type',
+            'object_name', dan opsional 'job_id'
+        settings: Import settings (lihat get_import_settings())
+    
+    Returns:
+        List dict hasil import per model (urutan sama dengan models, kunci
+        'error' jika download atau import gagal)
+    """
+    settings = dict(settings or {}, download_priority='batch')
+    cache = None
+    if settings.get('model_cache'):
+        cache = get_model_cache(settings.get('cache_hot_mb'), settings.get('cache_codec'))
+    
+    # Semua download di-submit dulu supaya berjalan paralel
+    downloads = []
+    for model in models:
+        key = cache_key(model['model_url'], model['import_type'], model.get('job_id'))
+        path, temporary = cache.get(key, acquire=True) if cache is not None else (None, False)
+        job = None
+        if not path:
+            job = _scheduled_download(model['model_url'], model['import_type'], settings, wait=False)
+        downloads.append((key, path, temporary, job))
+    
+    results = [None] * len(models)
+    files, indexes, remove, acquired = [], [], [], []
+    for index, (model, (key, path, temporary, job)) in enumerate(zip(models, downloads)):
+        if job is not None:
+            try:
+                path, temporary = job.wait(), True
+                if cache is not None:
+                    path, temporary = cache.put(key, path, acquire=True), False
+            except Exception as e:
+                print(f"Batch download failed for {model['model_url']}: {str(e)}")
+                results[index] = {'error': str(e), 'objects': []}
+                continue
+        if temporary:
+            remove.append(path)
+        elif cache is not None:
+            acquired.append(key)
+        files.append({
+            'filepath': path,
+            'import_type': model['import_type'],
+            'object_name': model['object_name'],
+        })
+        indexes.append(index)
+    
+    try:
+        for index, result in zip(indexes, import_models_batch(files, settings)):
+            results[index] = result
+    finally:
+        for key in acquired:
+            cache.release(key)
+        for path in remove:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+    return results
+
+
+def _finish_import(result: dict, object_name: str, settings: dict, metadata: dict) -> dict:
+    """Catat metrics, export ke asset library, dan/atau pindahkan ke external storage."""
+    if result.get('metrics') and metadata.get('job_id'):
+        get_history().record_metrics(metadata['job_id'], result['metrics'])
+    
+    if settings.get('asset_library'):
+        get_asset_library().add(result['objects'], object_name, metadata)
+    
+    # Instanced duplicate sudah share mesh dengan model tersimpan sebelumnya
+    if settings.get('external_storage') and not result.get('instanced'):
+        result['storage_path'] = store_model(
+            result['objects'],
+            object_name,
+            result.get('content_hash'),
+            lod_collection=result.get('lod_collection'),
+            override=settings.get('storage_override', False),
+        )
+        result['objects'] = []
+        result['lod_collection'] = None
+    
+    return result
+
+
+def _finish_worker_import(job, status):
+    """Callback worker pool: catat metrics, export ke asset library, dan/atau pindahkan ke external storage."""
+    if not status.get('ok'):
+        return
+    
+    result = status.get('result') or {}
+    if result.get('metrics') and job.metadata.get('job_id'):
+        get_history().record_metrics(job.metadata['job_id'], result['metrics'])
+    
+    collection = bpy.data.collections.get(status['collection'])
+    if collection is None or collection.library is not None:
+        # Hasil yang di-link sudah berada di .blend worker: tidak bisa
+        # ditandai sebagai asset lokal maupun disimpan ulang
+        return
+    
+    if job.settings.get('asset_library'):
+        get_asset_library().add_collection(collection, job.metadata)
+    
+    # Sama dengan _finish_import(): object hasil append dipindah ke .blend sendiri
+    if job.settings.get('external_storage'):
+        store_model(
+            list(collection.objects),
+            job.object_name,
+            result.get('content_hash'),
+            override=job.settings.get('storage_override', False),
+        )
+        if not collection.objects and not collection.children and collection.asset_data is None:
+            bpy.data.collections.remove(collection)
+
+
+def import_models_batch(files, settings: dict = None) -> list:
+    """
+    Import banyak file model yang sudah di-download dalam satu pass.
+    
+    View fitting dan redraw ditunda sampai semua file selesai di-import,
+    dan object baru dilacak lewat diff datablock, sehingga bisa berjalan
+    headless (blender -b) tanpa 3D View.
+    
+    Args:
+        files: List dict dengan kunci 'filepath', 'import_type', 'object_name'
+        settings: Import settings (lihat get_import_settings())
+    
+    Returns:
+        List dict hasil import per file (dengan kunci 'error' jika gagal)
+    """
+    results = []
+    imported_objects = []
+    
+    for item in files:
+        try:
+            result = import_model_file(
+                item['filepath'],
+                item['import_type'],
+                item['object_name'],
+                settings,
+                fit_view=False,
+            )
+            imported_objects.extend(result['objects'])
+        except Exception as e:
+            print(f"Batch import failed for {item['filepath']}: {str(e)}")
+            result = {'error': str(e), 'objects': []}
+        result['filepath'] = item['filepath']
+        results.append(result)
+    
+    # Satu kali view fit dan redraw untuk seluruh batch
+    fit_view_to_objects(imported_objects)
+    
+    print(f"Batch imported {len(imported_objects)} objects from {len(files)} files")
+    return results
+
+
+def import_model_file(filepath: str, import_type: str, object_name: str,
+                      settings: dict = None, fit_view: bool = True) -> dict:
+    """
+    Import satu file model lokal dan jalankan post-processing.
+    
+    Args:
+        filepath: Path ke file model
+        import_type: Tipe import (glb, gltf, obj, fbx, stl, ply)
+        object_name: Nama object di Blender scene
+        settings: Import settings (lihat get_import_settings())
+        fit_view: Fit 3D View ke object baru setelah import
+    
+    Returns:
+        Dict hasil import (profile, warnings, inspection, objects, optimization,
+        lod_collection, textures, content_hash, instanced, dedup, normalize,
+        metrics)
+    """
+    result = run_steps(iter_import_model_file(filepath, import_type, object_name, settings))
+    
+    if fit_view:
+        fit_view_to_objects(result['objects'])
+    
+    return result
+
+
+def run_steps(steps):
+    """Jalankan generator step sampai selesai dan return nilai akhirnya."""
+    while True:
         try:
-            os.remove(temp_path)
-        except:
-            pass
+            next(steps)
+        except StopIteration as stop:
+            return stop.value
+
+
+def iter_import_model_file(filepath: str, import_type: str, object_name: str,
+                           settings: dict = None):
+    """
+    Versi bertahap dari import_model_file() untuk time-sliced import queue.
+    
+    Generator ini yield nama stage setelah setiap tahap (import, normalize,
+    dedup, optimize, textures, metrics) supaya pemanggil bisa berhenti di antara tahap,
+    dan return dict hasil import saat selesai.
+    """
+    settings = settings or {}
+    import_type = import_type.lower()
+    # Point cloud tidak punya face: cleanup/decimate/LOD akan menghapus semua point
+    is_point_cloud = import_type == 'ply'
+    
+    # Validasi LOD ratio sebelum import supaya ValueError tidak meninggalkan
+    # object setengah jadi di scene
+    lod_ratios = None
+    if settings.get('generate_lods') and not is_point_cloud:
+        lod_ratios = parse_lod_ratios(settings.get('lod_ratios', DEFAULT_LOD_RATIOS))
+    
+    result = {
+        'profile': 'standard',
+        'warnings': [],
+        'inspection': None,
+        'objects': [],
+        'optimization': None,
+        'lod_collection': None,
+        'textures': None,
+        'content_hash': file_content_hash(filepath),
+        'instanced': False,
+        'dedup': None,
+        'normalize': None,
+        'metrics': None,
+    }
+    
+    # Model yang sama sudah pernah di-import: share mesh data
+    if settings.get('link_duplicates', True):
+        objects = instance_model(result['content_hash'], object_name)
+        if objects:
+            result['objects'] = objects
+            result['instanced'] = True
+            return result
+    
+    images_before = set(bpy.data.images)
+    materials_before = set(bpy.data.materials)
+    
+    # Import berdasarkan format (tanpa yield: datablock baru diambil sebelum
+    # queue sempat menjalankan import lain di antara stage)
+    if import_type == 'glb':
+        # Inspeksi header sebelum import yang mahal
+        info = inspect_glb(filepath)
+        result['inspection'] = info
+        result['warnings'] = check_glb_budget(
+            info,
+            max_file_mb=settings.get('max_file_mb', 0),
+            max_triangles=settings.get('max_triangles', 0),
+        )
+        result['profile'] = select_import_profile(info)
+        for warning in result['warnings']:
+            print(f"Import warning: {warning}")
+        objects = _import_gltf(filepath, object_name, GLTF_PROFILE_OPTIONS[result['profile']])
+    elif import_type == 'gltf':
+        objects = _import_gltf(filepath, object_name)
+    elif import_type == 'obj':
+        objects = _import_obj(filepath, object_name, fast=settings.get('fast_obj_import', False))
+    elif import_type == 'fbx':
+        objects = _import_fbx(filepath, object_name)
+    elif import_type == 'stl':
+        objects = _import_stl(filepath, object_name)
+    elif import_type == 'ply':
+        objects = import_ply(filepath, object_name, settings.get('point_budget', 0))
+    else:
+        raise ValueError(f"Unsupported format: {import_type}")
+    
+    result['objects'] = objects
+    new_images = [img for img in bpy.data.images if img not in images_before]
+    new_materials = [mat for mat in bpy.data.materials if mat not in materials_before]
+    new_image_pointers = {img.as_pointer() for img in new_images}
+    yield 'import'
+    
+    # Skala, ground alignment, dan origin konsisten antar provider
+    if settings.get('normalize'):
+        result['normalize'] = normalize_objects(
+            objects,
+            target_size=settings.get('normalize_size', 0.0),
+            ground=settings.get('normalize_ground', True),
+            center=settings.get('normalize_center', True),
+            origin=settings.get('normalize_origin', 'NONE'),
+        )
+        yield 'normalize'
+    
+    # Material/image identik dengan import sebelumnya di-remap ke satu datablock
+    if settings.get('dedupe_datablocks', True):
+        result['dedup'] = deduplicate_imported(new_images, new_materials)
+        yield 'dedup'
+    
+    if not is_point_cloud:
+        result['optimization'] = _optimize_imported(objects, settings)
+    register_source(result['content_hash'], objects)
+    yield 'optimize'
+    
+    # Texture pass hanya untuk image yang dibuat oleh import ini
+    if settings.get('texture_max_resolution') or settings.get('texture_vram_budget_mb'):
+        # Image yang dihapus dedup tidak lagi ada di bpy.data
+        new_images = [img for img in bpy.data.images if img.as_pointer() in new_image_pointers]
+        result['textures'] = optimize_textures(
+            new_images,
+            max_resolution=settings.get('texture_max_resolution', 0),
+            vram_budget_mb=settings.get('texture_vram_budget_mb', 0),
+            repack=settings.get('texture_repack', False),
+        )
+        yield 'textures'
+    
+    # Metrics dihitung sebelum LOD supaya hanya model utama yang dinilai
+    if settings.get('record_metrics'):
+        result['metrics'] = compute_metrics(objects)
+        yield 'metrics'
+    
+    if lod_ratios:
+        result['lod_collection'] = generate_lod_chain(objects, lod_ratios, object_name)
+    
+    return result
+
+
+def fit_view_to_objects(objects):
+    """
+    Fit semua 3D View ke object dan tag redraw.
+    
+    Tidak melakukan apa-apa saat headless atau jika tidak ada 3D View,
+    sehingga aman dipanggil dari script background.
+    """
+    if bpy.app.background or not objects:
+        return
+    
+    wm = bpy.context.window_manager
+    if wm is None:
+        return
+    
+    for window in wm.windows:
+        for area in window.screen.areas:
+            if area.type != 'VIEW_3D':
+                continue
+            region = next((r for r in area.regions if r.type == 'WINDOW'), None)
+            if region is None:
+                continue
+            try:
+                if hasattr(bpy.context, 'temp_override'):
+                    with bpy.context.temp_override(window=window, area=area, region=region):
+                        bpy.ops.view3d.view_all()
+                else:
+                    # Blender < 3.2: context override dict
+                    override = {'window': window, 'screen': window.screen,
+                                'area': area, 'region': region}
+                    bpy.ops.view3d.view_all(override)
+            except RuntimeError as e:
+                print(f"View fit skipped: {str(e)}")
+            area.tag_redraw()
+
+
+def _new_objects(objects_before):
+    """Return object yang dibuat sejak snapshot objects_before."""
+    return [obj for obj in bpy.data.objects if obj not in objects_before]
+
+
+def _operator_exists(module: str, name: str) -> bool:
+    """Cek apakah operator bpy.ops.<module>.<name> tersedia di versi Blender ini."""
+    return name in dir(getattr(bpy.ops, module))
+
+
+def _rename_main_object(objects, object_name: str, types):
+    """Rename object pertama dengan tipe yang cocok ke object_name."""
+    for obj in objects:
+        if obj.type in types:
+            obj.name = object_name
+            break
+
+
+def _optimize_imported(objects, settings: dict):
+    """
+    Jalankan mesh optimization untuk object hasil import.
+    
+    Cleanup (merge/degenerate/loose) dan decimate ke triangle budget
+    bersifat destruktif, jadi hanya dijalankan jika optimize_mesh aktif.
+    Profile 'heavy' dari inspeksi GLB hanya memengaruhi opsi importer.
+    """
+    if not settings.get('optimize_mesh'):
+        return None
+    
+    budget = settings.get('triangle_budget') or quality_to_triangle_budget(
+        settings.get('quality', 7)
+    )
+    return optimize_meshes(objects, triangle_budget=budget)
 
 
-def download_model_file(model_url: str, file_type: str = None) -> str:
+def download_model_file(model_url: str, file_type: str = None, chunk_hook=None,
+                        resume_from: str = None) -> str:
     """
     Download model file dari URL ke temp folder.
     
+    Biasanya dipanggil lewat DownloadScheduler (lihat download_scheduler.py).
+    
+    Args:
+        model_url: URL model file
+        file_type: Format file untuk ekstensi (default: tebak dari URL)
+        chunk_hook: Dipanggil dengan ukuran setiap chunk (throttle/pause)
+        resume_from: File parsial dari download yang terputus; dilanjutkan
+            dengan Range request jika server mendukung (206), jika tidak
+            download diulang dari awal
+    
     Returns:
         Path ke file yang di-download
     """
@@ -73,21 +664,41 @@ def download_model_file(model_url: str, file_type: str = None) -> str:
                 ext = ".fbx"
             elif ".stl" in model_url:
                 ext = ".stl"
+            elif ".ply" in model_url:
+                ext = ".ply"
             else:
                 ext = ".glb"  # default
         
+        headers = {}
+        offset = os.path.getsize(resume_from) if resume_from and os.path.exists(resume_from) else 0
+        if offset:
+            headers['Range'] = f"bytes={offset}-"
+        
         # Download file
-        response = requests.get(model_url, timeout=300, stream=True)
+        response = requests.get(model_url, timeout=300, stream=True, headers=headers)
         response.raise_for_status()
         
-        # Save to temp file
-        temp_dir = tempfile.gettempdir()
-        temp_file = os.path.join(temp_dir, f"ai3d_model_{id(model_url)}{ext}")
+        if offset and response.status_code == 206:
+            temp_file = resume_from
+            f = open(temp_file, 'ab')
+        else:
+            if resume_from and os.path.exists(resume_from):
+                os.remove(resume_from)
+            # Save to temp file (nama unik, beberapa download bisa berjalan bersamaan)
+            fd, temp_file = tempfile.mkstemp(prefix="ai3d_model_", suffix=ext)
+            f = os.fdopen(fd, 'wb')
         
-        with open(temp_file, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    f.write(chunk)
+        # Menutup response melepas socket, termasuk saat pause terlalu lama
+        with response, f:
+            try:
+                for chunk in response.iter_content(chunk_size=8192):
+                    if chunk:
+                        if chunk_hook:
+                            chunk_hook(len(chunk))
+                        f.write(chunk)
+            except DownloadPaused as e:
+                e.partial_path = temp_file
+                raise
         
         print(f"Model downloaded to: {temp_file}")
         return temp_file
@@ -95,57 +706,58 @@ def download_model_file(model_url: str, file_type: str = None) -> str:
     except requests.exceptions.RequestException as e:
         print(f"Download error: {str(e)}")
         raise
+    except DownloadPaused:
+        raise
     except Exception as e:
         print(f"Error downloading model: {str(e)}")
         raise
 
 
-def _import_gltf(filepath: str, object_name: str):
+def _import_gltf(filepath: str, object_name: str, options: dict = None):
     """Import GLTF/GLB file ke Blender."""
     try:
-        # Clear selection
-        bpy.ops.object.select_all(action='DESELECT')
+        objects_before = set(bpy.data.objects)
         
         # Import model
-        bpy.ops.import_scene.gltf(filepath=filepath)
+        bpy.ops.import_scene.gltf(filepath=filepath, **(options or {}))
         
         # Rename imported objects
         # Biasanya GLTF import mengimpor dengan nama default
-        # Cari object yang baru di-select
-        for obj in bpy.context.selected_objects:
-            if obj.type in ['MESH', 'ARMATURE']:
-                obj.name = object_name
-                break
-        
-        # Center view pada object
-        bpy.ops.view3d.view_all()
+        imported = _new_objects(objects_before)
+        _rename_main_object(imported, object_name, ('MESH', 'ARMATURE'))
         
         print(f"Imported GLTF/GLB as: {object_name}")
+        return imported
     
     except Exception as e:
         print(f"GLTF import error: {str(e)}")
         raise
 
 
-def _import_obj(filepath: str, object_name: str):
+def _import_obj(filepath: str, object_name: str, fast: bool = False):
     """Import OBJ file ke Blender."""
     try:
-        # Clear selection
-        bpy.ops.object.select_all(action='DESELECT')
+        # Fast path NumPy jika diminta atau tidak ada operator OBJ
+        if fast or not (_operator_exists('wm', 'obj_import')
+                        or _operator_exists('import_scene', 'obj')):
+            imported = import_obj_fast(filepath, object_name)
+            print(f"Imported OBJ (fast path) as: {object_name}")
+            return imported
         
-        # Import model
-        bpy.ops.import_scene.obj(filepath=filepath)
+        objects_before = set(bpy.data.objects)
         
-        # Rename imported object
-        for obj in bpy.context.selected_objects:
-            if obj.type == 'MESH':
-                obj.name = object_name
-                break
+        # Import model (Blender 4.0+ hanya punya importer wm.obj_import)
+        if _operator_exists('wm', 'obj_import'):
+            bpy.ops.wm.obj_import(filepath=filepath)
+        else:
+            bpy.ops.import_scene.obj(filepath=filepath)
         
-        # Center view pada object
-        bpy.ops.view3d.view_all()
+        # Rename imported object
+        imported = _new_objects(objects_before)
+        _rename_main_object(imported, object_name, ('MESH',))
         
         print(f"Imported OBJ as: {object_name}")
+        return imported
     
     except Exception as e:
         print(f"OBJ import error: {str(e)}")
@@ -155,22 +767,17 @@ def _import_obj(filepath: str, object_name: str):
 def _import_fbx(filepath: str, object_name: str):
     """Import FBX file ke Blender."""
     try:
-        # Clear selection
-        bpy.ops.object.select_all(action='DESELECT')
+        objects_before = set(bpy.data.objects)
         
         # Import model
         bpy.ops.import_scene.fbx(filepath=filepath)
         
         # Rename imported object
-        for obj in bpy.context.selected_objects:
-            if obj.type in ['MESH', 'ARMATURE']:
-                obj.name = object_name
-                break
-        
-        # Center view pada object
-        bpy.ops.view3d.view_all()
+        imported = _new_objects(objects_before)
+        _rename_main_object(imported, object_name, ('MESH', 'ARMATURE'))
         
         print(f"Imported FBX as: {object_name}")
+        return imported
     
     except Exception as e:
         print(f"FBX import error: {str(e)}")
@@ -178,24 +785,13 @@ def _import_fbx(filepath: str, object_name: str):
 
 
 def _import_stl(filepath: str, object_name: str):
-    """Import STL file ke Blender."""
+    """Import STL file ke Blender lewat fast path NumPy."""
     try:
-        # Clear selection
-        bpy.ops.object.select_all(action='DESELECT')
-        
-        # Import model
-        bpy.ops.import_mesh.stl(filepath=filepath)
-        
-        # Rename imported object
-        for obj in bpy.context.selected_objects:
-            if obj.type == 'MESH':
-                obj.name = object_name
-                break
-        
-        # Center view pada object
-        bpy.ops.view3d.view_all()
+        # STL tidak punya material, jadi fast path tidak kehilangan data
+        imported = import_stl_fast(filepath, object_name)
         
         print(f"Imported STL as: {object_name}")
+        return imported
     
     except Exception as e:
         print(f"STL import error: {str(e)}")
@@ -0,0 +1,222 @@
+"""
+Fast Mesh IO
+
+Addon ini hanya bertindak sebagai client untuk layanan AI 3D pihak ketiga.
+User harus mendaftar dan menyediakan API key sendiri.
+
+Fast path import STL/OBJ tanpa operator Blender.
+Binary STL di-memory-map langsung ke NumPy array, OBJ dibaca secara
+streaming, vertex duplikat di-weld secara vectorized, lalu mesh dibangun
+sekaligus dengan foreach_set. Berjalan headless dan tidak bergantung pada
+operator import legacy yang sudah dihapus di Blender versi baru.
+"""
+
+import bpy
+import mmap
+import os
+import re
+
+import numpy as np
+
+
+STL_HEADER_SIZE = 84
+STL_TRIANGLE_DTYPE = np.dtype([
+    ('normal', '<f4', (3,)),
+    ('vertices', '<f4', (3, 3)),
+    ('attribute', '<u2'),
+])
+
+_ASCII_VERTEX = re.compile(rb'vertex\s+(\S+)\s+(\S+)\s+(\S+)')
+
+
+def read_stl(filepath: str):
+    """
+    Baca file STL (binary atau ASCII).
+
+    Returns:
+        Tuple (vertices, faces) dengan vertices float32 (N, 3) sudah di-weld
+        dan faces int32 (M, 3)
+    """
+    file_size = os.path.getsize(filepath)
+
+    with open(filepath, 'rb') as f:
+        header = f.read(STL_HEADER_SIZE)
+        triangle_count = int.from_bytes(header[80:84], 'little') if len(header) == 84 else -1
+
+        if triangle_count >= 0 and file_size == STL_HEADER_SIZE + triangle_count * STL_TRIANGLE_DTYPE.itemsize:
+            if triangle_count == 0:
+                return np.empty((0, 3), np.float32), np.empty((0, 3), np.int32)
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                triangles = np.frombuffer(
+                    mm, dtype=STL_TRIANGLE_DTYPE, count=triangle_count, offset=STL_HEADER_SIZE
+                )
+                # Copy keluar dari mmap sebelum mmap ditutup
+                corners = triangles['vertices'].reshape(-1, 3).copy()
+                del triangles
+        else:
+            f.seek(0)
+            values = _ASCII_VERTEX.findall(f.read())
+            corners = np.array(values, dtype=np.float32).reshape(-1, 3)
+
+    return weld_vertices(corners, np.arange(len(corners), dtype=np.int32).reshape(-1, 3))
+
+
+def read_obj(filepath: str):
+    """
+    Baca file OBJ secara streaming (posisi, face n-gon, dan UV).
+
+    Returns:
+        Dict dengan kunci:
+            - vertices: float32 (N, 3)
+            - loop_vertices: int32 vertex index per loop
+            - loop_totals: int32 jumlah loop per face
+            - loop_uvs: float32 (L, 2) atau None jika tidak ada UV
+    """
+    positions = []
+    uvs = []
+    loop_vertices = []
+    loop_uv_indices = []
+    loop_totals = []
+    vertex_count = 0
+    uv_count = 0
+
+    with open(filepath, 'rb') as f:
+        for line in f:
+            if line.startswith(b'v '):
+                positions.extend(line.split()[1:4])
+                vertex_count += 1
+            elif line.startswith(b'vt '):
+                uvs.extend(line.split()[1:3])
+                uv_count += 1
+            elif line.startswith(b'f '):
+                corners = line.split()[1:]
+                loop_totals.append(len(corners))
+                for corner in corners:
+                    refs = corner.split(b'/')
+                    index = int(refs[0])
+                    # Index negatif relatif terhadap vertex terakhir
+                    loop_vertices.append(index - 1 if index > 0 else vertex_count + index)
+                    if len(refs) > 1 and refs[1]:
+                        uv_index = int(refs[1])
+                        loop_uv_indices.append(uv_index - 1 if uv_index > 0 else uv_count + uv_index)
+                    else:
+                        loop_uv_indices.append(-1)
+
+    vertices = np.array(positions, dtype=np.float32).reshape(-1, 3)
+    loop_vertices = np.array(loop_vertices, dtype=np.int32)
+    loop_totals = np.array(loop_totals, dtype=np.int32)
+
+    loop_uvs = None
+    loop_uv_indices = np.array(loop_uv_indices, dtype=np.int32)
+    if uvs and len(loop_uv_indices) and (loop_uv_indices >= 0).all():
+        uv_table = np.array(uvs, dtype=np.float32).reshape(-1, 2)
+        loop_uvs = uv_table[loop_uv_indices]
+
+    # OBJ memakai Y-up, Blender Z-up (sama dengan default importer OBJ)
+    vertices = vertices[:, [0, 2, 1]] * np.array([1.0, -1.0, 1.0], dtype=np.float32)
+
+    vertices, loop_vertices = weld_vertices(vertices, loop_vertices)
+
+    return {
+        'vertices': vertices,
+        'loop_vertices': loop_vertices,
+        'loop_totals': loop_totals,
+        'loop_uvs': loop_uvs,
+    }
+
+
+def weld_vertices(vertices, indices):
+    """
+    Weld vertex dengan posisi identik secara vectorized.
+
+    Args:
+        vertices: float32 (N, 3)
+        indices: Array index ke vertices (bentuk bebas)
+
+    Returns:
+        Tuple (unique_vertices, remapped_indices) dengan bentuk indices sama
+    """
+    if len(vertices) == 0:
+        return vertices, indices
+
+    # + 0.0 menormalkan -0.0 menjadi 0.0 supaya byte-nya identik
+    vertices = np.ascontiguousarray(vertices + np.float32(0.0), dtype=np.float32)
+    keys = vertices.view(np.dtype((np.void, vertices.dtype.itemsize * 3))).ravel()
+    _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+
+    return vertices[first], inverse.astype(np.int32).ravel()[indices]
+
+
+def build_mesh(name: str, vertices, loop_vertices, loop_totals, loop_uvs=None):
+    """
+    Bangun mesh datablock secara bulk dengan foreach_set.
+
+    Returns:
+        bpy.types.Mesh
+    """
+    mesh = bpy.data.meshes.new(name)
+
+    loop_starts = np.zeros(len(loop_totals), dtype=np.int32)
+    if len(loop_totals) > 1:
+        np.cumsum(loop_totals[:-1], out=loop_starts[1:])
+
+    mesh.vertices.add(len(vertices))
+    mesh.vertices.foreach_set('co', vertices.ravel())
+
+    mesh.loops.add(len(loop_vertices))
+    mesh.loops.foreach_set('vertex_index', loop_vertices)
+
+    mesh.polygons.add(len(loop_totals))
+    mesh.polygons.foreach_set('loop_start', loop_starts)
+    try:
+        mesh.polygons.foreach_set('loop_total', loop_totals)
+    except (AttributeError, TypeError):
+        # Blender 4.0+: loop_total read-only, dihitung dari loop_start
+        pass
+
+    if loop_uvs is not None:
+        uv_layer = mesh.uv_layers.new(name='UVMap')
+        uv_layer.data.foreach_set('uv', loop_uvs.ravel())
+
+    mesh.update(calc_edges=True)
+    mesh.validate()
+    return mesh
+
+
+def _link_new_object(name: str, mesh):
+    """Buat object untuk mesh dan link ke collection aktif."""
+    obj = bpy.data.objects.new(name, mesh)
+    collection = bpy.context.collection or bpy.context.scene.collection
+    collection.objects.link(obj)
+    return obj
+
+
+def import_stl_fast(filepath: str, object_name: str):
+    """
+    Import STL lewat fast path NumPy.
+
+    Returns:
+        List berisi object yang dibuat
+    """
+    vertices, faces = read_stl(filepath)
+    loop_totals = np.full(len(faces), 3, dtype=np.int32)
+    mesh = build_mesh(object_name, vertices, faces.ravel(), loop_totals)
+    return [_link_new_object(object_name, mesh)]
+
+
+def import_obj_fast(filepath: str, object_name: str):
+    """
+    Import OBJ lewat fast path NumPy (geometry dan UV, tanpa material).
+
+    Returns:
+        List berisi object yang dibuat
+    """
+    data = read_obj(filepath)
+    mesh = build_mesh(
+        object_name,
+        data['vertices'],
+        data['loop_vertices'],
+        data['loop_totals'],
+        data['loop_uvs'],
+    )
+    return [_link_new_object(object_name, mesh)]
@@ -0,0 +1,273 @@
+"""
+GLB Inspector
+
+Addon ini hanya bertindak sebagai client untuk layanan AI 3D pihak ketiga.
+User harus mendaftar dan menyediakan API key sendiri.
+
+Inspeksi cepat file GLB sebelum di-import ke Blender.
+File di-memory-map dan hanya header + JSON chunk yang di-parse, sehingga
+ukuran mesh, accessor dan texture bisa diketahui tanpa decode geometry.
+"""
+
+import json
+import mmap
+import os
+import struct
+
+
+GLB_MAGIC = 0x46546C67  # 'glTF'
+CHUNK_JSON = 0x4E4F534A  # 'JSON'
+CHUNK_BIN = 0x004E4942  # 'BIN\0'
+
+# Ukuran byte per component type glTF
+COMPONENT_SIZES = {
+    5120: 1,  # BYTE
+    5121: 1,  # UNSIGNED_BYTE
+    5122: 2,  # SHORT
+    5123: 2,  # UNSIGNED_SHORT
+    5125: 4,  # UNSIGNED_INT
+    5126: 4,  # FLOAT
+}
+
+# Jumlah component per accessor type glTF
+TYPE_COMPONENTS = {
+    'SCALAR': 1,
+    'VEC2': 2,
+    'VEC3': 3,
+    'VEC4': 4,
+    'MAT2': 4,
+    'MAT3': 9,
+    'MAT4': 16,
+}
+
+# Default budget untuk memilih import profile
+PROFILE_HEAVY_TRIANGLES = 500_000
+PROFILE_HEAVY_TEXTURE_PIXELS = 4096 * 4096
+PROFILE_LIGHT_TRIANGLES = 50_000
+
+
+def inspect_glb(filepath: str) -> dict:
+    """
+    Inspeksi file GLB tanpa decode geometry.
+
+    Args:
+        filepath: Path ke file .glb
+
+    Returns:
+        Dict dengan kunci:
+            - file_size: Ukuran file (bytes)
+            - mesh_count: Jumlah mesh
+            - primitive_count: Jumlah primitive
+            - vertex_count: Total vertex (dari accessor POSITION)
+            - triangle_count: Estimasi total triangle
+            - accessor_bytes: Total ukuran data accessor
+            - buffer_bytes: Total byteLength semua buffer
+            - image_count: Jumlah image
+            - image_bytes: Total ukuran image yang di-embed
+            - textures: List dict (name, mime_type, width, height, bytes)
+            - extensions: Extension yang digunakan (mis. Draco/meshopt)
+
+    Raises:
+        ValueError: Jika file bukan GLB yang valid
+    """
+    file_size = os.path.getsize(filepath)
+    if file_size < 20:
+        raise ValueError(f"File too small to be a GLB: {filepath}")
+
+    with open(filepath, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            magic, version, length = struct.unpack_from('<III', mm, 0)
+            if magic != GLB_MAGIC:
+                raise ValueError(f"Not a GLB file: {filepath}")
+            if version != 2:
+                raise ValueError(f"Unsupported GLB version: {version}")
+
+            # Chunk pertama harus JSON
+            json_length, json_type = struct.unpack_from('<II', mm, 12)
+            if json_type != CHUNK_JSON or 20 + json_length > file_size:
+                raise ValueError(f"Invalid GLB JSON chunk: {filepath}")
+            gltf = json.loads(mm[20:20 + json_length])
+
+            # Offset data BIN chunk (jika ada), untuk membaca header image
+            bin_offset = None
+            next_chunk = 20 + json_length
+            if next_chunk + 8 <= file_size:
+                bin_length, bin_type = struct.unpack_from('<II', mm, next_chunk)
+                if bin_type == CHUNK_BIN:
+                    bin_offset = next_chunk + 8
+
+            textures = _inspect_images(gltf, mm, bin_offset)
+
+    accessors = gltf.get('accessors', [])
+    meshes = gltf.get('meshes', [])
+
+    primitive_count = 0
+    vertex_count = 0
+    triangle_count = 0
+    counted_positions = set()
+
+    for mesh in meshes:
+        for prim in mesh.get('primitives', []):
+            primitive_count += 1
+            position_index = prim.get('attributes', {}).get('POSITION')
+            position_count = 0
+            if position_index is not None and position_index < len(accessors):
+                position_count = accessors[position_index].get('count', 0)
+                # Accessor yang di-share antar primitive hanya dihitung sekali
+                if position_index not in counted_positions:
+                    counted_positions.add(position_index)
+                    vertex_count += position_count
+
+            # Mode 4 (TRIANGLES) adalah default glTF
+            if prim.get('mode', 4) != 4:
+                continue
+            indices_index = prim.get('indices')
+            if indices_index is not None and indices_index < len(accessors):
+                triangle_count += accessors[indices_index].get('count', 0) // 3
+            else:
+                triangle_count += position_count // 3
+
+    accessor_bytes = 0
+    for accessor in accessors:
+        component_size = COMPONENT_SIZES.get(accessor.get('componentType'), 4)
+        components = TYPE_COMPONENTS.get(accessor.get('type'), 1)
+        accessor_bytes += accessor.get('count', 0) * component_size * components
+
+    buffer_bytes = sum(b.get('byteLength', 0) for b in gltf.get('buffers', []))
+
+    return {
+        'file_size': file_size,
+        'mesh_count': len(meshes),
+        'primitive_count': primitive_count,
+        'vertex_count': vertex_count,
+        'triangle_count': triangle_count,
+        'accessor_bytes': accessor_bytes,
+        'buffer_bytes': buffer_bytes,
+        'image_count': len(gltf.get('images', [])),
+        'image_bytes': sum(t['bytes'] for t in textures),
+        'textures': textures,
+        'extensions': gltf.get('extensionsUsed', []),
+    }
+
+
+def _inspect_images(gltf: dict, mm, bin_offset) -> list:
+    """Baca dimensi image yang di-embed dari header PNG/JPEG saja."""
+    buffer_views = gltf.get('bufferViews', [])
+    textures = []
+
+    for index, image in enumerate(gltf.get('images', [])):
+        info = {
+            'name': image.get('name', f"image_{index}"),
+            'mime_type': image.get('mimeType', ''),
+            'width': 0,
+            'height': 0,
+            'bytes': 0,
+        }
+
+        view_index = image.get('bufferView')
+        if view_index is not None and view_index < len(buffer_views) and bin_offset is not None:
+            view = buffer_views[view_index]
+            # Hanya buffer 0 (BIN chunk) yang ada di dalam file GLB
+            if view.get('buffer', 0) == 0:
+                start = bin_offset + view.get('byteOffset', 0)
+                length = view.get('byteLength', 0)
+                info['bytes'] = length
+                width, height = _read_image_size(mm, start, min(length, len(mm) - start))
+                info['width'] = width
+                info['height'] = height
+
+        textures.append(info)
+
+    return textures
+
+
+def _read_image_size(mm, start: int, length: int) -> tuple:
+    """Baca width/height dari header PNG atau JPEG tanpa decode pixel."""
+    if length < 24:
+        return 0, 0
+
+    # PNG: signature 8 byte, lalu IHDR chunk dengan width/height big-endian
+    if mm[start:start + 8] == b'\x89PNG\r\n\x1a\n':
+        width, height = struct.unpack_from('>II', mm, start + 16)
+        return width, height
+
+    # JPEG: cari marker SOFn yang menyimpan dimensi
+    if mm[start:start + 2] == b'\xff\xd8':
+        pos = start + 2
+        end = start + length
+        while pos + 9 <= end:
+            if mm[pos] != 0xFF:
+                pos += 1
+                continue
+            marker = mm[pos + 1]
+            if marker in (0xD8, 0x01) or 0xD0 <= marker <= 0xD7 or marker == 0xFF:
+                pos += 1 if marker == 0xFF else 2
+                continue
+            segment_length = struct.unpack_from('>H', mm, pos + 2)[0]
+            if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+                height, width = struct.unpack_from('>HH', mm, pos + 5)
+                return width, height
+            pos += 2 + segment_length
+
+    return 0, 0
+
+
+def select_import_profile(info: dict) -> str:
+    """
+    Pilih optimization profile berdasarkan hasil inspeksi.
+
+    Returns:
+        'light', 'standard', atau 'heavy'
+    """
+    max_pixels = max((t['width'] * t['height'] for t in info['textures']), default=0)
+
+    if (info['triangle_count'] >= PROFILE_HEAVY_TRIANGLES
+            or max_pixels >= PROFILE_HEAVY_TEXTURE_PIXELS):
+        return 'heavy'
+    if info['triangle_count'] <= PROFILE_LIGHT_TRIANGLES:
+        return 'light'
+    return 'standard'
+
+
+def check_glb_budget(info: dict, max_file_mb: int = 0, max_triangles: int = 0) -> list:
+    """
+    Cek hasil inspeksi terhadap budget import.
+
+    Args:
+        info: Hasil dari inspect_glb()
+        max_file_mb: Batas ukuran file dalam MB (0 = tanpa batas)
+        max_triangles: Batas jumlah triangle (0 = tanpa batas)
+
+    Returns:
+        List pesan warning (kosong jika masih di bawah setengah budget)
+
+    Raises:
+        RuntimeError: Jika file melebihi budget
+    """
+    warnings = []
+    size_mb = info['file_size'] / (1024 * 1024)
+
+    if max_file_mb:
+        if size_mb > max_file_mb:
+            raise RuntimeError(
+                f"Model file is {size_mb:.1f} MB, over the import budget of {max_file_mb} MB"
+            )
+        if size_mb > max_file_mb / 2:
+            warnings.append(f"Model file is large: {size_mb:.1f} MB")
+
+    if max_triangles:
+        if info['triangle_count'] > max_triangles:
+            raise RuntimeError(
+                f"Model has {info['triangle_count']:,} triangles, "
+                f"over the import budget of {max_triangles:,}"
+            )
+        if info['triangle_count'] > max_triangles / 2:
+            warnings.append(f"Model is dense: {info['triangle_count']:,} triangles")
+
+    for texture in info['textures']:
+        if texture['width'] * texture['height'] >= PROFILE_HEAVY_TEXTURE_PIXELS:
+            warnings.append(
+                f"Texture '{texture['name']}' is {texture['width']}x{texture['height']}"
+            )
+
+    return warnings
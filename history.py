@@ -2,15 +2,158 @@
 History Management untuk AI 3D Generator
 
 Menyimpan dan mengelola history dari semua generation yang telah dilakukan.
-History disimpan dalam JSON file di folder user Blender.
+History disimpan di folder user Blender sebagai snapshot JSON plus journal
+JSONL append-only, atau di database SQLite (lihat history_sqlite.py) sesuai
+pilihan di addon preferences.
+
+Setiap perubahan ditulis sebagai satu record di journal (O(1) append).
+Journal dipadatkan ke snapshot secara berkala di background thread; saat
+load, snapshot dibaca lalu sisa journal di-replay.
+
+Beberapa proses Blender bisa berbagi history yang sama: append journal
+dan alokasi ID memakai file lock, dan record dari proses lain dibaca dari
+posisi terakhir di journal (cek signature file, tanpa load ulang penuh).
 """
 
 import bpy
+import heapq
 import json
 import os
-from datetime import datetime
+import re
+import threading
+from datetime import datetime, timedelta
 from pathlib import Path
 
+from .persistence import atomic_write, file_lock, file_signature
+
+
+# Jumlah record journal sebelum compaction ke snapshot
+COMPACT_THRESHOLD = 1000
+
+# Default retention policy (0 = tanpa batas, retention mati); diaktifkan di addon preferences
+DEFAULT_RETENTION_DAYS = 0
+DEFAULT_RETENTION_COUNT = 0
+
+# Field yang bisa dipakai untuk sorting di query()
+SORT_FIELDS = ('id', 'timestamp', 'quality', 'provider', 'status')
+
+# Jumlah entry per halaman default di query()
+DEFAULT_PAGE_SIZE = 50
+
+# Field yang di-index (value default sama dengan get_statistics() lama)
+INDEXED_FIELDS = {
+    'provider': 'Unknown',
+    'type': 'unknown',
+    'status': 'unknown',
+    'style': 'unknown',
+}
+
+
+def tokenize_prompt(text):
+    """Pecah prompt menjadi token lowercase unik untuk full-text search."""
+    if not text:
+        return set()
+    return set(re.findall(r'\w+', str(text).lower()))
+
+
+def _sort_key(gen, sort):
+    """Key sorting + cursor untuk query(); None diurutkan paling awal."""
+    value = gen.get(sort)
+    if value is None:
+        return (0, '', gen['id'])
+    return (1, value, gen['id'])
+
+
+def encode_cursor(key):
+    """Encode key sorting entry terakhir halaman menjadi cursor string."""
+    return json.dumps(list(key))
+
+
+def decode_cursor(cursor):
+    """Decode cursor dari encode_cursor() menjadi tuple key."""
+    return tuple(json.loads(cursor))
+
+
+def _date_bound(value):
+    """Normalisasi batas tanggal (datetime atau ISO string) ke ISO string."""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def _matches(gen, quality=None, since=None, until=None, **fields):
+    """Cek entry terhadap filter exact, quality, dan rentang tanggal."""
+    for field, value in fields.items():
+        if value is not None and gen.get(field, INDEXED_FIELDS.get(field)) != value:
+            return False
+    timestamp = gen.get('timestamp', '')
+    return ((quality is None or gen.get('quality') == quality)
+            and (not since or timestamp >= since)
+            and (not until or timestamp <= until))
+
+
+def paginate(matches, sort, descending, limit, cursor):
+    """Ambil satu halaman setelah cursor (format hasil query()).
+    
+    Match tidak diurutkan seluruhnya: entry setelah cursor disaring lalu
+    hanya limit + 1 teratas dipilih lewat heap, jadi biaya per halaman
+    O(n log limit), bukan O(n log n).
+    """
+    keyed = ((_sort_key(g, sort), g) for g in matches)
+    if cursor:
+        after = decode_cursor(cursor)
+        keyed = (item for item in keyed
+                 if (item[0] < after if descending else item[0] > after))
+    
+    select = heapq.nlargest if descending else heapq.nsmallest
+    page = select(limit + 1, keyed, key=lambda item: item[0])
+    return {
+        'items': [g for _, g in page[:limit]],
+        'next_cursor': encode_cursor(page[limit - 1][0]) if len(page) > limit else None,
+        'total': len(matches),
+    }
+
+
+def _apply_record(data, record):
+    """Terapkan satu record journal ke data history.
+    
+    Semua operasi idempotent terhadap snapshot yang lebih baru, sehingga
+    journal yang sudah dipadatkan aman di-replay ulang setelah crash.
+    
+    Returns:
+        Entry yang terpengaruh (add/update), atau None
+    """
+    op = record.get('op')
+    generations = data['generations']
+    
+    if op == 'add':
+        entry = record['entry']
+        # Entry baru selalu punya id > total_count; scan hanya saat replay
+        if entry['id'] <= data['total_count'] and any(g['id'] == entry['id'] for g in generations):
+            return None
+        generations.append(entry)
+        data['total_count'] = max(data['total_count'], entry['id'])
+        return entry
+    if op == 'update':
+        for gen in generations:
+            if gen['job_id'] == record['job_id']:
+                gen.update(record['fields'])
+                return gen
+        return None
+    if op == 'delete':
+        data['generations'] = [g for g in generations if g['job_id'] != record['job_id']]
+        return None
+    if op == 'archive':
+        archived = set(record['ids'])
+        data['generations'] = [g for g in generations if g['id'] not in archived]
+        return None
+    if op == 'clear':
+        data['generations'] = []
+        data['total_count'] = 0
+    return None
+
 
 class GenerationHistory:
     """Manage generation history dengan persistent storage."""
@@ -18,7 +161,19 @@ class GenerationHistory:
     def __init__(self):
         """Initialize history manager."""
         self.history_file = self._get_history_file()
-        self.history_data = self._load_history()
+        self.journal_file, self.compacting_file = self._get_journal_files()
+        self._lock = threading.RLock()
+        self._compaction = None
+        self._journal_records = 0
+        self._journal_pos = (None, 0)
+        self._snapshot_signature = None
+        self._compacting_signature = None
+        with file_lock(self.journal_file), file_lock(self.compacting_file):
+            self.history_data = self._load_history()
+        self._rebuild_indexes()
+        self.archive = self._open_archive()
+        if self._journal_records >= COMPACT_THRESHOLD:
+            self.compact()
     
     def _get_history_file(self):
         """Get path ke history file."""
@@ -26,42 +181,289 @@ class GenerationHistory:
         config_dir.mkdir(parents=True, exist_ok=True)
         return config_dir / 'generation_history.json'
     
+    def _open_archive(self):
+        """Buka arsip segment history (history_archive/ di samping history file)."""
+        from .history_archive import HistoryArchive
+        return HistoryArchive(self.history_file.with_name('history_archive'))
+    
+    def _get_journal_files(self):
+        """Get path journal aktif dan journal yang sedang dipadatkan."""
+        return (
+            self.history_file.with_suffix('.journal.jsonl'),
+            self.history_file.with_suffix('.compacting.jsonl'),
+        )
+    
+    def _read_journal(self, path, offset=0):
+        """Baca record journal mulai dari offset byte.
+        
+        Returns:
+            Tuple (records, offset setelah baris lengkap terakhir, inode file)
+        
+        Raises:
+            FileNotFoundError jika file hilang (di-rotate/dihapus proses lain)
+        """
+        records = []
+        with open(path, 'rb') as f:
+            inode = os.fstat(f.fileno()).st_ino
+            f.seek(offset)
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    # Baris terakhir terpotong (crash, atau proses lain sedang menulis)
+                    break
+                offset += len(line)
+        return records, offset, inode
+    
     def _load_history(self):
-        """Load history dari file."""
-        if self.history_file.exists():
+        """Load snapshot history lalu replay journal yang belum dipadatkan.
+        
+        Pemanggil memegang file lock journal dan compacting supaya snapshot,
+        file compacting, dan journal dibaca sebagai satu keadaan yang konsisten.
+        """
+        self._snapshot_signature = file_signature(self.history_file)
+        self._compacting_signature = file_signature(self.compacting_file)
+        data = {'generations': [], 'total_count': 0}
+        try:
+            with open(self.history_file, 'r') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Error loading history: {str(e)}")
+        
+        self._journal_records = 0
+        self._journal_pos = (None, 0)
+        for path in (self.compacting_file, self.journal_file):
             try:
-                with open(self.history_file, 'r') as f:
-                    return json.load(f)
-            except Exception as e:
-                print(f"Error loading history: {str(e)}")
-                return {'generations': [], 'total_count': 0}
-        return {'generations': [], 'total_count': 0}
+                records, offset, inode = self._read_journal(path)
+            except FileNotFoundError:
+                continue
+            for record in records:
+                _apply_record(data, record)
+            self._journal_records += len(records)
+            if path == self.journal_file:
+                self._journal_pos = (inode, offset)
+        return data
+    
+    def _journal_changed(self):
+        """Cek apakah proses lain mengubah history.
+        
+        Returns:
+            'full' (snapshot/journal di-rotate, load ulang), 'tail' (ada
+            record baru di journal), atau None
+        """
+        if (file_signature(self.history_file) != self._snapshot_signature
+                or file_signature(self.compacting_file) != self._compacting_signature):
+            return 'full'
+        signature = file_signature(self.journal_file)
+        inode, offset = self._journal_pos
+        if signature is None:
+            return 'full' if offset else None
+        if (inode is not None and signature[2] != inode) or signature[1] < offset:
+            return 'full'
+        return 'tail' if signature[1] > offset else None
+    
+    def _sync(self):
+        """Terapkan perubahan proses lain (dipanggil dengan file lock journal)."""
+        change = self._journal_changed()
+        if change == 'tail':
+            try:
+                records, offset, inode = self._read_journal(self.journal_file, self._journal_pos[1])
+            except FileNotFoundError:
+                change = 'full'
+            else:
+                for record in records:
+                    self._apply_memory(record)
+                self._journal_records += len(records)
+                self._journal_pos = (inode, offset)
+        if change == 'full':
+            # Urutan lock: journal -> compacting (sama dengan _run_compaction)
+            with file_lock(self.compacting_file):
+                self.history_data = self._load_history()
+            self._rebuild_indexes()
+    
+    def refresh(self):
+        """Muat perubahan dari proses Blender lain jika file history berubah."""
+        if self._journal_changed():
+            with file_lock(self.journal_file), self._lock:
+                self._sync()
+    
+    def _write_snapshot(self, payload):
+        """Tulis snapshot secara atomic (temp file unik lalu rename)."""
+        atomic_write(self.history_file, payload)
     
     def _save_history(self):
-        """Save history ke file."""
+        """Tulis snapshot history dari data di memory."""
         try:
-            with open(self.history_file, 'w') as f:
-                json.dump(self.history_data, f, indent=2)
+            with self._lock:
+                payload = json.dumps(self.history_data)
+            self._write_snapshot(payload)
         except Exception as e:
             print(f"Error saving history: {str(e)}")
     
-    def add_generation(self, generation_info):
-        """Add new generation ke history.
+    def _rebuild_indexes(self):
+        """Bangun ulang index job_id, index per field, dan index prompt dari data."""
+        # job_id -> list entry (urut id); id -> entry; field -> value -> {id: entry}
+        # token prompt -> set id (inverted index untuk full-text search)
+        self._by_job_id = {}
+        self._by_id = {}
+        self._index = {field: {} for field in INDEXED_FIELDS}
+        self._prompt_index = {}
+        for gen in self.history_data['generations']:
+            self._index_add(gen)
+    
+    def _index_add(self, gen, keep_job_id=False):
+        """Tambahkan entry ke semua index (counter = ukuran bucket)."""
+        if not keep_job_id:
+            self._by_job_id.setdefault(gen['job_id'], []).append(gen)
+        self._by_id[gen['id']] = gen
+        for field, default in INDEXED_FIELDS.items():
+            self._index[field].setdefault(gen.get(field, default), {})[gen['id']] = gen
+        for token in tokenize_prompt(gen.get('prompt')):
+            self._prompt_index.setdefault(token, set()).add(gen['id'])
+    
+    def _index_remove(self, gen, keep_job_id=False):
+        """Hapus entry dari index field (dan opsional dari index job_id)."""
+        for field, default in INDEXED_FIELDS.items():
+            value = gen.get(field, default)
+            bucket = self._index[field].get(value)
+            if bucket is not None:
+                bucket.pop(gen['id'], None)
+                if not bucket:
+                    del self._index[field][value]
+        for token in tokenize_prompt(gen.get('prompt')):
+            ids = self._prompt_index.get(token)
+            if ids is not None:
+                ids.discard(gen['id'])
+                if not ids:
+                    del self._prompt_index[token]
+        if not keep_job_id:
+            self._by_id.pop(gen['id'], None)
+            entries = self._by_job_id.get(gen['job_id'], [])
+            if gen in entries:
+                entries.remove(gen)
+            if not entries:
+                self._by_job_id.pop(gen['job_id'], None)
+    
+    def _apply_memory(self, record):
+        """Terapkan record ke data di memory dan update index."""
+        op = record.get('op')
+        entry = None
+        if op == 'add':
+            entry = record['entry']
+            if entry['id'] in self._by_id:
+                return None
+            self.history_data['generations'].append(entry)
+            self.history_data['total_count'] = max(self.history_data['total_count'], entry['id'])
+            self._index_add(entry)
+        elif op == 'update':
+            entries = self._by_job_id.get(record['job_id'])
+            entry = entries[0] if entries else None
+            if entry is not None:
+                self._index_remove(entry, keep_job_id=True)
+                entry.update(record['fields'])
+                self._index_add(entry, keep_job_id=True)
+        else:
+            if op == 'delete':
+                for gen in list(self._by_job_id.get(record['job_id'], [])):
+                    self._index_remove(gen)
+            elif op == 'archive':
+                for entry_id in record['ids']:
+                    if entry_id in self._by_id:
+                        self._index_remove(self._by_id[entry_id])
+            _apply_record(self.history_data, record)
+            if op == 'clear':
+                self._rebuild_indexes()
+        return entry
+    
+    def _apply(self, record):
+        """Terapkan record ke data di memory dan append ke journal (dengan file lock)."""
+        with file_lock(self.journal_file), self._lock:
+            self._sync()
+            entry = self._apply_memory(record)
+            
+            try:
+                with open(self.journal_file, 'ab') as f:
+                    inode, offset = self._journal_pos
+                    if os.fstat(f.fileno()).st_ino == inode and f.tell() > offset:
+                        # Buang baris terakhir yang terpotong, supaya record ini
+                        # tidak tersambung ke sisa baris rusak
+                        f.truncate(offset)
+                    f.write((json.dumps(record) + '\n').encode())
+                    self._journal_pos = (os.fstat(f.fileno()).st_ino, f.tell())
+            except Exception as e:
+                print(f"Error writing history journal: {str(e)}")
+            self._journal_records += 1
+            if self._journal_records >= COMPACT_THRESHOLD:
+                self.compact()
+        return entry
+    
+    def _bucket(self, field, value):
+        """Get entry dari index field, urut id."""
+        bucket = self._index[field].get(value, {})
+        return sorted(bucket.values(), key=lambda g: g['id'])
+    
+    def compact(self, wait=False):
+        """Padatkan journal ke snapshot di background thread.
+        
+        Journal aktif di-rotate ke file compacting lebih dulu, sehingga
+        record baru tetap bisa di-append selama snapshot ditulis.
+        Compaction antar proses diserialisasi dengan file lock terpisah.
         
         Args:
-            generation_info (dict): Information tentang generation
-                - provider: Provider yang digunakan
-                - type: 'text' atau 'image'
-                - prompt: Text prompt (untuk text-to-3d)
-                - image_path: Path ke image (untuk image-to-3d)
-                - style: Style yang digunakan
-                - quality: Quality level
-                - format: Output format
-                - job_id: Job ID dari API
-                - status: Status generasi
+            wait (bool): Tunggu sampai compaction selesai
+        """
+        compaction = self._compaction
+        if compaction is not None and compaction.is_alive():
+            if not wait:
+                return
+            compaction.join()
+        self._journal_records = 0
+        self._compaction = threading.Thread(target=self._run_compaction, daemon=True)
+        self._compaction.start()
+        if wait:
+            self._compaction.join()
+    
+    def _run_compaction(self):
+        """Rotate journal, tulis snapshot, lalu hapus journal yang sudah dipadatkan.
+        
+        Urutan lock: snapshot (serialisasi compaction antar proses) ->
+        journal (hanya selama rotate) -> compacting (selama snapshot ditulis
+        dan file compacting dihapus, supaya reader tidak melihat keadaan
+        setengah jadi). Append tetap jalan selama snapshot ditulis.
         """
-        entry = {
-            'id': self.history_data['total_count'] + 1,
+        try:
+            with file_lock(self.history_file):
+                with file_lock(self.journal_file), self._lock:
+                    self._sync()
+                    if self.journal_file.exists():
+                        if self.compacting_file.exists():
+                            # Sisa compaction yang gagal: gabungkan ke satu file
+                            with open(self.journal_file, 'r') as src, open(self.compacting_file, 'a') as dst:
+                                dst.write(src.read())
+                            os.remove(self.journal_file)
+                        else:
+                            os.replace(self.journal_file, self.compacting_file)
+                    self._journal_pos = (None, 0)
+                    self._compacting_signature = file_signature(self.compacting_file)
+                    self._journal_records = 0
+                    payload = json.dumps(self.history_data)
+                
+                # Tanpa self._lock: main thread bisa memegangnya sambil menunggu lock ini
+                with file_lock(self.compacting_file):
+                    self._write_snapshot(payload)
+                    if self.compacting_file.exists():
+                        os.remove(self.compacting_file)
+                    self._snapshot_signature = file_signature(self.history_file)
+                    self._compacting_signature = None
+        except OSError as e:
+            print(f"Error compacting history: {str(e)}")
+    
+    def _new_entry(self, entry_id, generation_info):
+        """Buat dict entry history dari generation_info."""
+        return {
+            'id': entry_id,
             'timestamp': datetime.now().isoformat(),
             'provider': generation_info.get('provider', 'Unknown'),
             'type': generation_info.get('type', 'unknown'),
@@ -76,10 +478,27 @@ class GenerationHistory:
             'error': generation_info.get('error', ''),
             'imported_model_name': generation_info.get('imported_model_name', ''),
         }
+    
+    def add_generation(self, generation_info):
+        """Add new generation ke history.
         
-        self.history_data['generations'].append(entry)
-        self.history_data['total_count'] += 1
-        self._save_history()
+        Args:
+            generation_info (dict): Information tentang generation
+                - provider: Provider yang digunakan
+                - type: 'text' atau 'image'
+                - prompt: Text prompt (untuk text-to-3d)
+                - image_path: Path ke image (untuk image-to-3d)
+                - style: Style yang digunakan
+                - quality: Quality level
+                - format: Output format
+                - job_id: Job ID dari API
+                - status: Status generasi
+        """
+        # ID dialokasikan setelah sync, jadi unik antar proses
+        with file_lock(self.journal_file), self._lock:
+            self._sync()
+            entry = self._new_entry(self.history_data['total_count'] + 1, generation_info)
+            self._apply({'op': 'add', 'entry': entry})
         
         return entry
     
@@ -91,88 +510,296 @@ class GenerationHistory:
             status (str): Status baru
             **kwargs: Field tambahan untuk diupdate
         """
-        for gen in self.history_data['generations']:
-            if gen['job_id'] == job_id:
-                gen['status'] = status
-                gen.update(kwargs)
-                self._save_history()
-                return gen
-        return None
+        if self.get_generation(job_id) is None:
+            return None
+        return self._apply({'op': 'update', 'job_id': job_id, 'fields': dict(kwargs, status=status)})
     
     def get_generation(self, job_id):
-        """Get generasi spesifik berdasarkan job ID."""
-        for gen in self.history_data['generations']:
-            if gen['job_id'] == job_id:
-                return gen
-        return None
+        """Get generasi spesifik berdasarkan job ID (O(1) lewat index)."""
+        self.refresh()
+        entries = self._by_job_id.get(job_id)
+        return entries[0] if entries else None
     
     def get_all_generations(self):
         """Get semua generations."""
+        self.refresh()
         return self.history_data['generations']
     
     def get_generations_by_provider(self, provider):
         """Get generations berdasarkan provider."""
-        return [g for g in self.history_data['generations'] if g['provider'] == provider]
+        self.refresh()
+        return self._bucket('provider', provider)
     
     def get_generations_by_type(self, gen_type):
         """Get generations berdasarkan type (text atau image)."""
-        return [g for g in self.history_data['generations'] if g['type'] == gen_type]
+        self.refresh()
+        return self._bucket('type', gen_type)
     
     def get_completed_generations(self):
         """Get semua completed generations."""
-        return [g for g in self.history_data['generations'] if g['status'] == 'completed']
+        self.refresh()
+        return self._bucket('status', 'completed')
     
     def delete_generation(self, job_id):
         """Delete generation dari history."""
-        self.history_data['generations'] = [
-            g for g in self.history_data['generations'] if g['job_id'] != job_id
-        ]
-        self._save_history()
+        self._apply({'op': 'delete', 'job_id': job_id})
     
     def clear_history(self):
-        """Clear semua history."""
-        self.history_data = {'generations': [], 'total_count': 0}
-        self._save_history()
+        """Clear semua history (termasuk arsip)."""
+        self._apply({'op': 'clear'})
+        self.archive.clear()
     
     def get_statistics(self):
-        """Get statistics dari generation history."""
-        generations = self.history_data['generations']
-        
-        stats = {
-            'total': len(generations),
-            'completed': len([g for g in generations if g['status'] == 'completed']),
-            'failed': len([g for g in generations if g['status'] == 'failed']),
-            'pending': len([g for g in generations if g['status'] == 'pending']),
-            'by_provider': {},
-            'by_type': {},
-            'by_style': {},
-        }
+        """Get statistics dari generation history.
         
-        # Count by provider
-        for gen in generations:
-            provider = gen.get('provider', 'Unknown')
-            stats['by_provider'][provider] = stats['by_provider'].get(provider, 0) + 1
+        Counter diambil dari ukuran bucket index, jadi biayanya sebanding
+        dengan jumlah kategori, bukan jumlah generasi. Generasi yang sudah
+        diarsip dihitung dari aggregate per segment.
+        """
+        self.refresh()
+        by_status = self._index['status']
+        return self._merge_archive_statistics({
+            'total': len(self.history_data['generations']),
+            'completed': len(by_status.get('completed', {})),
+            'failed': len(by_status.get('failed', {})),
+            'pending': len(by_status.get('pending', {})),
+            'by_provider': {k: len(v) for k, v in self._index['provider'].items()},
+            'by_type': {k: len(v) for k, v in self._index['type'].items()},
+            'by_style': {k: len(v) for k, v in self._index['style'].items()},
+        })
+    
+    def query(self, provider=None, status=None, gen_type=None, quality=None, style=None,
+              since=None, until=None, search=None, sort='timestamp', descending=True,
+              limit=DEFAULT_PAGE_SIZE, cursor=None, include_archive=False):
+        """
+        Query history dengan filter, full-text search, sorting, dan cursor pagination.
         
-        # Count by type
-        for gen in generations:
-            gen_type = gen.get('type', 'unknown')
-            stats['by_type'][gen_type] = stats['by_type'].get(gen_type, 0) + 1
+        Filter field memakai index in-memory (bucket terkecil lebih dulu),
+        search memakai inverted index token prompt (semua token harus ada).
         
-        # Count by style
-        for gen in generations:
-            style = gen.get('style', 'unknown')
-            stats['by_style'][style] = stats['by_style'].get(style, 0) + 1
+        Args:
+            provider, status, gen_type, quality, style: Filter exact (None = semua)
+            since, until: Batas timestamp (datetime atau ISO string, inklusif)
+            search (str): Kata kunci prompt
+            sort (str): Salah satu SORT_FIELDS
+            descending (bool): Urutan menurun (terbaru dulu untuk timestamp)
+            limit (int): Jumlah entry per halaman
+            cursor (str): next_cursor dari halaman sebelumnya
+            include_archive (bool): Ikut cari di segment arsip (dibaca lazy)
+        
+        Returns:
+            Dict dengan 'items', 'next_cursor' (None jika halaman terakhir), 'total'
+        """
+        if sort not in SORT_FIELDS:
+            raise ValueError(f"Unsupported sort field: {sort}")
+        since, until = _date_bound(since), _date_bound(until)
         
+        self.refresh()
+        with self._lock:
+            candidates = []
+            for field, value in (('provider', provider), ('status', status),
+                                 ('type', gen_type), ('style', style)):
+                if value is not None:
+                    candidates.append(self._index[field].get(value, {}).keys())
+            if search:
+                tokens = tokenize_prompt(search)
+                candidates.extend(self._prompt_index.get(token, set()) for token in tokens)
+            
+            if candidates:
+                candidates.sort(key=len)
+                ids = set(candidates[0]).intersection(*candidates[1:])
+                matches = [self._by_id[i] for i in ids]
+            else:
+                matches = list(self._by_id.values())
+        
+        if quality is not None or since or until:
+            matches = [g for g in matches if _matches(g, quality, since, until)]
+        if include_archive:
+            matches.extend(self._query_archive(
+                provider=provider, status=status, type=gen_type, style=style,
+                quality=quality, since=since, until=until, search=search,
+            ))
+        
+        return paginate(matches, sort, descending, limit, cursor)
+    
+    def _query_archive(self, search=None, quality=None, since=None, until=None, **fields):
+        """Filter entry di segment arsip yang overlap rentang tanggal (lazy load)."""
+        tokens = tokenize_prompt(search)
+        return [
+            g for g in self.archive.iter_entries(since, until)
+            if _matches(g, quality, since, until, **fields)
+            and tokens <= tokenize_prompt(g.get('prompt'))
+        ]
+    
+    def _retention_candidates(self, max_age_days, max_count):
+        """Entry selesai (bukan pending) yang keluar dari retention policy, urut id."""
+        with self._lock:
+            done = [g for g in self.history_data['generations'] if g.get('status') != 'pending']
+            excess = len(self.history_data['generations']) - max_count if max_count else 0
+        
+        cutoff = (datetime.now() - timedelta(days=max_age_days)).isoformat() if max_age_days else None
+        candidates = done[:max(excess, 0)]
+        if cutoff:
+            candidates += [g for g in done[len(candidates):] if g.get('timestamp', '') < cutoff]
+        return candidates
+    
+    def apply_retention(self, max_age_days=DEFAULT_RETENTION_DAYS, max_count=DEFAULT_RETENTION_COUNT):
+        """
+        Pindahkan generasi lama ke arsip segment terkompresi.
+        
+        Args:
+            max_age_days (int): Umur maksimum entry di history aktif (0 = tanpa batas)
+            max_count (int): Jumlah maksimum entry di history aktif (0 = tanpa batas)
+        
+        Returns:
+            Jumlah entry yang diarsip
+        """
+        # Satu proses saja yang mengarsip pada satu waktu
+        with file_lock(self.archive.index_file):
+            self.refresh()
+            candidates = self._retention_candidates(max_age_days, max_count)
+            if not candidates:
+                return 0
+            # Arsip ditulis lebih dulu: crash sebelum record journal tidak kehilangan data
+            self.archive.append(candidates)
+            self._remove_archived([g['id'] for g in candidates])
+        print(f"Archived {len(candidates)} generations from history")
+        return len(candidates)
+    
+    def _remove_archived(self, ids):
+        """Hapus entry yang sudah diarsip dari history aktif."""
+        self._apply({'op': 'archive', 'ids': ids})
+    
+    def _merge_archive_statistics(self, stats):
+        """Tambahkan aggregate arsip ke statistics history aktif."""
+        archived = self.archive.get_aggregates()
+        if not archived['count']:
+            stats['archived'] = 0
+            return stats
+        by_status = archived['by_status']
+        stats['total'] += archived['count']
+        stats['completed'] += by_status.get('completed', 0)
+        stats['failed'] += by_status.get('failed', 0)
+        stats['pending'] += by_status.get('pending', 0)
+        for field in ('provider', 'type', 'style'):
+            merged = stats[f'by_{field}']
+            for value, count in archived[f'by_{field}'].items():
+                merged[value] = merged.get(value, 0) + count
+        stats['archived'] = archived['count']
         return stats
+    
+    def record_metrics(self, job_id, metrics):
+        """Simpan mesh quality metrics hasil import ke entry generasi.
+        
+        Durasi dihitung dari timestamp entry (submit job) sampai import
+        selesai, supaya bisa dibandingkan geometry per detik.
+        
+        Args:
+            job_id (str): Job ID generasi
+            metrics (dict): Hasil mesh_metrics.compute_metrics()
+        """
+        gen = self.get_generation(job_id)
+        if gen is None:
+            return None
+        
+        fields = {}
+        self._apply_metrics(fields, dict(metrics), gen.get('timestamp'))
+        return self._apply({'op': 'update', 'job_id': job_id, 'fields': fields})
+    
+    @staticmethod
+    def _apply_metrics(gen, metrics, timestamp):
+        """Set metrics dan durasi sejak submit (timestamp entry) pada dict."""
+        gen['metrics'] = metrics
+        try:
+            started = datetime.fromisoformat(timestamp)
+            gen['duration_seconds'] = round((datetime.now() - started).total_seconds(), 2)
+        except (TypeError, ValueError):
+            pass
+    
+    def query_metrics(self, provider=None, quality=None, style=None, gen_type=None):
+        """Get generations yang punya metrics, dengan filter opsional."""
+        self.refresh()
+        filters = {'provider': provider, 'quality': quality, 'style': style, 'type': gen_type}
+        return [
+            g for g in self.history_data['generations']
+            if g.get('metrics') and all(
+                value is None or g.get(key) == value for key, value in filters.items()
+            )
+        ]
+    
+    def compare_metrics(self, group_by='provider', **filters):
+        """Bandingkan rata-rata metrics per provider/quality/style.
+        
+        Args:
+            group_by (str): Field entry untuk grouping ('provider', 'quality', 'style')
+            **filters: Filter untuk query_metrics()
+        
+        Returns:
+            Dict group -> rata-rata metrics dan triangles_per_second
+        """
+        keys = (
+            'triangles', 'vertices', 'non_manifold_edges', 'boundary_edges',
+            'degenerate_faces', 'surface_area', 'texture_memory_mb',
+        )
+        groups = {}
+        for gen in self.query_metrics(**filters):
+            groups.setdefault(gen.get(group_by, 'unknown'), []).append(gen)
+        
+        comparison = {}
+        for group, gens in groups.items():
+            count = len(gens)
+            summary = {'count': count}
+            for key in keys:
+                summary[key] = round(sum(g['metrics'].get(key, 0) for g in gens) / count, 2)
+            
+            triangles = sum(g['metrics'].get('triangles', 0) for g in gens)
+            seconds = sum(g.get('duration_seconds', 0) for g in gens)
+            summary['triangles_per_second'] = round(triangles / seconds, 2) if seconds else None
+            comparison[group] = summary
+        
+        return comparison
 
 
 # Global history instance
 _history_instance = None
 
 
+def _get_history_backend():
+    """Baca pilihan backend history dari addon preferences."""
+    try:
+        addon = bpy.context.preferences.addons.get('ai_3d_generator')
+        return addon.preferences.history_backend if addon else 'SQLITE'
+    except AttributeError:
+        return 'SQLITE'
+
+
+def _get_retention_settings():
+    """Baca retention policy (hari, jumlah) dari addon preferences."""
+    try:
+        addon = bpy.context.preferences.addons.get('ai_3d_generator')
+        if addon:
+            return addon.preferences.history_retention_days, addon.preferences.history_retention_count
+    except AttributeError:
+        pass
+    return DEFAULT_RETENTION_DAYS, DEFAULT_RETENTION_COUNT
+
+
 def get_history():
-    """Get global history instance."""
+    """Get global history instance (backend sesuai preferences, retention diterapkan saat load jika diaktifkan)."""
     global _history_instance
     if _history_instance is None:
-        _history_instance = GenerationHistory()
+        if _get_history_backend() == 'SQLITE':
+            try:
+                from .history_sqlite import SQLiteGenerationHistory
+                _history_instance = SQLiteGenerationHistory()
+            except Exception as e:
+                print(f"SQLite history unavailable, using JSON: {str(e)}")
+        if _history_instance is None:
+            _history_instance = GenerationHistory()
+        max_age_days, max_count = _get_retention_settings()
+        try:
+            if max_age_days or max_count:
+                _history_instance.apply_retention(max_age_days, max_count)
+        except Exception as e:
+            print(f"Error applying history retention: {str(e)}")
     return _history_instance
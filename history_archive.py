@@ -0,0 +1,193 @@
+"""
+History Archive untuk AI 3D Generator
+
+Generasi lama yang keluar dari retention policy dipindahkan ke segment
+arsip terkompresi per bulan (history_archive/YYYY-MM.jsonl.gz). Segment
+hanya dibaca saat query meminta data arsip; statistik memakai aggregate
+per segment yang disimpan di archive_index.json. Index dimuat ulang jika
+proses Blender lain mengubahnya.
+"""
+
+import gzip
+import json
+import threading
+import zlib
+from collections import OrderedDict
+
+from .history import INDEXED_FIELDS
+from .persistence import atomic_write, dumps, file_lock, file_signature
+
+
+INDEX_FILENAME = 'archive_index.json'
+
+# Jumlah segment yang disimpan di memory setelah dibaca
+MAX_CACHED_SEGMENTS = 4
+
+
+def segment_name(timestamp) -> str:
+    """Nama segment (YYYY-MM) untuk timestamp ISO entry."""
+    return (timestamp or '0000-00')[:7]
+
+
+def _empty_aggregate():
+    aggregate = {'count': 0, 'first': None, 'last': None}
+    for field in INDEXED_FIELDS:
+        aggregate[f'by_{field}'] = {}
+    return aggregate
+
+
+class HistoryArchive:
+    """Segment arsip history terkompresi dengan aggregate per segment."""
+
+    def __init__(self, archive_dir):
+        """Initialize archive.
+
+        Args:
+            archive_dir (Path): Folder segment arsip
+        """
+        self.archive_dir = archive_dir
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        self.index_file = self.archive_dir / INDEX_FILENAME
+        self._lock = threading.RLock()
+        self._cache = OrderedDict()
+        self._index_signature = None
+        self.index = self._load_index()
+
+    def _load_index(self):
+        """Load aggregate per segment dari file."""
+        self._index_signature = file_signature(self.index_file)
+        if self.index_file.exists():
+            try:
+                with open(self.index_file, 'r') as f:
+                    return json.load(f)
+            except Exception as e:
+                print(f"Error loading history archive index: {str(e)}")
+        return {'segments': {}}
+
+    def _refresh_index(self):
+        """Muat ulang index jika diubah proses lain (segment cache ikut dibuang)."""
+        with self._lock:
+            if file_signature(self.index_file) != self._index_signature:
+                self.index = self._load_index()
+                self._cache.clear()
+
+    def _save_index(self):
+        try:
+            atomic_write(self.index_file, dumps(self.index))
+        except OSError as e:
+            print(f"Error saving history archive index: {str(e)}")
+        self._index_signature = file_signature(self.index_file)
+
+    def _segment_path(self, name):
+        return self.archive_dir / f"{name}.jsonl.gz"
+
+    def append(self, entries):
+        """Tambahkan entry ke segment bulan masing-masing dan update aggregate.
+
+        Setiap append menjadi gzip member baru, jadi segment lama tidak
+        perlu ditulis ulang. Entry yang id-nya sudah ada di segment
+        dilewati: crash setelah arsip ditulis tapi sebelum entry dihapus
+        dari history aktif membuatnya diarsip ulang saat load berikutnya.
+
+        Returns:
+            Jumlah entry yang diarsip
+        """
+        groups = {}
+        for entry in entries:
+            groups.setdefault(segment_name(entry.get('timestamp')), []).append(entry)
+
+        with file_lock(self.index_file), self._lock:
+            self._refresh_index()
+            for name in list(groups):
+                if name in self.index['segments']:
+                    archived = {e.get('id') for e in self.load_segment(name)}
+                    groups[name] = [e for e in groups[name] if e.get('id') not in archived]
+                    if not groups[name]:
+                        del groups[name]
+            for name, group in groups.items():
+                with gzip.open(self._segment_path(name), 'at') as f:
+                    f.write(''.join(dumps(entry) + '\n' for entry in group))
+
+                aggregate = self.index['segments'].setdefault(name, _empty_aggregate())
+                aggregate['count'] += len(group)
+                for entry in group:
+                    for field, default in INDEXED_FIELDS.items():
+                        counts = aggregate[f'by_{field}']
+                        value = str(entry.get(field, default))
+                        counts[value] = counts.get(value, 0) + 1
+                    timestamp = entry.get('timestamp')
+                    if timestamp:
+                        if aggregate['first'] is None or timestamp < aggregate['first']:
+                            aggregate['first'] = timestamp
+                        if aggregate['last'] is None or timestamp > aggregate['last']:
+                            aggregate['last'] = timestamp
+                self._cache.pop(name, None)
+            self._save_index()
+        return sum(len(group) for group in groups.values())
+
+    def load_segment(self, name):
+        """Baca semua entry satu segment (di-cache, member terakhir yang rusak dilewati)."""
+        with self._lock:
+            if name in self._cache:
+                self._cache.move_to_end(name)
+                return self._cache[name]
+
+        entries = []
+        path = self._segment_path(name)
+        if path.exists():
+            try:
+                with gzip.open(path, 'rt') as f:
+                    for line in f:
+                        entries.append(json.loads(line))
+            except (OSError, EOFError, zlib.error, ValueError) as e:
+                print(f"History archive segment {name} truncated: {str(e)}")
+
+        with self._lock:
+            self._cache[name] = entries
+            while len(self._cache) > MAX_CACHED_SEGMENTS:
+                self._cache.popitem(last=False)
+        return entries
+
+    def segments(self, since=None, until=None):
+        """Nama segment yang overlap dengan rentang tanggal (ISO string)."""
+        self._refresh_index()
+        with self._lock:
+            names = sorted(self.index['segments'])
+        return [
+            name for name in names
+            if (not since or name >= since[:7]) and (not until or name <= until[:7])
+        ]
+
+    def iter_entries(self, since=None, until=None):
+        """Iterasi entry arsip dari segment yang overlap rentang tanggal."""
+        for name in self.segments(since, until):
+            yield from self.load_segment(name)
+
+    def get_aggregates(self):
+        """Jumlahkan aggregate semua segment (tanpa membaca segment)."""
+        totals = _empty_aggregate()
+        self._refresh_index()
+        with self._lock:
+            segments = list(self.index['segments'].values())
+        for aggregate in segments:
+            totals['count'] += aggregate['count']
+            for field in INDEXED_FIELDS:
+                counts = totals[f'by_{field}']
+                for value, count in aggregate[f'by_{field}'].items():
+                    counts[value] = counts.get(value, 0) + count
+            for key, pick in (('first', min), ('last', max)):
+                values = [v for v in (totals[key], aggregate[key]) if v]
+                totals[key] = pick(values) if values else None
+        return totals
+
+    def clear(self):
+        """Hapus semua segment dan aggregate."""
+        with file_lock(self.index_file), self._lock:
+            self._refresh_index()
+            for name in list(self.index['segments']):
+                path = self._segment_path(name)
+                if path.exists():
+                    path.unlink()
+            self.index = {'segments': {}}
+            self._cache.clear()
+            self._save_index()
@@ -0,0 +1,390 @@
+"""
+SQLite History Backend untuk AI 3D Generator
+
+Menyimpan generation history di database SQLite (WAL mode) dengan index
+pada job_id, provider, status, dan timestamp. API sama dengan
+GenerationHistory sehingga bisa dipakai lewat get_history().
+"""
+
+import json
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+
+from .history import (
+    DEFAULT_PAGE_SIZE, SORT_FIELDS, GenerationHistory, _date_bound, decode_cursor,
+    encode_cursor, paginate, tokenize_prompt,
+)
+from .persistence import file_lock
+
+
+# Kolom entry yang disimpan terpisah supaya bisa di-index/di-filter
+COLUMNS = ('job_id', 'timestamp', 'provider', 'type', 'status', 'style', 'quality', 'prompt')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS generations (
+    id INTEGER PRIMARY KEY,
+    job_id TEXT,
+    timestamp TEXT,
+    provider TEXT,
+    type TEXT,
+    status TEXT,
+    style TEXT,
+    quality INTEGER,
+    prompt TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_generations_job_id ON generations (job_id);
+CREATE INDEX IF NOT EXISTS idx_generations_provider ON generations (provider);
+CREATE INDEX IF NOT EXISTS idx_generations_status ON generations (status);
+CREATE INDEX IF NOT EXISTS idx_generations_timestamp ON generations (timestamp);
+CREATE INDEX IF NOT EXISTS idx_generations_type ON generations (type);
+CREATE INDEX IF NOT EXISTS idx_generations_quality ON generations (quality);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# Full-text index prompt; rowid = generations.id, diisi manual di _insert()
+FTS_SCHEMA = "CREATE VIRTUAL TABLE IF NOT EXISTS generations_fts USING fts5(prompt)"
+
+
+class SQLiteGenerationHistory(GenerationHistory):
+    """Generation history dengan storage SQLite."""
+
+    def __init__(self):
+        """Initialize history database dan migrasi dari JSON jika perlu."""
+        self.history_file = self._get_history_file()
+        self.journal_file, self.compacting_file = self._get_journal_files()
+        self.db_file = self.history_file.with_name('generation_history.db')
+        self._lock = threading.RLock()
+        # timeout: tunggu lock database dari proses Blender lain
+        self._conn = sqlite3.connect(str(self.db_file), timeout=30.0, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._fts = self._init_fts()
+        self._migrate_json()
+        self.archive = self._open_archive()
+
+    def _get_meta(self, key, default=None):
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else default
+
+    def _set_meta(self, key, value):
+        self._conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, str(value))
+        )
+
+    def _init_fts(self) -> bool:
+        """Buat tabel FTS5; False jika SQLite tidak dikompilasi dengan FTS5."""
+        try:
+            with self._conn:
+                self._conn.execute(FTS_SCHEMA)
+                if not self._get_meta('fts_built'):
+                    self._conn.execute("DELETE FROM generations_fts")
+                    self._conn.execute(
+                        "INSERT INTO generations_fts (rowid, prompt) "
+                        "SELECT id, COALESCE(prompt, '') FROM generations"
+                    )
+                    self._set_meta('fts_built', 1)
+            return True
+        except sqlite3.OperationalError as e:
+            print(f"SQLite FTS5 not available, prompt search uses LIKE: {str(e)}")
+            return False
+
+    def _migrate_json(self):
+        """Import history JSON (snapshot + journal) ke database.
+
+        Migrasi pertama mempertahankan ID entry. File JSON yang muncul lagi
+        setelah itu (backend sempat diganti ke JSON Journal) di-import ulang:
+        entry dengan job_id yang belum ada di database ditambahkan dengan ID
+        baru. File JSON di-rename ke .migrated setelah di-import.
+        """
+        json_files = [self.history_file, self.compacting_file, self.journal_file]
+        if not any(path.exists() for path in json_files):
+            return
+
+        # Lock yang sama dengan backend JSON, supaya proses lain tidak menulis di tengah import
+        with file_lock(self.journal_file), file_lock(self.compacting_file):
+            data = self._load_history()
+            generations = data.get('generations', [])
+            with self._lock, self._conn:
+                self._conn.execute("BEGIN IMMEDIATE")
+                if self._get_meta('migrated'):
+                    imported = self._import_new(generations)
+                else:
+                    for entry in generations:
+                        self._insert(entry)
+                    self._set_meta('total_count', data.get('total_count', len(generations)))
+                    imported = len(generations)
+                self._set_meta('migrated', datetime.now().isoformat())
+
+            for path in json_files:
+                if not path.exists():
+                    continue
+                target = path.with_name(path.name + '.migrated')
+                if target.exists():
+                    target = path.with_name(f"{path.name}.{datetime.now():%Y%m%d%H%M%S}.migrated")
+                try:
+                    path.replace(target)
+                except OSError as e:
+                    print(f"Error renaming migrated history: {str(e)}")
+        if imported:
+            print(f"Migrated {imported} generations to SQLite history")
+
+    def _import_new(self, generations):
+        """Tambahkan entry JSON yang job_id-nya belum ada, dengan ID baru (di dalam transaksi).
+
+        Returns:
+            Jumlah entry yang ditambahkan
+        """
+        known = {row[0] for row in self._conn.execute("SELECT DISTINCT job_id FROM generations")}
+        total_count = int(self._get_meta('total_count', 0))
+        imported = 0
+        for entry in generations:
+            if entry.get('job_id') and entry['job_id'] in known:
+                continue
+            total_count += 1
+            self._insert(dict(entry, id=total_count))
+            imported += 1
+        self._set_meta('total_count', total_count)
+        return imported
+
+    def _insert(self, entry):
+        """Insert entry (harus dipanggil di dalam transaksi)."""
+        self._conn.execute(
+            f"INSERT OR REPLACE INTO generations (id, {', '.join(COLUMNS)}, data) "
+            f"VALUES (?, {', '.join('?' for _ in COLUMNS)}, ?)",
+            (entry.get('id'), *(entry.get(c) for c in COLUMNS), json.dumps(entry)),
+        )
+        if self._fts:
+            self._conn.execute("DELETE FROM generations_fts WHERE rowid = ?", (entry.get('id'),))
+            self._conn.execute(
+                "INSERT INTO generations_fts (rowid, prompt) VALUES (?, ?)",
+                (entry.get('id'), entry.get('prompt') or ''),
+            )
+
+    def _select(self, where='', params=()):
+        """Query entry sebagai list dict, urut sesuai id."""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT data FROM generations {where} ORDER BY id", params
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def refresh(self):
+        """Tidak perlu: SQLite (WAL) selalu membaca data terbaru dari semua proses."""
+
+    def add_generation(self, generation_info):
+        """Add new generation ke history (lihat GenerationHistory.add_generation)."""
+        with self._lock, self._conn:
+            # Write lock sebelum membaca total_count, supaya ID unik antar proses
+            self._conn.execute("BEGIN IMMEDIATE")
+            total_count = int(self._get_meta('total_count', 0))
+            entry = self._new_entry(total_count + 1, generation_info)
+            self._insert(entry)
+            self._set_meta('total_count', total_count + 1)
+        return entry
+
+    def update_generation(self, job_id, status, **kwargs):
+        """Update status generasi yang existing."""
+        with self._lock, self._conn:
+            # Write lock sebelum membaca entry, supaya update proses lain tidak tertimpa
+            self._conn.execute("BEGIN IMMEDIATE")
+            gen = self.get_generation(job_id)
+            if gen is None:
+                return None
+            gen['status'] = status
+            gen.update(kwargs)
+            self._insert(gen)
+        return gen
+
+    def get_generation(self, job_id):
+        """Get generasi spesifik berdasarkan job ID (index lookup)."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM generations WHERE job_id = ? ORDER BY id LIMIT 1", (job_id,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def get_all_generations(self):
+        """Get semua generations."""
+        return self._select()
+
+    def get_generations_by_provider(self, provider):
+        """Get generations berdasarkan provider."""
+        return self._select("WHERE provider = ?", (provider,))
+
+    def get_generations_by_type(self, gen_type):
+        """Get generations berdasarkan type (text atau image)."""
+        return self._select("WHERE type = ?", (gen_type,))
+
+    def get_completed_generations(self):
+        """Get semua completed generations."""
+        return self._select("WHERE status = 'completed'")
+
+    def delete_generation(self, job_id):
+        """Delete generation dari history."""
+        with self._lock, self._conn:
+            if self._fts:
+                self._conn.execute(
+                    "DELETE FROM generations_fts WHERE rowid IN "
+                    "(SELECT id FROM generations WHERE job_id = ?)", (job_id,)
+                )
+            self._conn.execute("DELETE FROM generations WHERE job_id = ?", (job_id,))
+
+    def clear_history(self):
+        """Clear semua history."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM generations")
+            if self._fts:
+                self._conn.execute("DELETE FROM generations_fts")
+            self._set_meta('total_count', 0)
+        self.archive.clear()
+
+    def get_statistics(self):
+        """Get statistics dari generation history (agregasi di SQL)."""
+        with self._lock:
+            total = self._conn.execute("SELECT COUNT(*) FROM generations").fetchone()[0]
+            by_status = dict(self._conn.execute(
+                "SELECT status, COUNT(*) FROM generations GROUP BY status"
+            ).fetchall())
+            groups = {}
+            for key, column in (('by_provider', 'provider'), ('by_type', 'type'), ('by_style', 'style')):
+                groups[key] = dict(self._conn.execute(
+                    f"SELECT {column}, COUNT(*) FROM generations GROUP BY {column}"
+                ).fetchall())
+
+        return self._merge_archive_statistics({
+            'total': total,
+            'completed': by_status.get('completed', 0),
+            'failed': by_status.get('failed', 0),
+            'pending': by_status.get('pending', 0),
+            **groups,
+        })
+
+    def query(self, provider=None, status=None, gen_type=None, quality=None, style=None,
+              since=None, until=None, search=None, sort='timestamp', descending=True,
+              limit=DEFAULT_PAGE_SIZE, cursor=None, include_archive=False):
+        """Query history dengan filter, FTS5 search, dan keyset pagination (lihat GenerationHistory.query)."""
+        if sort not in SORT_FIELDS:
+            raise ValueError(f"Unsupported sort field: {sort}")
+
+        conditions, params = [], []
+        for column, value in (('provider', provider), ('status', status), ('type', gen_type),
+                              ('quality', quality), ('style', style)):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+        if since is not None:
+            conditions.append("timestamp >= ?")
+            params.append(_date_bound(since))
+        if until is not None:
+            conditions.append("timestamp <= ?")
+            params.append(_date_bound(until))
+
+        tokens = sorted(tokenize_prompt(search))
+        if tokens and self._fts:
+            conditions.append("id IN (SELECT rowid FROM generations_fts WHERE generations_fts MATCH ?)")
+            params.append(' '.join(f'"{token}"' for token in tokens))
+        else:
+            for token in tokens:
+                conditions.append("prompt LIKE ?")
+                params.append(f"%{token}%")
+
+        # Key sama dengan history._sort_key(): (ada value, value, id)
+        key_parts = (f"({sort} IS NOT NULL)", f"COALESCE({sort}, '')", "id")
+        key = ', '.join(key_parts)
+        order = 'DESC' if descending else 'ASC'
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ''
+
+        if include_archive:
+            # Entry arsip tidak ada di database: gabungkan dan paginate di Python
+            matches = self._select(where, tuple(params))
+            matches.extend(self._query_archive(
+                provider=provider, status=status, type=gen_type, style=style, quality=quality,
+                since=_date_bound(since), until=_date_bound(until), search=search,
+            ))
+            return paginate(matches, sort, descending, limit, cursor)
+
+        with self._lock:
+            total = self._conn.execute(
+                f"SELECT COUNT(*) FROM generations {where}", params
+            ).fetchone()[0]
+
+            page_conditions, page_params = list(conditions), list(params)
+            if cursor:
+                page_conditions.append(f"({key}) {'<' if descending else '>'} (?, ?, ?)")
+                page_params.extend(decode_cursor(cursor))
+            page_where = f"WHERE {' AND '.join(page_conditions)}" if page_conditions else ''
+            rows = self._conn.execute(
+                f"SELECT {key}, data FROM generations {page_where} "
+                f"ORDER BY {', '.join(f'{part} {order}' for part in key_parts)} LIMIT ?",
+                (*page_params, limit + 1),
+            ).fetchall()
+
+        page = rows[:limit]
+        next_cursor = encode_cursor(page[-1][:3]) if len(rows) > limit else None
+        return {
+            'items': [json.loads(row[3]) for row in page],
+            'next_cursor': next_cursor,
+            'total': total,
+        }
+
+    def _retention_candidates(self, max_age_days, max_count):
+        """Entry selesai yang keluar dari retention policy (query di SQL)."""
+        with self._lock:
+            total = self._conn.execute("SELECT COUNT(*) FROM generations").fetchone()[0]
+            excess = max(total - max_count, 0) if max_count else 0
+            rows = self._conn.execute(
+                "SELECT data FROM generations WHERE status != 'pending' ORDER BY id LIMIT ?", (excess,)
+            ).fetchall()
+            candidates = [json.loads(row[0]) for row in rows]
+            if max_age_days:
+                cutoff = (datetime.now() - timedelta(days=max_age_days)).isoformat()
+                last_id = candidates[-1]['id'] if candidates else 0
+                rows = self._conn.execute(
+                    "SELECT data FROM generations WHERE status != 'pending' AND timestamp < ? "
+                    "AND id > ? ORDER BY id", (cutoff, last_id)
+                ).fetchall()
+                candidates += [json.loads(row[0]) for row in rows]
+        return candidates
+
+    def _remove_archived(self, ids):
+        """Hapus entry yang sudah diarsip dari database."""
+        with self._lock, self._conn:
+            for start in range(0, len(ids), 500):
+                chunk = ids[start:start + 500]
+                marks = ', '.join('?' for _ in chunk)
+                if self._fts:
+                    self._conn.execute(f"DELETE FROM generations_fts WHERE rowid IN ({marks})", chunk)
+                self._conn.execute(f"DELETE FROM generations WHERE id IN ({marks})", chunk)
+
+    def record_metrics(self, job_id, metrics):
+        """Simpan mesh quality metrics hasil import ke entry generasi."""
+        with self._lock, self._conn:
+            # Write lock sebelum membaca entry (lihat update_generation)
+            self._conn.execute("BEGIN IMMEDIATE")
+            gen = self.get_generation(job_id)
+            if gen is None:
+                return None
+            self._apply_metrics(gen, metrics, gen.get('timestamp'))
+            self._insert(gen)
+        return gen
+
+    def query_metrics(self, provider=None, quality=None, style=None, gen_type=None):
+        """Get generations yang punya metrics, dengan filter opsional."""
+        conditions, params = ["json_extract(data, '$.metrics') IS NOT NULL"], []
+        for column, value in (('provider', provider), ('quality', quality),
+                              ('style', style), ('type', gen_type)):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+        return self._select(f"WHERE {' AND '.join(conditions)}", tuple(params))
+
+    def close(self):
+        """Tutup koneksi database."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,223 @@
+"""
+Import Queue
+
+Addon ini hanya bertindak sebagai client untuk layanan AI 3D pihak ketiga.
+User harus mendaftar dan menyediakan API key sendiri.
+
+Work queue di main thread yang digerakkan oleh bpy.app.timers.
+Setiap tick hanya menjalankan pekerjaan import/post-processing sampai
+time budget habis, lalu yield ke UI. Import yang dipicu user didahulukan
+dari import batch.
+"""
+
+import bpy
+import heapq
+import itertools
+import os
+import time
+
+
+PRIORITY_USER = 0
+PRIORITY_BATCH = 1
+
+DEFAULT_BUDGET_MS = 50
+TICK_INTERVAL = 0.01
+
+
+class QueueItem:
+    """Satu item pekerjaan dalam import queue."""
+
+    def __init__(self, name, steps, priority, callback=None, on_done=None):
+        """Initialize queue item.
+
+        Args:
+            name (str): Nama item (untuk log/UI)
+            steps (generator): Generator yang yield di antara tahap dan
+                return hasil akhir
+            priority (int): PRIORITY_USER atau PRIORITY_BATCH
+            callback (callable): Dipanggil dengan (item, result, error)
+            on_done (callable): Cleanup tanpa argumen setelah selesai/gagal
+        """
+        self.name = name
+        self.steps = steps
+        self.priority = priority
+        self.callback = callback
+        self.on_done = on_done
+
+
+class ImportQueue:
+    """Priority queue untuk import time-sliced di main thread."""
+
+    def __init__(self, budget_ms=DEFAULT_BUDGET_MS):
+        """Initialize import queue.
+
+        Args:
+            budget_ms (int): Waktu kerja maksimum per tick (milidetik)
+        """
+        self.budget_ms = budget_ms
+        self._heap = []
+        self._counter = itertools.count()
+        self._finished_objects = []
+        # bpy.app.timers membandingkan callback berdasarkan identitas object
+        self._tick_callback = self._tick
+
+    def enqueue(self, item):
+        """Tambahkan item ke queue dan pastikan timer aktif."""
+        heapq.heappush(self._heap, (item.priority, next(self._counter), item))
+        if not bpy.app.timers.is_registered(self._tick_callback):
+            bpy.app.timers.register(self._tick_callback, first_interval=0.0)
+        _tag_redraw()
+        return item
+
+    def depth(self):
+        """Jumlah item yang masih di queue."""
+        return len(self._heap)
+
+    def _tick(self):
+        """Timer callback: jalankan step sampai time budget habis."""
+        deadline = time.perf_counter() + self.budget_ms / 1000.0
+
+        while self._heap and time.perf_counter() < deadline:
+            # Item dengan prioritas tertinggi selalu di depan; item batch
+            # yang sedang berjalan akan menunggu jika ada import user baru
+            item = self._heap[0][2]
+            try:
+                next(item.steps)
+                continue
+            except StopIteration as stop:
+                result, error = stop.value, None
+            except Exception as e:
+                result, error = None, e
+                print(f"Queued import failed for {item.name}: {str(e)}")
+
+            heapq.heappop(self._heap)
+            self._finish(item, result, error)
+
+        _tag_redraw()
+
+        if self._heap:
+            return TICK_INTERVAL
+
+        # Queue kosong: satu kali view fit untuk semua hasil
+        from .downloader import fit_view_to_objects
+        objects = [obj for obj in self._finished_objects if _is_valid(obj)]
+        self._finished_objects = []
+        fit_view_to_objects(objects)
+        return None
+
+    def _finish(self, item, result, error):
+        """Jalankan cleanup dan callback item yang selesai."""
+        if item.on_done:
+            item.on_done()
+        if result:
+            self._finished_objects.extend(result.get('objects', []))
+        if item.callback:
+            try:
+                item.callback(item, result, error)
+            except Exception as e:
+                print(f"Import queue callback error: {str(e)}")
+
+    def clear(self):
+        """Kosongkan queue (dipanggil saat unregister)."""
+        for _, _, item in self._heap:
+            item.steps.close()
+            if item.on_done:
+                item.on_done()
+        self._heap = []
+        self._finished_objects = []
+        if bpy.app.timers.is_registered(self._tick_callback):
+            bpy.app.timers.unregister(self._tick_callback)
+
+
+def _is_valid(obj):
+    """Cek apakah object masih ada (belum dihapus sejak di-import)."""
+    try:
+        return obj.name is not None
+    except ReferenceError:
+        return False
+
+
+def _tag_redraw():
+    """Redraw sidebar supaya queue depth di panel selalu terbaru."""
+    wm = bpy.context.window_manager
+    if wm is None:
+        return
+    for window in wm.windows:
+        for area in window.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+
+
+def enqueue_import(filepath, import_type, object_name, settings=None,
+                   priority=PRIORITY_USER, remove_source=False, callback=None):
+    """
+    Masukkan import file model ke queue.
+
+    Args:
+        filepath (str): Path file model
+        import_type (str): Format file
+        object_name (str): Nama object di scene
+        settings (dict): Import settings (lihat get_import_settings())
+        priority (int): PRIORITY_USER atau PRIORITY_BATCH
+        remove_source (bool): Hapus file model setelah selesai
+        callback (callable): Dipanggil dengan (item, result, error)
+
+    Returns:
+        QueueItem yang dimasukkan
+    """
+    from .downloader import iter_import_model_file
+
+    settings = settings or {}
+    queue = get_import_queue()
+    queue.budget_ms = settings.get('queue_budget_ms', queue.budget_ms)
+
+    def on_done():
+        if remove_source:
+            try:
+                os.remove(filepath)
+            except OSError:
+                pass
+
+    steps = iter_import_model_file(filepath, import_type, object_name, settings)
+    return queue.enqueue(QueueItem(object_name, steps, priority, callback, on_done))
+
+
+def enqueue_batch(files, settings=None, callback=None):
+    """
+    Masukkan banyak file model ke queue dengan prioritas batch.
+
+    Args:
+        files: List dict dengan kunci 'filepath', 'import_type', 'object_name'
+        settings (dict): Import settings
+        callback (callable): Dipanggil per item dengan (item, result, error)
+
+    Returns:
+        List QueueItem
+    """
+    return [
+        enqueue_import(
+            f['filepath'], f['import_type'], f['object_name'], settings,
+            priority=PRIORITY_BATCH, callback=callback,
+        )
+        for f in files
+    ]
+
+
+# Global import queue instance
+_import_queue_instance = None
+
+
+def get_import_queue():
+    """Get global import queue instance."""
+    global _import_queue_instance
+    if _import_queue_instance is None:
+        _import_queue_instance = ImportQueue()
+    return _import_queue_instance
+
+
+def clear_import_queue():
+    """Kosongkan global import queue jika ada."""
+    global _import_queue_instance
+    if _import_queue_instance is not None:
+        _import_queue_instance.clear()
+        _import_queue_instance = None
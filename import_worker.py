@@ -0,0 +1,73 @@
+"""
+Import Worker Script
+
+Addon ini hanya bertindak sebagai client untuk layanan AI 3D pihak ketiga.
+User harus mendaftar dan menyediakan API key sendiri.
+
+Script yang dijalankan oleh proses Blender background untuk import dan
+optimasi satu model, lalu menyimpan hasilnya sebagai .blend kecil.
+
+Usage:
+    blender -b --factory-startup --python import_worker.py -- <job.json>
+"""
+
+import bpy
+import importlib
+import json
+import sys
+
+
+def _summary(result: dict) -> dict:
+    """Ambil bagian hasil import yang bisa di-serialize ke JSON."""
+    return {
+        key: result.get(key)
+        for key in ('profile', 'warnings', 'optimization', 'textures', 'content_hash',
+                    'dedup', 'normalize', 'metrics')
+    }
+
+
+def main():
+    """Jalankan satu import job dari file job JSON."""
+    job_path = sys.argv[sys.argv.index('--') + 1]
+    with open(job_path, 'r') as f:
+        job = json.load(f)
+
+    status = {'ok': False, 'collection': job['object_name'], 'error': ''}
+
+    try:
+        # Mulai dari scene kosong supaya hanya hasil import yang tersimpan
+        bpy.ops.wm.read_factory_settings(use_empty=True)
+
+        sys.path.insert(0, job['addon_parent'])
+        downloader = importlib.import_module(f"{job['package']}.downloader")
+
+        result = downloader.import_model_file(
+            job['filepath'],
+            job['import_type'],
+            job['object_name'],
+            job['settings'],
+            fit_view=False,
+        )
+
+        # Kumpulkan semua object scene (termasuk LOD) ke satu collection
+        collection = bpy.data.collections.new(job['object_name'])
+        for obj in bpy.context.scene.objects:
+            collection.objects.link(obj)
+
+        bpy.data.libraries.write(job['output'], {collection}, fake_user=True, compress=True)
+
+        status['ok'] = True
+        status['collection'] = collection.name
+        status['object_count'] = len(collection.objects)
+        status['result'] = _summary(result)
+    except Exception as e:
+        status['error'] = str(e)
+
+    with open(job['status'], 'w') as f:
+        json.dump(status, f)
+
+    sys.exit(0 if status['ok'] else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,251 @@
+"""
+Import Worker Pool
+
+Addon ini hanya bertindak sebagai client untuk layanan AI 3D pihak ketiga.
+User harus mendaftar dan menyediakan API key sendiri.
+
+Pool proses Blender background (blender -b) untuk import model berat.
+Setiap worker meng-import dan mengoptimasi satu file model lalu menyimpan
+hasilnya sebagai .blend kecil. Session utama hanya me-link atau meng-append
+hasilnya, sehingga UI tetap responsif dan beberapa core terpakai sekaligus.
+"""
+
+import bpy
+import json
+import os
+import subprocess
+import uuid
+from pathlib import Path
+
+
+WORKER_SCRIPT = os.path.join(os.path.dirname(__file__), 'import_worker.py')
+POLL_INTERVAL = 0.5
+
+
+def _get_workers_dir():
+    """Get folder untuk job, status, dan hasil .blend worker."""
+    workers_dir = Path(bpy.utils.resource_path('USER')) / 'ai_3d_generator' / 'import_workers'
+    workers_dir.mkdir(parents=True, exist_ok=True)
+    return workers_dir
+
+
+def load_worker_result(blend_path: str, collection_name: str, link: bool = False):
+    """
+    Link atau append collection hasil worker ke scene aktif.
+
+    Args:
+        blend_path: Path .blend hasil worker
+        collection_name: Nama collection di dalam .blend
+        link: True untuk link (instance collection), False untuk append
+
+    Returns:
+        Collection yang di-load, atau None jika tidak ditemukan
+    """
+    with bpy.data.libraries.load(blend_path, link=link) as (data_from, data_to):
+        if collection_name not in data_from.collections:
+            return None
+        data_to.collections = [collection_name]
+
+    collection = data_to.collections[0]
+    scene = bpy.context.scene
+
+    if link:
+        # Collection ter-link tidak bisa diedit, jadi tampilkan lewat instance empty
+        instance = bpy.data.objects.new(collection.name, None)
+        instance.instance_type = 'COLLECTION'
+        instance.instance_collection = collection
+        scene.collection.objects.link(instance)
+    else:
+        scene.collection.children.link(collection)
+
+    return collection
+
+
+class ImportJob:
+    """Satu import job untuk worker."""
+
+    def __init__(self, filepath, import_type, object_name, settings, link=False,
+                 remove_source=True, callback=None, metadata=None):
+        """Initialize import job.
+
+        Args:
+            filepath (str): Path file model yang sudah di-download
+            import_type (str): Format file (glb, obj, fbx, stl, ply)
+            object_name (str): Nama model di scene
+            settings (dict): Import settings (lihat get_import_settings())
+            link (bool): Link hasil .blend (True) atau append (False)
+            remove_source (bool): Hapus file model setelah worker selesai
+            callback (callable): Dipanggil dengan (job, status) di main thread
+            metadata (dict): Metadata generation untuk dipakai callback
+        """
+        self.job_id = uuid.uuid4().hex[:12]
+        self.filepath = filepath
+        self.import_type = import_type
+        self.object_name = object_name
+        self.settings = settings or {}
+        self.link = link
+        self.remove_source = remove_source
+        self.callback = callback
+        self.metadata = metadata or {}
+        self.process = None
+
+        workers_dir = _get_workers_dir()
+        self.job_file = str(workers_dir / f"{self.job_id}.job.json")
+        self.status_file = str(workers_dir / f"{self.job_id}.status.json")
+        self.output = str(workers_dir / f"{self.job_id}.blend")
+
+    def start(self):
+        """Tulis file job dan jalankan proses Blender background."""
+        package = __name__.rpartition('.')[0]
+        job = {
+            'filepath': self.filepath,
+            'import_type': self.import_type,
+            'object_name': self.object_name,
+            'settings': self.settings,
+            'output': self.output,
+            'status': self.status_file,
+            'package': package,
+            'addon_parent': os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        }
+        with open(self.job_file, 'w') as f:
+            json.dump(job, f)
+
+        self.process = subprocess.Popen(
+            [bpy.app.binary_path, '-b', '--factory-startup', '--python', WORKER_SCRIPT,
+             '--', self.job_file],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+    def is_done(self):
+        """Cek apakah proses worker sudah selesai."""
+        return self.process is not None and self.process.poll() is not None
+
+    def read_status(self):
+        """Baca status JSON dari worker."""
+        try:
+            with open(self.status_file, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {'ok': False, 'error': f"Worker exited with code {self.process.returncode}"}
+
+    def cleanup(self):
+        """Hapus file job/status dan file model sumber."""
+        paths = [self.job_file, self.status_file]
+        if self.remove_source:
+            paths.append(self.filepath)
+        for path in paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+class ImportWorkerPool:
+    """Manage proses worker import dengan jumlah maksimum bersamaan."""
+
+    def __init__(self, max_workers=None):
+        """Initialize worker pool.
+
+        Args:
+            max_workers (int): Jumlah worker bersamaan (default: CPU - 1)
+        """
+        self.max_workers = max_workers or max(1, (os.cpu_count() or 2) - 1)
+        self.pending = []
+        self.running = []
+        # bpy.app.timers membandingkan callback berdasarkan identitas object
+        self._poll_callback = self._poll
+
+    def submit(self, job):
+        """Tambahkan job ke antrian dan pastikan timer polling aktif."""
+        self.pending.append(job)
+        if not bpy.app.timers.is_registered(self._poll_callback):
+            bpy.app.timers.register(self._poll_callback, first_interval=0.0)
+        return job
+
+    def queue_depth(self):
+        """Jumlah job yang belum selesai (pending + running)."""
+        return len(self.pending) + len(self.running)
+
+    def _poll(self):
+        """Timer callback: jalankan job baru dan proses job yang selesai."""
+        for job in [j for j in self.running if j.is_done()]:
+            self.running.remove(job)
+            self._finish(job)
+
+        while self.pending and len(self.running) < self.max_workers:
+            job = self.pending.pop(0)
+            try:
+                job.start()
+                self.running.append(job)
+            except OSError as e:
+                print(f"Failed to start import worker: {str(e)}")
+                self._report(job, {'ok': False, 'error': str(e)})
+                job.cleanup()
+
+        if self.pending or self.running:
+            return POLL_INTERVAL
+        return None
+
+    def _finish(self, job):
+        """Load hasil worker ke scene dan bersihkan file sementara."""
+        status = job.read_status()
+        if status.get('ok'):
+            try:
+                load_worker_result(job.output, status['collection'], link=job.link)
+                print(f"Background import finished: {job.object_name}")
+            except Exception as e:
+                status = {'ok': False, 'error': f"Loading worker result failed: {str(e)}"}
+        else:
+            print(f"Background import failed for {job.object_name}: {status.get('error')}")
+
+        job.cleanup()
+        # .blend hasil append tidak dibutuhkan lagi; hasil link harus tetap ada
+        if not job.link or not status.get('ok'):
+            try:
+                os.remove(job.output)
+            except OSError:
+                pass
+
+        self._report(job, status)
+
+    def _report(self, job, status):
+        """Panggil callback job jika ada."""
+        if job.callback:
+            try:
+                job.callback(job, status)
+            except Exception as e:
+                print(f"Import worker callback error: {str(e)}")
+
+    def shutdown(self):
+        """Hentikan semua worker (dipanggil saat unregister)."""
+        for job in self.running:
+            if job.process and job.process.poll() is None:
+                job.process.terminate()
+            job.cleanup()
+        for job in self.pending:
+            job.cleanup()
+        self.running = []
+        self.pending = []
+        if bpy.app.timers.is_registered(self._poll_callback):
+            bpy.app.timers.unregister(self._poll_callback)
+
+
+# Global worker pool instance
+_worker_pool_instance = None
+
+
+def get_worker_pool():
+    """Get global worker pool instance."""
+    global _worker_pool_instance
+    if _worker_pool_instance is None:
+        _worker_pool_instance = ImportWorkerPool()
+    return _worker_pool_instance
+
+
+def shutdown_worker_pool():
+    """Hentikan global worker pool jika ada."""
+    global _worker_pool_instance
+    if _worker_pool_instance is not None:
+        _worker_pool_instance.shutdown()
+        _worker_pool_instance = None
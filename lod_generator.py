@@ -0,0 +1,102 @@
+"""
+LOD Generator
+
+Addon ini hanya bertindak sebagai client untuk layanan AI 3D pihak ketiga.
+User harus mendaftar dan menyediakan API key sendiri.
+
+Generate LOD chain otomatis untuk model hasil import.
+Setiap level LOD adalah copy object dengan mesh hasil decimate, dikumpulkan
+dalam satu collection per model dengan penamaan <nama>_LOD<n>.
+"""
+
+import bpy
+
+from .mesh_optimizer import decimated_mesh
+
+
+DEFAULT_LOD_RATIOS = "100,50,25,10"
+
+
+def parse_lod_ratios(text: str) -> list:
+    """
+    Parse daftar LOD ratio dari string.
+
+    Args:
+        text: Persentase dipisah koma, mis. "100,50,25,10"
+
+    Returns:
+        List ratio (0-1] terurut menurun, selalu diawali 1.0 untuk LOD0
+
+    Raises:
+        ValueError: Jika ada nilai yang bukan angka atau di luar 0-100
+    """
+    ratios = []
+    for part in text.split(','):
+        part = part.strip().rstrip('%')
+        if not part:
+            continue
+        percent = float(part)
+        if percent <= 0 or percent > 100:
+            raise ValueError(f"LOD percentage out of range: {part}")
+        ratios.append(percent / 100.0)
+
+    ratios = sorted(set(ratios), reverse=True)
+    if not ratios or ratios[0] != 1.0:
+        ratios.insert(0, 1.0)
+    return ratios
+
+
+def generate_lod_chain(objects, ratios, model_name: str):
+    """
+    Generate LOD chain untuk satu model hasil import.
+
+    Object asli menjadi LOD0 dan dipindah ke collection "<model_name>_LODs".
+    Untuk setiap ratio berikutnya, setiap object MESH di-copy dengan mesh
+    hasil decimate. Copy memakai material yang sama dan membawa UV layer.
+
+    Args:
+        objects: Object hasil import untuk model ini
+        ratios: List ratio dari parse_lod_ratios()
+        model_name: Nama dasar model
+
+    Returns:
+        Collection yang berisi semua level LOD
+    """
+    scene = bpy.context.scene
+    collection = bpy.data.collections.new(f"{model_name}_LODs")
+    scene.collection.children.link(collection)
+
+    # Pindahkan object asli (LOD0) ke collection LOD
+    for obj in objects:
+        for user_collection in list(obj.users_collection):
+            user_collection.objects.unlink(obj)
+        collection.objects.link(obj)
+
+    mesh_objects = [obj for obj in objects if obj.type == 'MESH']
+    base_names = {obj: obj.name for obj in mesh_objects}
+    for obj in mesh_objects:
+        obj.name = f"{base_names[obj]}_LOD0"
+
+    for level, ratio in enumerate(ratios[1:], start=1):
+        for obj in mesh_objects:
+            # Mesh LOD dibuat dari data asli (tanpa modifier stack), jadi modifier
+            # yang ikut ter-copy (mis. Armature) diterapkan tepat satu kali
+            lod = obj.copy()
+            lod.data = decimated_mesh(obj, ratio)
+            lod.data.name = f"{base_names[obj]}_LOD{level}"
+            lod.name = f"{base_names[obj]}_LOD{level}"
+            collection.objects.link(lod)
+
+            # Hanya LOD0 yang terlihat di viewport
+            try:
+                lod.hide_set(True)
+            except RuntimeError:
+                pass
+
+    print(f"Generated {len(ratios)} LOD levels for: {model_name}")
+    return collection
+
+
+def generate_lods(objects, ratios_text: str, model_name: str):
+    """Generate LOD chain dari setting string, lihat generate_lod_chain()."""
+    return generate_lod_chain(objects, parse_lod_ratios(ratios_text), model_name)
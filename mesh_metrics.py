@@ -0,0 +1,142 @@
+"""
+Mesh Quality Metrics
+
+Addon ini hanya bertindak sebagai client untuk layanan AI 3D pihak ketiga.
+User harus mendaftar dan menyediakan API key sendiri.
+
+Analisis kualitas geometry model hasil import: jumlah triangle/vertex,
+edge non-manifold dan boundary, face degenerate, bounding box, luas
+permukaan, dan estimasi texture memory. Semua dihitung dengan NumPy dari
+buffer foreach_get sehingga murah untuk model besar.
+"""
+
+import numpy as np
+
+from .model_normalizer import compute_bounds
+from .texture_optimizer import estimate_texture_bytes
+
+
+DEGENERATE_AREA = 1e-10
+
+
+def _mesh_metrics(obj) -> dict:
+    """Hitung metrics satu mesh object (luas dalam world space)."""
+    mesh = obj.data
+    vert_count = len(mesh.vertices)
+    edge_count = len(mesh.edges)
+    poly_count = len(mesh.polygons)
+    loop_count = len(mesh.loops)
+
+    metrics = {
+        'vertices': vert_count,
+        'triangles': 0,
+        'non_manifold_edges': 0,
+        'boundary_edges': 0,
+        'wire_edges': 0,
+        'degenerate_faces': 0,
+        'surface_area': 0.0,
+    }
+    if not poly_count:
+        metrics['wire_edges'] = edge_count
+        return metrics
+
+    loop_totals = np.empty(poly_count, dtype=np.int32)
+    mesh.polygons.foreach_get('loop_total', loop_totals)
+    metrics['triangles'] = int((loop_totals - 2).sum())
+
+    # Jumlah face per edge: 0 = wire, 1 = boundary, >2 = non-manifold
+    loop_edges = np.empty(loop_count, dtype=np.int32)
+    mesh.loops.foreach_get('edge_index', loop_edges)
+    faces_per_edge = np.bincount(loop_edges, minlength=edge_count)
+    metrics['wire_edges'] = int((faces_per_edge == 0).sum())
+    metrics['boundary_edges'] = int((faces_per_edge == 1).sum())
+    metrics['non_manifold_edges'] = int((faces_per_edge > 2).sum())
+
+    # Luas per triangle dari loop triangles di world space
+    mesh.calc_loop_triangles()
+    tri_count = len(mesh.loop_triangles)
+    coords = np.empty(vert_count * 3, dtype=np.float32)
+    mesh.vertices.foreach_get('co', coords)
+    matrix = np.array(obj.matrix_world, dtype=np.float64)
+    coords = coords.reshape(-1, 3) @ matrix[:3, :3].T
+
+    tris = np.empty(tri_count * 3, dtype=np.int32)
+    mesh.loop_triangles.foreach_get('vertices', tris)
+    tris = tris.reshape(-1, 3)
+    corners = coords[tris]
+    cross = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    tri_areas = 0.5 * np.linalg.norm(cross, axis=1)
+    metrics['surface_area'] = float(tri_areas.sum())
+
+    tri_polys = np.empty(tri_count, dtype=np.int32)
+    mesh.loop_triangles.foreach_get('polygon_index', tri_polys)
+    poly_areas = np.bincount(tri_polys, weights=tri_areas, minlength=poly_count)
+    metrics['degenerate_faces'] = int((poly_areas <= DEGENERATE_AREA).sum())
+
+    return metrics
+
+
+def _object_images(objects):
+    """Kumpulkan image unik yang dipakai material object."""
+    images = set()
+    for obj in objects:
+        for slot in getattr(obj, 'material_slots', []):
+            material = slot.material
+            if material is None or not material.use_nodes or not material.node_tree:
+                continue
+            for node in material.node_tree.nodes:
+                image = getattr(node, 'image', None)
+                if image is not None:
+                    images.add(image)
+    return images
+
+
+def compute_metrics(objects) -> dict:
+    """
+    Hitung metrics kualitas gabungan untuk model hasil import.
+
+    Mesh yang di-share oleh beberapa object dihitung per object, karena
+    semuanya dirender.
+
+    Args:
+        objects: Object hasil import
+
+    Returns:
+        Dict metrics (triangles, vertices, non_manifold_edges, boundary_edges,
+        wire_edges, degenerate_faces, surface_area, bbox_min, bbox_max,
+        dimensions, texture_count, texture_memory_mb)
+    """
+    objects = list(objects)
+    totals = {
+        'objects': len(objects),
+        'vertices': 0,
+        'triangles': 0,
+        'non_manifold_edges': 0,
+        'boundary_edges': 0,
+        'wire_edges': 0,
+        'degenerate_faces': 0,
+        'surface_area': 0.0,
+    }
+
+    for obj in objects:
+        if obj.type == 'MESH':
+            for key, value in _mesh_metrics(obj).items():
+                totals[key] += value
+        elif obj.type == 'POINTCLOUD':
+            totals['vertices'] += len(obj.data.points)
+
+    bounds = compute_bounds(objects)
+    if bounds is not None:
+        low, high = bounds
+        totals['bbox_min'] = [round(float(v), 6) for v in low]
+        totals['bbox_max'] = [round(float(v), 6) for v in high]
+        totals['dimensions'] = [round(float(v), 6) for v in high - low]
+
+    images = _object_images(objects)
+    totals['texture_count'] = len(images)
+    totals['texture_memory_mb'] = round(
+        sum(estimate_texture_bytes(image) for image in images) / (1024 * 1024), 2
+    )
+    totals['surface_area'] = round(totals['surface_area'], 6)
+
+    return totals
@@ -0,0 +1,192 @@
+"""
+Mesh Optimizer
+
+Addon ini hanya bertindak sebagai client untuk layanan AI 3D pihak ketiga.
+User harus mendaftar dan menyediakan API key sendiri.
+
+Optimasi mesh setelah import: merge by distance, hapus geometry degenerate
+dan loose, lalu decimate ke triangle budget. Semua operasi memakai bmesh
+dan mesh data langsung, tanpa bpy.ops per object.
+"""
+
+import bpy
+import bmesh
+import numpy as np
+
+
+# Triangle budget default per level ai3d_quality (1-10)
+QUALITY_TRIANGLE_BUDGETS = {
+    1: 5_000,
+    2: 10_000,
+    3: 20_000,
+    4: 40_000,
+    5: 75_000,
+    6: 120_000,
+    7: 200_000,
+    8: 350_000,
+    9: 600_000,
+    10: 1_000_000,
+}
+
+DEFAULT_MERGE_DISTANCE = 0.0001
+
+
+def quality_to_triangle_budget(quality: int) -> int:
+    """Map ai3d_quality (1-10) ke triangle budget."""
+    quality = max(1, min(10, int(quality)))
+    return QUALITY_TRIANGLE_BUDGETS[quality]
+
+
+def count_triangles(mesh) -> int:
+    """Hitung jumlah triangle mesh secara vectorized dari loop_total polygon."""
+    poly_count = len(mesh.polygons)
+    if poly_count == 0:
+        return 0
+    loop_totals = np.empty(poly_count, dtype=np.int32)
+    mesh.polygons.foreach_get('loop_total', loop_totals)
+    return int((loop_totals - 2).sum())
+
+
+def mesh_stats(meshes) -> dict:
+    """Hitung total vertex dan triangle dari sekumpulan mesh."""
+    return {
+        'vertices': sum(len(m.vertices) for m in meshes),
+        'triangles': sum(count_triangles(m) for m in meshes),
+    }
+
+
+def cleanup_mesh(mesh, merge_distance: float = DEFAULT_MERGE_DISTANCE):
+    """
+    Merge vertex duplikat dan hapus geometry degenerate/loose.
+
+    Args:
+        mesh: bpy.types.Mesh yang akan dibersihkan
+        merge_distance: Jarak merge by distance
+    """
+    bm = bmesh.new()
+    try:
+        bm.from_mesh(mesh)
+
+        bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=merge_distance)
+        bmesh.ops.dissolve_degenerate(bm, dist=merge_distance, edges=bm.edges)
+
+        # Hapus edge tanpa face, lalu vertex tanpa edge
+        loose_edges = [e for e in bm.edges if not e.link_faces]
+        if loose_edges:
+            bmesh.ops.delete(bm, geom=loose_edges, context='EDGES')
+        loose_verts = [v for v in bm.verts if not v.link_edges]
+        if loose_verts:
+            bmesh.ops.delete(bm, geom=loose_verts, context='VERTS')
+
+        bm.to_mesh(mesh)
+        mesh.update()
+    finally:
+        bm.free()
+
+
+def decimated_mesh(obj, ratio: float):
+    """
+    Buat mesh baru hasil decimate dari object tanpa mengubah mesh aslinya.
+
+    Decimate modifier ditambahkan sementara, di-evaluate lewat depsgraph,
+    lalu dihapus lagi. Modifier lain (mis. Armature dari importer glTF)
+    dimatikan selama evaluasi supaya tidak ikut di-bake ke mesh baru;
+    modifier itu tetap ada di object dan diterapkan saat render. Material
+    slot dan semua data layer (UV, color) ikut terbawa ke mesh baru.
+
+    Args:
+        obj: Object MESH
+        ratio: Collapse ratio (0-1)
+
+    Returns:
+        bpy.types.Mesh baru
+    """
+    disabled = [m for m in obj.modifiers if m.show_viewport]
+    for existing in disabled:
+        existing.show_viewport = False
+
+    modifier = obj.modifiers.new(name="AI3D_Decimate", type='DECIMATE')
+    modifier.decimate_type = 'COLLAPSE'
+    modifier.ratio = ratio
+    modifier.use_collapse_triangulate = True
+
+    try:
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        evaluated = obj.evaluated_get(depsgraph)
+        return bpy.data.meshes.new_from_object(
+            evaluated, preserve_all_data_layers=True, depsgraph=depsgraph
+        )
+    finally:
+        obj.modifiers.remove(modifier)
+        for existing in disabled:
+            existing.show_viewport = True
+
+
+def decimate_object(obj, ratio: float):
+    """
+    Decimate mesh object dan ganti mesh lama di semua object yang memakainya.
+
+    Args:
+        obj: Object MESH
+        ratio: Collapse ratio (0-1)
+
+    Returns:
+        bpy.types.Mesh baru
+    """
+    old_mesh = obj.data
+    new_mesh = decimated_mesh(obj, ratio)
+
+    mesh_name = old_mesh.name
+    old_mesh.user_remap(new_mesh)
+    if old_mesh.users == 0:
+        bpy.data.meshes.remove(old_mesh)
+    new_mesh.name = mesh_name
+
+    return new_mesh
+
+
+def optimize_meshes(objects, triangle_budget: int = 0,
+                    merge_distance: float = DEFAULT_MERGE_DISTANCE) -> dict:
+    """
+    Optimasi semua mesh dari object yang baru di-import.
+
+    Args:
+        objects: Object hasil import (non-MESH diabaikan)
+        triangle_budget: Total triangle maksimum untuk semua object
+            (0 = hanya cleanup, tanpa decimate)
+        merge_distance: Jarak merge by distance
+
+    Returns:
+        Dict dengan kunci 'before', 'after' (vertices, triangles) dan 'objects'
+    """
+    # Mesh yang di-share beberapa object hanya diproses sekali
+    mesh_owners = {}
+    for obj in objects:
+        if obj.type == 'MESH' and obj.data not in mesh_owners:
+            mesh_owners[obj.data] = obj
+
+    before = mesh_stats(mesh_owners.keys())
+
+    for mesh in mesh_owners:
+        cleanup_mesh(mesh, merge_distance)
+
+    cleaned = mesh_stats(mesh_owners.keys())
+    if triangle_budget and cleaned['triangles'] > triangle_budget:
+        # Budget dibagi proporsional terhadap jumlah triangle tiap mesh
+        ratio = triangle_budget / cleaned['triangles']
+        for obj in list(mesh_owners.values()):
+            decimate_object(obj, ratio)
+
+    meshes = {obj.data for obj in mesh_owners.values()}
+    after = mesh_stats(meshes)
+
+    report = {
+        'before': before,
+        'after': after,
+        'objects': len(mesh_owners),
+    }
+    print(
+        f"Mesh optimization: {before['vertices']:,} -> {after['vertices']:,} vertices, "
+        f"{before['triangles']:,} -> {after['triangles']:,} triangles"
+    )
+    return report
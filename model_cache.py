@@ -0,0 +1,423 @@
+"""
+Tiered Model Cache
+
+Addon ini hanya bertindak sebagai client untuk layanan AI 3D pihak ketiga.
+User harus mendaftar dan menyediakan API key sendiri.
+
+Cache lokal file model hasil generasi dengan dua tier:
+- hot: file mentah untuk model yang baru/sering dipakai
+- cold: file terkompresi (lzma atau zlib) untuk model lama
+
+Statistik akses (jumlah hit dan waktu akses terakhir) menentukan kapan file
+diturunkan ke cold tier dan kapan dinaikkan kembali ke hot tier. Kompresi
+dan dekompresi berjalan streaming per chunk sehingga file besar tidak
+pernah dimuat utuh ke memory. File hot yang sedang di-import (acquire())
+tidak pernah diturunkan.
+
+Index dibagi antar proses Blender: penulisan memakai file lock dan
+menggabungkan perubahan lokal per entry dengan isi file saat itu.
+"""
+
+import bpy
+import hashlib
+import lzma
+import os
+import shutil
+import tempfile
+import threading
+import time
+import zlib
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from .persistence import atomic_write, dumps, file_lock, file_signature, read_json
+
+
+CHUNK_SIZE = 1024 * 1024
+
+DEFAULT_HOT_LIMIT_MB = 2048
+HOT_MAX_AGE_DAYS = 14
+PROMOTE_HITS = 2
+PROMOTE_WINDOW_DAYS = 7
+# File yang baru dipakai tidak diturunkan (mungkin sedang di-import)
+MIN_HOT_SECONDS = 600
+
+CODECS = {
+    'lzma': '.xz',
+    'zlib': '.zz',
+}
+
+
+def cache_key(model_url: str, import_type: str, job_id: str = None) -> str:
+    """
+    Key cache untuk satu model.
+
+    URL provider biasanya signed dan kadaluarsa, jadi job ID dipakai jika
+    ada; jika tidak, URL tanpa query string.
+    """
+    source = job_id or urlsplit(model_url)._replace(query='', fragment='').geturl()
+    return hashlib.sha256(f"{source}|{import_type.lower()}".encode()).hexdigest()[:32]
+
+
+def _compress_file(src: str, dst: str, codec: str):
+    """Kompres file secara streaming."""
+    with open(src, 'rb') as f_in:
+        if codec == 'lzma':
+            with lzma.open(dst, 'wb', preset=6) as f_out:
+                shutil.copyfileobj(f_in, f_out, CHUNK_SIZE)
+        else:
+            compressor = zlib.compressobj(6)
+            with open(dst, 'wb') as f_out:
+                for chunk in iter(lambda: f_in.read(CHUNK_SIZE), b''):
+                    f_out.write(compressor.compress(chunk))
+                f_out.write(compressor.flush())
+
+
+def _decompress_file(src: str, dst: str, codec: str):
+    """Dekompres file secara streaming."""
+    with open(dst, 'wb') as f_out:
+        if codec == 'lzma':
+            with lzma.open(src, 'rb') as f_in:
+                shutil.copyfileobj(f_in, f_out, CHUNK_SIZE)
+        else:
+            decompressor = zlib.decompressobj()
+            with open(src, 'rb') as f_in:
+                for chunk in iter(lambda: f_in.read(CHUNK_SIZE), b''):
+                    f_out.write(decompressor.decompress(chunk))
+            f_out.write(decompressor.flush())
+
+
+class ModelCache:
+    """Cache file model dengan hot tier (raw) dan cold tier (compressed)."""
+
+    def __init__(self, hot_limit_mb=DEFAULT_HOT_LIMIT_MB, codec='lzma'):
+        """Initialize model cache.
+
+        Args:
+            hot_limit_mb (int): Ukuran maksimum hot tier (MB)
+            codec (str): Codec cold tier ('lzma' atau 'zlib')
+        """
+        self.cache_dir = Path(bpy.utils.resource_path('USER')) / 'ai_3d_generator' / 'model_cache'
+        self.hot_dir = self.cache_dir / 'hot'
+        self.cold_dir = self.cache_dir / 'cold'
+        self.hot_dir.mkdir(parents=True, exist_ok=True)
+        self.cold_dir.mkdir(parents=True, exist_ok=True)
+        self.index_file = self.cache_dir / 'cache_index.json'
+
+        self.hot_limit_mb = hot_limit_mb
+        self.codec = codec if codec in CODECS else 'lzma'
+        self._lock = threading.RLock()
+        self._maintenance = None
+        self._maintain_lock = threading.Lock()
+        # Key yang berubah/dihapus lokal sejak penulisan terakhir (untuk merge)
+        self._changed = set()
+        self._removed = set()
+        # key -> jumlah import yang sedang memakai file hot
+        self._in_use = {}
+        self._signature = None
+        self.index = {'entries': {}}
+        with file_lock(self.index_file), self._lock:
+            self._merge_disk()
+
+    def _merge_disk(self):
+        """Gabungkan index di file ke memory (dipanggil dengan file lock dan self._lock).
+
+        Entry yang diubah lokal tetap memakai versi lokal; entry lain diambil
+        dari file, diupdate in-place supaya referensi yang dipegang get() tetap valid.
+        """
+        disk = read_json(self.index_file, {'entries': {}}, 'model cache index').get('entries', {})
+        self._signature = file_signature(self.index_file)
+        entries = self.index['entries']
+        for key in list(entries):
+            if key not in disk and key not in self._changed:
+                del entries[key]
+        for key, entry in disk.items():
+            if key in self._changed or key in self._removed:
+                continue
+            if key in entries:
+                entries[key].clear()
+                entries[key].update(entry)
+            else:
+                entries[key] = entry
+
+    def _refresh(self):
+        """Muat perubahan proses lain jika file index berubah."""
+        if file_signature(self.index_file) != self._signature:
+            with file_lock(self.index_file), self._lock:
+                self._merge_disk()
+
+    def _mark(self, key, removed=False):
+        """Catat entry yang berubah lokal (dipanggil dengan self._lock)."""
+        if removed:
+            self._removed.add(key)
+            self._changed.discard(key)
+        else:
+            self._changed.add(key)
+            self._removed.discard(key)
+
+    def _save_index(self):
+        """Tulis index ke file: merge dengan isi file saat ini di bawah file lock, lalu atomic write."""
+        try:
+            with file_lock(self.index_file), self._lock:
+                self._merge_disk()
+                for key in self._removed:
+                    self.index['entries'].pop(key, None)
+                atomic_write(self.index_file, dumps(self.index))
+                self._signature = file_signature(self.index_file)
+                self._changed.clear()
+                self._removed.clear()
+        except Exception as e:
+            print(f"Error saving model cache index: {str(e)}")
+
+    def acquire(self, key):
+        """Tandai file hot entry sedang dipakai (import); tidak akan diturunkan sampai release()."""
+        with self._lock:
+            self._in_use[key] = self._in_use.get(key, 0) + 1
+
+    def release(self, key):
+        """Lepas tanda pakai dari acquire()."""
+        with self._lock:
+            count = self._in_use.get(key, 0) - 1
+            if count > 0:
+                self._in_use[key] = count
+            else:
+                self._in_use.pop(key, None)
+
+    def _hot_path(self, key, entry):
+        return self.hot_dir / f"{key}{entry['ext']}"
+
+    def _cold_path(self, key, entry):
+        return self.cold_dir / f"{key}{entry['ext']}{CODECS[entry.get('codec', 'lzma')]}"
+
+    def _touch(self, entry):
+        """Update statistik akses entry."""
+        now = time.time()
+        window = PROMOTE_WINDOW_DAYS * 86400
+        entry['recent_hits'] = [t for t in entry.get('recent_hits', []) if now - t < window] + [now]
+        entry['hits'] = entry.get('hits', 0) + 1
+        entry['last_access'] = now
+
+    def get(self, key, acquire=False):
+        """
+        Ambil file model dari cache.
+
+        File di cold tier didekompres streaming. Jika jumlah akses dalam
+        window promosi cukup, file dinaikkan ke hot tier; jika tidak, hasil
+        dekompresi berupa file sementara yang harus dihapus pemanggil.
+
+        Args:
+            key (str): Key dari cache_key()
+            acquire (bool): acquire() file hot yang dikembalikan; pemanggil
+                wajib release() setelah import selesai
+
+        Returns:
+            Tuple (path, is_temporary), atau (None, False) jika tidak ada
+        """
+        self._refresh()
+        with self._lock:
+            entry = self.index['entries'].get(key)
+            if entry is None:
+                return None, False
+            self._touch(entry)
+            self._mark(key)
+            tier = entry['tier']
+
+        if tier == 'hot':
+            path = self._hot_path(key, entry)
+            if path.exists():
+                if acquire:
+                    self.acquire(key)
+                self._save_index()
+                return str(path), False
+            return self._drop(key)
+
+        cold_path = self._cold_path(key, entry)
+        if not cold_path.exists():
+            return self._drop(key)
+
+        if len(entry['recent_hits']) >= PROMOTE_HITS:
+            hot_path = self._hot_path(key, entry)
+            _decompress_file(str(cold_path), str(hot_path), entry.get('codec', 'lzma'))
+            os.remove(cold_path)
+            with self._lock:
+                entry['tier'] = 'hot'
+                self._mark(key)
+            if acquire:
+                self.acquire(key)
+            self._save_index()
+            print(f"Model cache: promoted {key} to hot tier")
+            self.schedule_maintenance()
+            return str(hot_path), False
+
+        fd, temp_path = tempfile.mkstemp(prefix='ai3d_cache_', suffix=entry['ext'])
+        os.close(fd)
+        _decompress_file(str(cold_path), temp_path, entry.get('codec', 'lzma'))
+        self._save_index()
+        return temp_path, True
+
+    def _drop(self, key):
+        """Hapus entry yang file-nya hilang."""
+        with self._lock:
+            self.index['entries'].pop(key, None)
+            self._mark(key, removed=True)
+        self._save_index()
+        return None, False
+
+    def put(self, key, filepath: str, move: bool = True, acquire: bool = False) -> str:
+        """
+        Simpan file model ke hot tier (file tier lama key yang sama dihapus).
+
+        Args:
+            key (str): Key dari cache_key()
+            filepath (str): File model yang sudah di-download
+            move (bool): Pindahkan file (True) atau copy (False)
+            acquire (bool): acquire() file hot (lihat get())
+
+        Returns:
+            Path file di hot tier
+        """
+        entry = {
+            'ext': Path(filepath).suffix.lower(),
+            'tier': 'hot',
+            'size': os.path.getsize(filepath),
+            'created': time.time(),
+            'hits': 0,
+            'recent_hits': [],
+            'last_access': time.time(),
+        }
+        hot_path = self._hot_path(key, entry)
+        if move:
+            shutil.move(filepath, hot_path)
+        else:
+            shutil.copyfile(filepath, hot_path)
+
+        with self._lock:
+            previous = self.index['entries'].get(key)
+            self.index['entries'][key] = entry
+            self._mark(key)
+            if acquire:
+                self.acquire(key)
+        if previous is not None:
+            self._remove_tier_file(key, previous, keep=hot_path)
+        self._save_index()
+        self.schedule_maintenance()
+        return str(hot_path)
+
+    def _remove_tier_file(self, key, entry, keep=None):
+        """Hapus file hot/cold milik entry lama (kecuali path keep)."""
+        path = self._hot_path(key, entry) if entry['tier'] == 'hot' else self._cold_path(key, entry)
+        if path != keep:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _demotion_candidates(self):
+        """Pilih entry hot yang perlu diturunkan ke cold tier."""
+        now = time.time()
+        with self._lock:
+            hot = [(k, e) for k, e in self.index['entries'].items()
+                   if e['tier'] == 'hot' and k not in self._in_use]
+
+        # Yang jarang dan paling lama tidak diakses diturunkan lebih dulu
+        hot.sort(key=lambda item: (len(item[1].get('recent_hits', [])), item[1]['last_access']))
+        total = sum(e['size'] for _, e in hot)
+        limit = self.hot_limit_mb * 1024 * 1024
+
+        candidates = []
+        for key, entry in hot:
+            idle = now - entry['last_access']
+            if idle < MIN_HOT_SECONDS:
+                continue
+            stale = idle > HOT_MAX_AGE_DAYS * 86400
+            if stale or (limit and total > limit):
+                candidates.append(key)
+                total -= entry['size']
+        return candidates
+
+    def demote(self, key) -> bool:
+        """Kompres file hot tier ke cold tier."""
+        with self._lock:
+            entry = self.index['entries'].get(key)
+            if entry is None or entry['tier'] != 'hot' or key in self._in_use:
+                return False
+            entry = dict(entry, codec=self.codec)
+
+        hot_path = self._hot_path(key, entry)
+        cold_path = self._cold_path(key, entry)
+        if not hot_path.exists():
+            self._drop(key)
+            return False
+
+        partial = cold_path.with_name(cold_path.name + '.part')
+        _compress_file(str(hot_path), str(partial), self.codec)
+        os.replace(partial, cold_path)
+
+        with self._lock:
+            current = self.index['entries'].get(key)
+            if (current is None or current['tier'] != 'hot' or key in self._in_use
+                    or current.get('created') != entry.get('created')):
+                # Dihapus, diganti, atau di-acquire selama kompresi: file hot tetap dipakai
+                os.remove(cold_path)
+                return False
+            current.update(tier='cold', codec=self.codec, compressed_size=os.path.getsize(cold_path))
+            self._mark(key)
+        try:
+            os.remove(hot_path)
+        except OSError:
+            # File masih dibuka di Windows; coba lagi saat maintenance berikutnya
+            pass
+        return True
+
+    def maintain(self):
+        """Turunkan entry hot yang stale atau melebihi limit ke cold tier."""
+        demoted = 0
+        # Satu maintenance pada satu waktu (thread background dan panggilan langsung)
+        with self._maintain_lock:
+            for key in self._demotion_candidates():
+                try:
+                    if self.demote(key):
+                        demoted += 1
+                except Exception as e:
+                    print(f"Model cache demotion failed for {key}: {str(e)}")
+        if demoted:
+            self._save_index()
+            print(f"Model cache: demoted {demoted} models to cold tier")
+        return demoted
+
+    def schedule_maintenance(self):
+        """Jalankan maintain() di background thread (kompresi tidak memblok UI)."""
+        if self._maintenance is not None and self._maintenance.is_alive():
+            return
+        self._maintenance = threading.Thread(target=self.maintain, daemon=True)
+        self._maintenance.start()
+
+    def get_statistics(self):
+        """Get ukuran dan jumlah entry per tier."""
+        with self._lock:
+            entries = list(self.index['entries'].values())
+        hot = [e for e in entries if e['tier'] == 'hot']
+        cold = [e for e in entries if e['tier'] == 'cold']
+        return {
+            'hot_count': len(hot),
+            'hot_mb': round(sum(e['size'] for e in hot) / (1024 * 1024), 2),
+            'cold_count': len(cold),
+            'cold_mb': round(sum(e.get('compressed_size', e['size']) for e in cold) / (1024 * 1024), 2),
+            'original_cold_mb': round(sum(e['size'] for e in cold) / (1024 * 1024), 2),
+        }
+
+
+# Global model cache instance
+_model_cache_instance = None
+
+
+def get_model_cache(hot_limit_mb=None, codec=None):
+    """Get global model cache instance (setting diperbarui jika diberikan)."""
+    global _model_cache_instance
+    if _model_cache_instance is None:
+        _model_cache_instance = ModelCache()
+    if hot_limit_mb is not None:
+        _model_cache_instance.hot_limit_mb = hot_limit_mb
+    if codec in CODECS:
+        _model_cache_instance.codec = codec
+    return _model_cache_instance
@@ -0,0 +1,106 @@
+"""
+Model Instancing
+
+Addon ini hanya bertindak sebagai client untuk layanan AI 3D pihak ketiga.
+User harus mendaftar dan menyediakan API key sendiri.
+
+Linked-duplicate instancing untuk model yang di-import berulang kali.
+Mesh hasil import dicatat per content hash file model. Import berikutnya
+dengan hash yang sama membuat object ringan yang memakai mesh data yang
+sama, tanpa copy mesh, material, atau image.
+"""
+
+import bpy
+import hashlib
+
+
+# Custom property pada object hasil import
+PROP_CONTENT_HASH = "ai3d_content_hash"
+PROP_INSTANCE_SOURCE = "ai3d_instance_source"
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Index per session: content hash -> nama object sumber
+_source_index = {}
+
+
+def file_content_hash(filepath: str) -> str:
+    """Hitung SHA-256 isi file secara streaming."""
+    digest = hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def register_source(content_hash: str, objects):
+    """
+    Catat object hasil import sebagai sumber instancing untuk content hash.
+
+    Jika hash sudah punya sumber yang masih ada, object baru hanya ditandai
+    dengan hash-nya (mis. unique copy) dan sumber lama tetap dipakai.
+    """
+    mesh_objects = [obj for obj in objects if obj.type == 'MESH']
+    for obj in mesh_objects:
+        obj[PROP_CONTENT_HASH] = content_hash
+
+    if find_sources(content_hash):
+        return
+
+    for obj in mesh_objects:
+        obj[PROP_INSTANCE_SOURCE] = True
+    _source_index[content_hash] = [obj.name for obj in mesh_objects]
+
+
+def find_sources(content_hash: str) -> list:
+    """
+    Cari object sumber untuk content hash.
+
+    Index session dipakai lebih dulu, lalu fallback scan custom property
+    supaya tetap bekerja setelah .blend dibuka ulang.
+    """
+    names = _source_index.get(content_hash)
+    if names:
+        sources = [bpy.data.objects.get(name) for name in names]
+        if all(obj is not None and obj.get(PROP_CONTENT_HASH) == content_hash for obj in sources):
+            return sources
+
+    sources = [
+        obj for obj in bpy.data.objects
+        if obj.get(PROP_CONTENT_HASH) == content_hash and obj.get(PROP_INSTANCE_SOURCE)
+    ]
+    if sources:
+        _source_index[content_hash] = [obj.name for obj in sources]
+    else:
+        _source_index.pop(content_hash, None)
+    return sources
+
+
+def instance_model(content_hash: str, object_name: str) -> list:
+    """
+    Buat linked duplicate dari model yang sudah pernah di-import.
+
+    Args:
+        content_hash: Content hash file model
+        object_name: Nama untuk object utama
+
+    Returns:
+        List object baru, atau list kosong jika belum ada sumber
+    """
+    sources = find_sources(content_hash)
+    if not sources:
+        return []
+
+    collection = bpy.context.collection or bpy.context.scene.collection
+    instances = []
+    for source in sources:
+        instance = source.copy()  # Object baru, mesh data tetap di-share
+        instance.parent = None
+        instance.matrix_world = source.matrix_world.copy()
+        del instance[PROP_INSTANCE_SOURCE]
+        collection.objects.link(instance)
+        instances.append(instance)
+
+    instances[0].name = object_name
+    print(f"Instanced {len(instances)} objects from cached model as: {object_name}")
+    return instances
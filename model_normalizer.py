@@ -0,0 +1,147 @@
+"""
+Model Normalizer
+
+Addon ini hanya bertindak sebagai client untuk layanan AI 3D pihak ketiga.
+User harus mendaftar dan menyediakan API key sendiri.
+
+Normalisasi model setelah import: skala ke ukuran target, alignment ke
+ground plane, centering, dan penempatan origin. Bounds dihitung dari semua
+vertex lewat foreach_get + NumPy dan transform diterapkan langsung ke
+matrix object, tanpa bpy.ops per object.
+"""
+
+import bpy
+import numpy as np
+from mathutils import Matrix
+
+
+ORIGIN_MODES = ('NONE', 'BOTTOM', 'CENTER')
+
+
+def _local_coords(obj):
+    """Baca koordinat lokal vertex/point object sebagai array (N, 3)."""
+    data = obj.data
+    if obj.type == 'MESH':
+        coords = np.empty(len(data.vertices) * 3, dtype=np.float32)
+        data.vertices.foreach_get('co', coords)
+        return coords.reshape(-1, 3)
+    if obj.type == 'POINTCLOUD':
+        coords = np.empty(len(data.points) * 3, dtype=np.float32)
+        data.attributes['position'].data.foreach_get('vector', coords)
+        return coords.reshape(-1, 3)
+    return None
+
+
+def _set_local_coords(obj, coords):
+    """Tulis koordinat lokal vertex/point object."""
+    flat = np.ascontiguousarray(coords, dtype=np.float32).ravel()
+    if obj.type == 'MESH':
+        obj.data.vertices.foreach_set('co', flat)
+    else:
+        obj.data.attributes['position'].data.foreach_set('vector', flat)
+    obj.data.update()
+
+
+def _to_world(coords, matrix):
+    """Transform koordinat (N, 3) dengan matrix 4x4."""
+    return coords @ matrix[:3, :3].T + matrix[:3, 3]
+
+
+def compute_bounds(objects):
+    """
+    Hitung bounds world gabungan dari semua vertex object.
+
+    Returns:
+        Tuple (min, max) sebagai array (3,), atau None jika tidak ada geometry
+    """
+    mins, maxs = [], []
+    for obj in objects:
+        coords = _local_coords(obj)
+        if coords is None or not len(coords):
+            continue
+        world = _to_world(coords, np.array(obj.matrix_world, dtype=np.float64))
+        mins.append(world.min(axis=0))
+        maxs.append(world.max(axis=0))
+
+    if not mins:
+        return None
+    return np.min(mins, axis=0), np.max(maxs, axis=0)
+
+
+def _place_origin(objects, origin: str) -> int:
+    """Pindahkan origin object ke bawah/tengah bounds lokalnya."""
+    moved = 0
+    for obj in objects:
+        # Mesh yang di-share (linked duplicate) akan ikut bergeser di object lain
+        if obj.data is None or obj.data.users > 1 or obj.children:
+            continue
+        coords = _local_coords(obj)
+        if coords is None or not len(coords):
+            continue
+
+        low, high = coords.min(axis=0), coords.max(axis=0)
+        offset = (low + high) / 2.0
+        if origin == 'BOTTOM':
+            offset[2] = low[2]
+
+        _set_local_coords(obj, coords - offset)
+        obj.matrix_basis = obj.matrix_basis @ Matrix.Translation(offset.tolist())
+        moved += 1
+    return moved
+
+
+def normalize_objects(objects, target_size: float = 0.0, ground: bool = True,
+                      center: bool = True, origin: str = 'NONE') -> dict:
+    """
+    Normalisasi skala dan posisi model hasil import.
+
+    Model diperlakukan sebagai satu kesatuan: transform hanya diterapkan ke
+    object root (yang parent-nya bukan bagian model), child ikut bergerak.
+
+    Args:
+        objects: Object hasil import
+        target_size: Dimensi terbesar model setelah normalisasi (0 = skala tetap)
+        ground: Geser model supaya titik terendah di Z = 0
+        center: Geser model supaya pusat bounds XY di origin world
+        origin: 'NONE', 'BOTTOM' (bawah-tengah), atau 'CENTER' untuk origin object
+
+    Returns:
+        Dict dengan 'scale', 'offset', 'dimensions', atau None jika tidak ada geometry
+    """
+    objects = list(objects)
+    bounds = compute_bounds(objects)
+    if bounds is None:
+        return None
+
+    low, high = bounds
+    dimensions = high - low
+    largest = float(dimensions.max())
+    scale = target_size / largest if target_size > 0 and largest > 0 else 1.0
+
+    # Pivot skala = titik bawah-tengah bounds; pivot dipindah ke target
+    pivot = np.array([(low[0] + high[0]) / 2.0, (low[1] + high[1]) / 2.0, low[2]])
+    target = pivot.copy()
+    if center:
+        target[:2] = 0.0
+    if ground:
+        target[2] = 0.0
+
+    transform = np.identity(4)
+    transform[:3, :3] *= scale
+    transform[:3, 3] = target - scale * pivot
+
+    if scale != 1.0 or not np.allclose(target, pivot):
+        members = set(objects)
+        for obj in objects:
+            if obj.parent not in members:
+                world = np.array(obj.matrix_world, dtype=np.float64)
+                obj.matrix_world = Matrix((transform @ world).tolist())
+
+    if origin in ORIGIN_MODES and origin != 'NONE':
+        _place_origin(objects, origin)
+
+    return {
+        'scale': scale,
+        'offset': (target - scale * pivot).tolist(),
+        'dimensions': (dimensions * scale).tolist(),
+    }
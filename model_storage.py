@@ -0,0 +1,197 @@
+"""
+External Model Storage
+
+Addon ini hanya bertindak sebagai client untuk layanan AI 3D pihak ketiga.
+User harus mendaftar dan menyediakan API key sendiri.
+
+Simpan setiap model hasil import di file .blend sendiri di folder user
+addon, lalu ganti data lokal dengan referensi ter-link (instance collection
+atau library override). File kerja tetap kecil dan cepat dibuka; model bisa
+di-load dan di-unload sesuai kebutuhan.
+"""
+
+import bpy
+import re
+from pathlib import Path
+
+
+# Custom property penanda handle model tersimpan (instance empty atau override collection)
+PROP_STORAGE_PATH = "ai3d_storage_path"
+PROP_STORAGE_COLLECTION = "ai3d_storage_collection"
+
+# Panjang maksimum bagian nama file dari nama object (nama object berasal dari prompt)
+MAX_NAME_LENGTH = 64
+
+
+def get_storage_dir():
+    """Get folder penyimpanan .blend per model."""
+    storage_dir = Path(bpy.utils.resource_path('USER')) / 'ai_3d_generator' / 'model_storage'
+    storage_dir.mkdir(parents=True, exist_ok=True)
+    return storage_dir
+
+
+def _storage_path(object_name: str, content_hash: str = None) -> Path:
+    """Path .blend untuk satu model."""
+    safe_name = re.sub(r'[^\w.-]+', '_', object_name)[:MAX_NAME_LENGTH] or 'model'
+    suffix = f"_{content_hash[:12]}" if content_hash else ''
+    return get_storage_dir() / f"{safe_name}{suffix}.blend"
+
+
+def _remove_local(objects, collection):
+    """Lepas object dari scene dan hapus datablock yang tidak dipakai lagi."""
+    data_blocks = {obj.data for obj in objects if obj.data is not None}
+
+    for obj in objects:
+        for user_collection in list(obj.users_collection):
+            # Collection asset (mis. asset library yang belum di-flush) tetap memegang object
+            if user_collection.asset_data is not None:
+                continue
+            user_collection.objects.unlink(obj)
+
+    # Object yang masih dipakai collection asset dibiarkan
+    bpy.data.batch_remove([obj for obj in objects if obj.users == 0])
+    bpy.data.batch_remove([data for data in data_blocks if data.users == 0])
+    bpy.data.collections.remove(collection)
+
+
+def store_model(objects, object_name: str, content_hash: str = None,
+                lod_collection=None, override: bool = False):
+    """
+    Simpan model ke .blend sendiri dan ganti dengan referensi ter-link.
+
+    Args:
+        objects: Object hasil import
+        object_name: Nama model (dipakai untuk nama file dan collection)
+        content_hash: Hash file model sumber untuk nama file yang unik
+        lod_collection: Collection LOD yang ikut disimpan
+        override: Buat library override (bisa diedit) alih-alih instance
+
+    Returns:
+        Path .blend yang ditulis
+    """
+    collection = bpy.data.collections.new(object_name)
+    for obj in objects:
+        collection.objects.link(obj)
+
+    if lod_collection is not None:
+        collection.children.link(lod_collection)
+        for parent in [bpy.context.scene.collection] + list(bpy.data.collections):
+            if parent != collection and lod_collection.name in parent.children:
+                parent.children.unlink(lod_collection)
+
+    blend_path = _storage_path(object_name, content_hash)
+    bpy.data.libraries.write(str(blend_path), {collection}, fake_user=True, compress=True)
+    collection_name = collection.name
+
+    lod_objects = list(lod_collection.objects) if lod_collection is not None else []
+    _remove_local(list(objects) + lod_objects, collection)
+    if lod_collection is not None and lod_collection.users == 0:
+        bpy.data.collections.remove(lod_collection)
+
+    load_stored_model(str(blend_path), collection_name, override=override)
+    print(f"Stored model externally: {blend_path}")
+    return str(blend_path)
+
+
+def load_stored_model(blend_path: str, collection_name: str = None, override: bool = False):
+    """
+    Link model tersimpan ke scene aktif.
+
+    Args:
+        blend_path: Path .blend model
+        collection_name: Nama collection (default: collection pertama di file)
+        override: Buat library override alih-alih instance empty
+
+    Returns:
+        Handle (instance empty atau override collection), None jika tidak ada
+    """
+    with bpy.data.libraries.load(blend_path, link=True) as (data_from, data_to):
+        names = data_from.collections
+        if collection_name is None and names:
+            collection_name = names[0]
+        if collection_name not in names:
+            return None
+        data_to.collections = [collection_name]
+
+    collection = data_to.collections[0]
+    context = bpy.context
+    handle = None
+
+    if override:
+        try:
+            handle = collection.override_hierarchy_create(context.scene, context.view_layer)
+        except (AttributeError, TypeError, RuntimeError) as e:
+            print(f"Library override failed, using instance: {str(e)}")
+
+    if handle is None:
+        handle = bpy.data.objects.new(collection.name, None)
+        handle.instance_type = 'COLLECTION'
+        handle.instance_collection = collection
+        context.scene.collection.objects.link(handle)
+
+    handle[PROP_STORAGE_PATH] = blend_path
+    handle[PROP_STORAGE_COLLECTION] = collection_name
+    return handle
+
+
+def find_stored_handles(blend_path: str = None):
+    """Cari semua handle model tersimpan di file kerja (opsional per file)."""
+    handles = []
+    for datablocks in (bpy.data.objects, bpy.data.collections):
+        for datablock in datablocks:
+            path = datablock.get(PROP_STORAGE_PATH)
+            if path and (blend_path is None or path == blend_path):
+                handles.append(datablock)
+    return handles
+
+
+def _library_for(blend_path: str):
+    """Cari library datablock untuk path .blend."""
+    target = Path(blend_path).resolve()
+    for library in bpy.data.libraries:
+        if Path(bpy.path.abspath(library.filepath)).resolve() == target:
+            return library
+    return None
+
+
+def unload_stored_model(handle) -> bool:
+    """
+    Hapus referensi model tersimpan dari file kerja.
+
+    Library ikut dilepas jika tidak ada handle lain yang memakainya.
+
+    Returns:
+        True jika handle dihapus
+    """
+    blend_path = handle.get(PROP_STORAGE_PATH)
+    if not blend_path:
+        return False
+
+    if isinstance(handle, bpy.types.Collection):
+        # Override hierarchy: hapus object dan child collection lokal
+        for child in list(handle.children_recursive):
+            for obj in list(child.objects):
+                bpy.data.objects.remove(obj)
+            bpy.data.collections.remove(child)
+        for obj in list(handle.objects):
+            bpy.data.objects.remove(obj)
+        bpy.data.collections.remove(handle)
+    else:
+        bpy.data.objects.remove(handle)
+
+    if not find_stored_handles(blend_path):
+        library = _library_for(blend_path)
+        if library is not None:
+            bpy.data.libraries.remove(library)
+
+    return True
+
+
+def handle_for_object(obj):
+    """Get handle model tersimpan untuk object (instance atau bagian override)."""
+    if obj.get(PROP_STORAGE_PATH):
+        return obj
+    for collection in obj.users_collection:
+        if collection.get(PROP_STORAGE_PATH):
+            return collection
+    return None
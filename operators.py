@@ -9,12 +9,18 @@ Operators untuk generate text-to-3D, image-to-3D, test connection, dan polling s
 
 import bpy
 from bpy.types import Operator
-from bpy.props import StringProperty
+from bpy.props import StringProperty, BoolProperty
 import os
 import tempfile
 
-from .providers import TripoClient, MeshyClient, ModelsLabClient
-from .downloader import download_and_import_model
+from .providers import TripoClient, MeshyClient, ModelsLabClient, negotiate_variant
+from .downloader import download_and_import_model, get_import_settings
+from .texture_optimizer import restore_all_textures
+from .history import get_history
+from .model_storage import (
+    get_storage_dir, load_stored_model, unload_stored_model,
+    find_stored_handles, handle_for_object,
+)
 
 
 def get_provider_client(context):
@@ -56,6 +62,58 @@ def get_provider_client(context):
     return None
 
 
+def select_model_output(result, scene):
+    """Pilih URL model dan format import dari hasil poll_status.
+    
+    Jika provider mengembalikan beberapa output variant, variant dengan
+    estimasi download + import tercepat untuk ai3d_output_format dipilih.
+    
+    Returns:
+        Tuple (model_url, import_type), model_url None jika tidak ada
+    """
+    requested = scene.ai3d_output_format.lower()
+    variant = negotiate_variant(result.get('model_variants') or [], requested)
+    if variant:
+        return variant['url'], variant['format']
+    return result.get('model_url'), requested
+
+
+def generation_metadata(scene):
+    """Metadata generation aktif untuk asset library.
+    
+    Diambil dari history entry job saat ini jika ada, dengan fallback ke
+    setting scene.
+    """
+    job_id = scene.ai3d_current_job_id
+    entry = get_history().get_generation(job_id) if job_id else None
+    if entry:
+        keys = ('provider', 'type', 'prompt', 'style', 'quality', 'job_id')
+        return {key: entry.get(key) for key in keys if entry.get(key) not in (None, '')}
+    return {
+        'provider': scene.ai3d_provider,
+        'type': scene.ai3d_generation_type,
+        'prompt': scene.ai3d_prompt,
+        'style': scene.ai3d_style,
+        'quality': scene.ai3d_quality,
+        'job_id': job_id,
+    }
+
+
+def record_generation(scene, job_id, gen_type, style, output_format):
+    """Catat job generasi baru di history."""
+    get_history().add_generation({
+        'provider': scene.ai3d_provider,
+        'type': gen_type,
+        'prompt': scene.ai3d_prompt if gen_type == 'text' else '',
+        'image_path': scene.ai3d_image_path if gen_type == 'image' else '',
+        'style': style,
+        'quality': scene.ai3d_quality,
+        'format': output_format,
+        'job_id': job_id,
+        'status': 'pending',
+    })
+
+
 class AI3DGenerateText(Operator):
     """Generate 3D model dari text prompt."""
     
@@ -110,6 +168,7 @@ class AI3DGenerateText(Operator):
             'OBJ': 'obj',
             'FBX': 'fbx',
             'STL': 'stl',
+            'PLY': 'ply',
         }
         output_format = format_map.get(scene.ai3d_output_format, 'glb')
         
@@ -133,6 +192,7 @@ class AI3DGenerateText(Operator):
         # Store job info
         scene.ai3d_current_job_id = result['job_id']
         scene.ai3d_generation_type = 'text'
+        record_generation(scene, result['job_id'], 'text', style, output_format)
         
         self.report({'INFO'}, f"Generation started (Job ID: {result['job_id'][-12:]})")
         
@@ -160,21 +220,27 @@ class AI3DGenerateText(Operator):
         
         status = result.get('status', 'unknown')
         
+        if status == 'completed' and result.get('sizes_pending'):
+            # Ukuran variant masih di-probe di background; pilih variant di poll berikutnya
+            return {'PASS_THROUGH'}
+        
         if status == 'completed':
-            model_url = result.get('model_url')
+            model_url, import_type = select_model_output(result, scene)
+            get_history().update_generation(job_id, 'completed', model_url=model_url or '')
             if model_url:
                 # Download and import
-                self._download_and_import(context, model_url)
+                self._download_and_import(context, model_url, import_type)
             return {'FINISHED'}
         elif status == 'failed' or status == 'error':
             error = result.get('error', 'Unknown error')
+            get_history().update_generation(job_id, 'failed', error=error)
             print(f"Generation failed: {error}")
             return {'FINISHED'}
         
         # Continue polling
         return {'PASS_THROUGH'}
     
-    def _download_and_import(self, context, model_url):
+    def _download_and_import(self, context, model_url, import_type):
         """Download model and import to Blender."""
         try:
             scene = context.scene
@@ -186,13 +252,16 @@ class AI3DGenerateText(Operator):
                 'OBJ': '.obj',
                 'FBX': '.fbx',
                 'STL': '.stl',
+                'PLY': '.ply',
             }
             ext = format_ext.get(scene.ai3d_output_format, '.glb')
             
             download_and_import_model(
                 model_url=model_url,
-                import_type=scene.ai3d_output_format.lower(),
-                object_name=f"{provider}_{prompt}"
+                import_type=import_type,
+                object_name=f"{provider}_{prompt}",
+                settings=get_import_settings(scene),
+                metadata=generation_metadata(scene)
             )
             
             print(f"Model imported successfully")
@@ -242,6 +311,7 @@ class AI3DGenerateImage(Operator):
             'OBJ': 'obj',
             'FBX': 'fbx',
             'STL': 'stl',
+            'PLY': 'ply',
         }
         output_format = format_map.get(scene.ai3d_output_format, 'glb')
         
@@ -266,6 +336,7 @@ class AI3DGenerateImage(Operator):
         # Store job info
         scene.ai3d_current_job_id = result['job_id']
         scene.ai3d_generation_type = 'image'
+        record_generation(scene, result['job_id'], 'image', style, output_format)
         
         self.report({'INFO'}, f"Generation started (Job ID: {result['job_id'][-12:]})")
         
@@ -293,21 +364,27 @@ class AI3DGenerateImage(Operator):
         
         status = result.get('status', 'unknown')
         
+        if status == 'completed' and result.get('sizes_pending'):
+            # Ukuran variant masih di-probe di background; pilih variant di poll berikutnya
+            return {'PASS_THROUGH'}
+        
         if status == 'completed':
-            model_url = result.get('model_url')
+            model_url, import_type = select_model_output(result, scene)
+            get_history().update_generation(job_id, 'completed', model_url=model_url or '')
             if model_url:
                 # Download and import
-                self._download_and_import(context, model_url)
+                self._download_and_import(context, model_url, import_type)
             return {'FINISHED'}
         elif status == 'failed' or status == 'error':
             error = result.get('error', 'Unknown error')
+            get_history().update_generation(job_id, 'failed', error=error)
             print(f"Generation failed: {error}")
             return {'FINISHED'}
         
         # Continue polling
         return {'PASS_THROUGH'}
     
-    def _download_and_import(self, context, model_url):
+    def _download_and_import(self, context, model_url, import_type):
         """Download model and import to Blender."""
         try:
             scene = context.scene
@@ -316,8 +393,10 @@ class AI3DGenerateImage(Operator):
             
             download_and_import_model(
                 model_url=model_url,
-                import_type=scene.ai3d_output_format.lower(),
-                object_name=f"{provider}_{image_name}"
+                import_type=import_type,
+                object_name=f"{provider}_{image_name}",
+                settings=get_import_settings(scene),
+                metadata=generation_metadata(scene)
             )
             
             print(f"Model imported successfully")
@@ -377,22 +456,26 @@ class AI3DCheckStatus(Operator):
         result = client.poll_status(job_id)
         status = result.get('status', 'unknown')
         
-        if status == 'completed':
+        if status == 'completed' and result.get('sizes_pending'):
+            self.report({'INFO'}, "Generation completed! Checking download sizes, check again in a moment")
+        elif status == 'completed':
             self.report({'INFO'}, "Generation completed! Importing model...")
-            model_url = result.get('model_url')
+            model_url, import_type = select_model_output(result, scene)
+            get_history().update_generation(job_id, 'completed', model_url=model_url or '')
             if model_url:
-                self._download_and_import(context, model_url)
+                self._download_and_import(context, model_url, import_type)
         elif status == 'pending' or status == 'processing':
             self.report({'INFO'}, f"Generation in progress... ({status})")
         elif status == 'failed' or status == 'error':
             error = result.get('error', 'Unknown error')
+            get_history().update_generation(job_id, 'failed', error=error)
             self.report({'ERROR'}, f"Generation failed: {error}")
         else:
             self.report({'INFO'}, f"Status: {status}")
         
         return {'FINISHED'}
     
-    def _download_and_import(self, context, model_url):
+    def _download_and_import(self, context, model_url, import_type):
         """Download model and import to Blender."""
         try:
             scene = context.scene
@@ -406,8 +489,10 @@ class AI3DCheckStatus(Operator):
             
             download_and_import_model(
                 model_url=model_url,
-                import_type=scene.ai3d_output_format.lower(),
-                object_name=f"{provider}_{name}"
+                import_type=import_type,
+                object_name=f"{provider}_{name}",
+                settings=get_import_settings(scene),
+                metadata=generation_metadata(scene)
             )
             
             print(f"Model imported successfully")
@@ -513,6 +598,86 @@ class AI3DValidateAPIKey(Operator):
         return {'FINISHED'}
 
 
+class AI3DRestoreTextures(Operator):
+    """Restore texture yang di-downscale ke resolusi asli."""
+    
+    bl_idname = "ai3d.restore_textures"
+    bl_label = "Restore Full-Res Textures"
+    bl_description = "Kembalikan semua texture yang di-downscale saat import ke resolusi asli"
+    
+    def execute(self, context):
+        """Execute texture restore."""
+        restored = restore_all_textures()
+        self.report({'INFO'}, f"Restored {restored} textures")
+        return {'FINISHED'}
+
+
+class AI3DLoadStoredModel(Operator):
+    """Link model dari external storage ke scene."""
+    
+    bl_idname = "ai3d.load_stored_model"
+    bl_label = "Load Stored Model"
+    bl_description = "Link model yang disimpan di .blend terpisah ke scene"
+    
+    filepath: StringProperty(subtype='FILE_PATH')
+    filter_glob: StringProperty(default="*.blend", options={'HIDDEN'})
+    override: BoolProperty(
+        name="Library Override",
+        description="Buat library override yang bisa diedit alih-alih instance",
+        default=False
+    )
+    
+    def invoke(self, context, event):
+        """Buka file browser di folder storage."""
+        self.filepath = str(get_storage_dir()) + os.sep
+        self.override = getattr(context.scene, 'ai3d_storage_override', False)
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+    
+    def execute(self, context):
+        """Execute load."""
+        if not os.path.isfile(self.filepath):
+            self.report({'ERROR'}, "Select a stored model .blend file")
+            return {'CANCELLED'}
+        
+        handle = load_stored_model(self.filepath, override=self.override)
+        if handle is None:
+            self.report({'ERROR'}, "No model collection found in file")
+            return {'CANCELLED'}
+        
+        self.report({'INFO'}, f"Loaded: {handle.name}")
+        return {'FINISHED'}
+
+
+class AI3DUnloadStoredModel(Operator):
+    """Lepas model external storage dari scene."""
+    
+    bl_idname = "ai3d.unload_stored_model"
+    bl_label = "Unload Stored Models"
+    bl_description = "Hapus referensi model tersimpan dari file kerja (file .blend model tetap ada)"
+    
+    unload_all: BoolProperty(
+        name="All",
+        description="Unload semua model tersimpan, bukan hanya yang dipilih",
+        default=False
+    )
+    
+    def execute(self, context):
+        """Execute unload."""
+        if self.unload_all:
+            handles = find_stored_handles()
+        else:
+            handles = []
+            for obj in context.selected_objects:
+                handle = handle_for_object(obj)
+                if handle is not None and handle not in handles:
+                    handles.append(handle)
+        
+        unloaded = sum(1 for handle in handles if unload_stored_model(handle))
+        self.report({'INFO'}, f"Unloaded {unloaded} stored models")
+        return {'FINISHED'}
+
+
 def register():
     """Register operators."""
     bpy.utils.register_class(AI3DGenerateText)
@@ -522,6 +687,9 @@ def register():
     bpy.utils.register_class(AI3DCancelGeneration)
     bpy.utils.register_class(AI3DOpenPreferences)
     bpy.utils.register_class(AI3DValidateAPIKey)
+    bpy.utils.register_class(AI3DRestoreTextures)
+    bpy.utils.register_class(AI3DLoadStoredModel)
+    bpy.utils.register_class(AI3DUnloadStoredModel)
 
 
 def unregister():
@@ -533,3 +701,6 @@ def unregister():
     bpy.utils.unregister_class(AI3DCancelGeneration)
     bpy.utils.unregister_class(AI3DOpenPreferences)
     bpy.utils.unregister_class(AI3DValidateAPIKey)
+    bpy.utils.unregister_class(AI3DRestoreTextures)
+    bpy.utils.unregister_class(AI3DLoadStoredModel)
+    bpy.utils.unregister_class(AI3DUnloadStoredModel)
@@ -0,0 +1,377 @@
+"""
+Persistence Layer
+
+Addon ini hanya bertindak sebagai client untuk layanan AI 3D pihak ketiga.
+User harus mendaftar dan menyediakan API key sendiri.
+
+Penyimpanan JSON bersama untuk batch jobs, presets, dan snapshot history.
+Mutasi hanya menandai store sebagai dirty; semua store yang dirty
+diserialisasi sekali per jendela debounce (bpy.app.timers, main thread) dan
+file ditulis di background thread dengan pola temp file + rename, sehingga
+crash di tengah penulisan tidak merusak file lama. Store di-flush sinkron
+saat addon di-unregister dan saat Blender keluar.
+
+Beberapa proses Blender bisa berbagi folder config yang sama: penulisan
+memakai advisory file lock (fcntl/msvcrt), data di memory hanya dimuat
+ulang jika signature file (mtime, size, inode) berubah, dan setiap
+penulisan menggabungkan perubahan lokal per item dengan isi file saat itu
+(merge-on-write) alih-alih menimpa perubahan proses lain.
+"""
+
+import atexit
+import bpy
+import json
+import os
+import tempfile
+import threading
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+
+# Jendela pengumpulan perubahan sebelum file ditulis (detik)
+DEBOUNCE_SECONDS = 2.0
+
+
+def atomic_write(path, payload: str):
+    """Tulis file secara atomic (temp file unik di folder yang sama lalu rename)."""
+    path = str(path)
+    directory, name = os.path.split(path)
+    fd, temp_file = tempfile.mkstemp(prefix=name + '.', suffix='.tmp', dir=directory or None)
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_file, path)
+    except OSError:
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
+        raise
+
+
+def dumps(data) -> str:
+    """Serialisasi JSON ringkas (tanpa indent) untuk file mesin."""
+    return json.dumps(data, separators=(',', ':'))
+
+
+def file_signature(path):
+    """Signature file untuk deteksi perubahan (None jika file tidak ada)."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+def read_json(path, default, label):
+    """Baca file JSON; default jika tidak ada atau rusak."""
+    if not os.path.exists(path):
+        return default
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"Error loading {label}: {str(e)}")
+        return default
+
+
+class FileLock:
+    """
+    Advisory lock antar proses pada file <path>.lock.
+
+    Re-entrant dalam satu proses (thread lain menunggu RLock), sehingga
+    method yang saling memanggil bisa mengambil lock yang sama.
+    """
+
+    def __init__(self, lock_path):
+        self.lock_path = lock_path
+        self._rlock = threading.RLock()
+        self._depth = 0
+        self._fd = None
+
+    def __enter__(self):
+        self._rlock.acquire()
+        if self._depth == 0:
+            try:
+                self._fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+                if fcntl is not None:
+                    fcntl.flock(self._fd, fcntl.LOCK_EX)
+                elif msvcrt is not None:
+                    while True:
+                        try:
+                            msvcrt.locking(self._fd, msvcrt.LK_LOCK, 1)
+                            break
+                        except OSError:
+                            # LK_LOCK menyerah setelah ~10 detik; coba lagi
+                            continue
+            except Exception:
+                if self._fd is not None:
+                    os.close(self._fd)
+                    self._fd = None
+                self._rlock.release()
+                raise
+        self._depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._depth -= 1
+        if self._depth == 0:
+            try:
+                if fcntl is not None:
+                    fcntl.flock(self._fd, fcntl.LOCK_UN)
+                elif msvcrt is not None:
+                    os.lseek(self._fd, 0, os.SEEK_SET)
+                    msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+            finally:
+                os.close(self._fd)
+                self._fd = None
+        self._rlock.release()
+        return False
+
+
+_file_locks = {}
+_file_locks_guard = threading.Lock()
+
+
+def file_lock(path) -> FileLock:
+    """Get FileLock bersama untuk file (satu instance per path per proses)."""
+    lock_path = f"{path}.lock"
+    with _file_locks_guard:
+        if lock_path not in _file_locks:
+            _file_locks[lock_path] = FileLock(lock_path)
+        return _file_locks[lock_path]
+
+
+def _new_changes():
+    """Set perubahan lokal sejak penulisan terakhir."""
+    return {'keys': set(), 'removed': set(), 'all': False}
+
+
+def _merge_changes(target, changes):
+    """Gabungkan set perubahan (untuk payload yang belum sempat ditulis)."""
+    target['all'] = target['all'] or changes['all']
+    target['keys'] = (target['keys'] - changes['removed']) | changes['keys']
+    target['removed'] = (target['removed'] - changes['keys']) | changes['removed']
+    return target
+
+
+def keyed_merge(lists):
+    """
+    Buat fungsi merge untuk data berisi list item ber-ID.
+
+    Data di disk jadi dasar; item yang diubah lokal menimpa versi disk,
+    item yang dihapus lokal dibuang, dan item baru lokal ditambahkan.
+    Item yang tidak disentuh lokal selalu diambil dari disk.
+
+    Args:
+        lists (dict): Nama list -> field ID item, mis. {'jobs': 'job_id'}
+    """
+    def merge(disk, local, changes):
+        merged = dict(disk)
+        for list_key, id_field in lists.items():
+            local_items = {item[id_field]: item for item in local.get(list_key, [])}
+            items, seen = [], set()
+            for item in disk.get(list_key, []):
+                key = (list_key, item[id_field])
+                seen.add(item[id_field])
+                if key in changes['removed']:
+                    continue
+                if key in changes['keys'] and item[id_field] in local_items:
+                    item = local_items[item[id_field]]
+                items.append(item)
+            for item_id, item in local_items.items():
+                if item_id not in seen and (list_key, item_id) in changes['keys']:
+                    items.append(item)
+            merged[list_key] = items
+        return merged
+    return merge
+
+
+class JSONStore:
+    """Satu file JSON yang ditulis dengan debounce, atomic rename, dan merge antar proses."""
+
+    def __init__(self, path, get_data, label, merge=None):
+        """Initialize store.
+
+        Args:
+            path (Path): File JSON
+            get_data (callable): Mengembalikan data terbaru untuk disimpan
+            label (str): Nama store untuk pesan error
+            merge (callable): merge(disk, local, changes) dari keyed_merge();
+                None = data lokal selalu menimpa file
+        """
+        self.path = path
+        self.label = label
+        self._get_data = get_data
+        self._merge = merge
+        self._dirty = False
+        self._changes = _new_changes()
+        self._payload = None
+        self._writer = None
+        self._signature = None
+        self._reloaded = None
+        self._lock = threading.Lock()
+
+    def load(self, default):
+        """Baca file (dengan file lock) dan catat signature-nya."""
+        with file_lock(self.path):
+            data = read_json(self.path, default, self.label)
+            with self._lock:
+                self._signature = file_signature(self.path)
+        return data
+
+    def mark_dirty(self, key=None, removed=False):
+        """Tandai data berubah; file ditulis pada flush berikutnya.
+
+        Args:
+            key (tuple): (nama list, ID item) yang berubah; None = seluruh data
+            removed (bool): Item dihapus
+        """
+        if key is None:
+            self._changes['all'] = True
+        elif removed:
+            self._changes['removed'].add(key)
+            self._changes['keys'].discard(key)
+        else:
+            self._changes['keys'].add(key)
+            self._changes['removed'].discard(key)
+        self._dirty = True
+        _schedule_flush()
+
+    def refresh(self):
+        """
+        Ambil perubahan proses lain jika file berubah (cek signature, murah).
+
+        Returns:
+            Data baru (sudah digabung dengan perubahan lokal yang belum
+            ditulis), atau None jika tidak ada perubahan
+        """
+        with self._lock:
+            if self._payload is not None:
+                # Penulisan berikutnya akan merge; reload setelah itu
+                return None
+            disk, self._reloaded = self._reloaded, None
+            signature = self._signature
+        if disk is None:
+            if file_signature(self.path) == signature:
+                return None
+            disk = self.load(None)
+            if disk is None:
+                return None
+        if not self._dirty:
+            return disk
+        if self._merge is not None and not self._changes['all']:
+            return self._merge(disk, self._get_data(), self._changes)
+        return None
+
+    def flush(self, wait=False):
+        """Serialisasi data jika dirty dan tulis di background thread.
+
+        Args:
+            wait (bool): Tunggu sampai penulisan selesai
+        """
+        if self._dirty:
+            self._dirty = False
+            changes, self._changes = self._changes, _new_changes()
+            try:
+                payload = dumps(self._get_data())
+            except Exception as e:
+                print(f"Error serializing {self.label}: {str(e)}")
+                payload = None
+            if payload is not None:
+                with self._lock:
+                    if self._payload is not None:
+                        changes = _merge_changes(self._payload[1], changes)
+                    self._payload = (payload, changes)
+                    if self._writer is None:
+                        self._writer = threading.Thread(target=self._write_pending, daemon=True)
+                        self._writer.start()
+
+        with self._lock:
+            writer = self._writer
+        if wait and writer is not None:
+            writer.join()
+
+    def _write_pending(self):
+        """Thread penulis: tulis payload terbaru sampai tidak ada yang tersisa."""
+        while True:
+            with self._lock:
+                pending, self._payload = self._payload, None
+                if pending is None:
+                    self._writer = None
+                    return
+            payload, changes = pending
+            try:
+                self._write(payload, changes)
+            except OSError as e:
+                print(f"Error saving {self.label}: {str(e)}")
+
+    def _write(self, payload, changes):
+        """Tulis payload di bawah file lock, digabung dengan isi file saat ini."""
+        with file_lock(self.path):
+            merged = None
+            if self._merge is not None and not changes['all']:
+                disk = read_json(self.path, None, self.label)
+                if disk is not None:
+                    local = json.loads(payload)
+                    merged = self._merge(disk, local, changes)
+                    if merged == local:
+                        merged = None
+                    else:
+                        payload = dumps(merged)
+            atomic_write(self.path, payload)
+            with self._lock:
+                self._signature = file_signature(self.path)
+                if merged is not None:
+                    self._reloaded = merged
+
+
+# Semua store yang terdaftar
+_stores = []
+
+
+def register_store(path, get_data, label, merge=None) -> JSONStore:
+    """Buat dan daftarkan store untuk di-flush oleh timer dan saat exit."""
+    store = JSONStore(path, get_data, label, merge)
+    _stores.append(store)
+    return store
+
+
+def _flush_timer():
+    """Timer debounce: flush semua store yang dirty."""
+    for store in list(_stores):
+        store.flush()
+    return None
+
+
+def _schedule_flush():
+    """Daftarkan timer debounce jika belum ada."""
+    try:
+        if not bpy.app.timers.is_registered(_flush_timer):
+            bpy.app.timers.register(_flush_timer, first_interval=DEBOUNCE_SECONDS, persistent=True)
+    except Exception:
+        # Timer tidak tersedia (mis. Blender sedang shutdown): tulis sinkron
+        for store in list(_stores):
+            store.flush(wait=True)
+
+
+def flush_all():
+    """Tulis semua store yang dirty dan tunggu sampai selesai (unregister/exit)."""
+    try:
+        if bpy.app.timers.is_registered(_flush_timer):
+            bpy.app.timers.unregister(_flush_timer)
+    except Exception:
+        pass
+    for store in list(_stores):
+        store.flush(wait=True)
+
+
+atexit.register(flush_all)
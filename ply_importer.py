@@ -0,0 +1,219 @@
+"""
+PLY / Gaussian Splat Importer
+
+Addon ini hanya bertindak sebagai client untuk layanan AI 3D pihak ketiga.
+User harus mendaftar dan menyediakan API key sendiri.
+
+Importer vectorized untuk point cloud dan Gaussian splat PLY.
+Data vertex binary di-memory-map sebagai NumPy structured array, lalu
+posisi, scale, rotation, opacity dan warna (SH DC) ditulis sekaligus
+sebagai point cloud mesh dengan attribute per point.
+"""
+
+import bpy
+import mmap
+
+import numpy as np
+
+
+# Mapping tipe property PLY ke NumPy
+PLY_TYPES = {
+    'char': 'i1', 'int8': 'i1',
+    'uchar': 'u1', 'uint8': 'u1',
+    'short': 'i2', 'int16': 'i2',
+    'ushort': 'u2', 'uint16': 'u2',
+    'int': 'i4', 'int32': 'i4',
+    'uint': 'u4', 'uint32': 'u4',
+    'float': 'f4', 'float32': 'f4',
+    'double': 'f8', 'float64': 'f8',
+}
+
+# Koefisien SH band 0 untuk konversi f_dc ke warna
+SH_C0 = 0.28209479177387814
+
+DEFAULT_POINT_BUDGET = 0
+
+# Nama attribute mesh untuk setiap data splat
+SPLAT_ATTRIBUTE_NAMES = {
+    'scale': 'splat_scale',
+    'rotation': 'splat_rotation',
+    'opacity': 'splat_opacity',
+    'color': 'Color',
+}
+
+
+def read_ply_header(mm):
+    """
+    Parse header PLY.
+
+    Returns:
+        Tuple (format, elements, data_offset). elements adalah list
+        (name, count, properties) dengan properties list (name, dtype).
+
+    Raises:
+        ValueError: Jika header tidak valid
+    """
+    end = mm.find(b'end_header')
+    if not mm[:3] == b'ply' or end < 0:
+        raise ValueError("Not a PLY file")
+    data_offset = mm.find(b'\n', end) + 1
+
+    ply_format = None
+    elements = []
+    for raw_line in mm[:end].split(b'\n'):
+        parts = raw_line.strip().decode('ascii', 'replace').split()
+        if not parts:
+            continue
+        if parts[0] == 'format':
+            ply_format = parts[1]
+        elif parts[0] == 'element':
+            elements.append((parts[1], int(parts[2]), []))
+        elif parts[0] == 'property' and elements:
+            if parts[1] == 'list':
+                elements[-1][2].append((parts[4], None))
+            else:
+                elements[-1][2].append((parts[2], PLY_TYPES[parts[1]]))
+
+    return ply_format, elements, data_offset
+
+
+def read_ply_vertices(filepath: str, point_budget: int = DEFAULT_POINT_BUDGET):
+    """
+    Baca element vertex PLY sebagai structured array.
+
+    Args:
+        filepath: Path ke file .ply
+        point_budget: Jumlah point maksimum (0 = semua). Subsample
+            dilakukan dengan stride seragam supaya distribusi tetap rata.
+
+    Returns:
+        NumPy structured array (copy, bukan view ke mmap)
+    """
+    with open(filepath, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            ply_format, elements, offset = read_ply_header(mm)
+            if not elements or elements[0][0] != 'vertex':
+                raise ValueError("PLY file must start with a vertex element")
+
+            name, count, properties = elements[0]
+            if any(dtype is None for _, dtype in properties):
+                raise ValueError("List properties on vertex element are not supported")
+
+            if ply_format == 'ascii':
+                rows = [r.decode('ascii') for r in mm[offset:].split(b'\n', count)[:count]]
+                dtype = np.dtype([(n, t) for n, t in properties])
+                data = np.loadtxt(rows, dtype=dtype, ndmin=1)
+            else:
+                byte_order = '<' if ply_format == 'binary_little_endian' else '>'
+                dtype = np.dtype([(n, byte_order + t) for n, t in properties])
+                data = np.frombuffer(mm, dtype=dtype, count=count, offset=offset)
+
+            if point_budget and count > point_budget:
+                stride = int(np.ceil(count / point_budget))
+                data = data[::stride]
+
+            # Copy keluar dari mmap (sekaligus konversi ke native byte order)
+            result = data.astype(data.dtype.newbyteorder('='))
+            del data
+    return result
+
+
+def _field_stack(data, names):
+    """Stack beberapa field structured array menjadi float32 (N, k)."""
+    return np.stack([data[n].astype(np.float32) for n in names], axis=1)
+
+
+def decode_splats(data) -> dict:
+    """
+    Decode attribute Gaussian splat dari structured array PLY.
+
+    Returns:
+        Dict dengan kunci 'position' dan (jika ada) 'scale', 'rotation',
+        'opacity', 'color'. Scale di-exp, opacity di-sigmoid, rotation
+        dinormalisasi, dan warna dari SH DC atau RGB.
+    """
+    fields = set(data.dtype.names)
+    attributes = {'position': _field_stack(data, ('x', 'y', 'z'))}
+
+    if {'scale_0', 'scale_1', 'scale_2'} <= fields:
+        attributes['scale'] = np.exp(_field_stack(data, ('scale_0', 'scale_1', 'scale_2')))
+
+    if {'rot_0', 'rot_1', 'rot_2', 'rot_3'} <= fields:
+        rotation = _field_stack(data, ('rot_0', 'rot_1', 'rot_2', 'rot_3'))
+        norm = np.linalg.norm(rotation, axis=1, keepdims=True)
+        attributes['rotation'] = rotation / np.maximum(norm, 1e-8)
+
+    if 'opacity' in fields:
+        attributes['opacity'] = 1.0 / (1.0 + np.exp(-data['opacity'].astype(np.float32)))
+
+    if {'f_dc_0', 'f_dc_1', 'f_dc_2'} <= fields:
+        rgb = 0.5 + SH_C0 * _field_stack(data, ('f_dc_0', 'f_dc_1', 'f_dc_2'))
+    elif {'red', 'green', 'blue'} <= fields:
+        rgb = _field_stack(data, ('red', 'green', 'blue'))
+        if data['red'].dtype.kind == 'u':
+            rgb /= np.iinfo(data['red'].dtype).max
+    else:
+        rgb = None
+
+    if rgb is not None:
+        alpha = attributes.get('opacity', np.ones(len(rgb), dtype=np.float32))
+        attributes['color'] = np.column_stack([np.clip(rgb, 0.0, 1.0), alpha])
+
+    return attributes
+
+
+def build_point_cloud(name: str, attributes: dict):
+    """
+    Bangun mesh point cloud (vertex saja) dengan attribute per point.
+
+    Returns:
+        bpy.types.Mesh
+    """
+    mesh = bpy.data.meshes.new(name)
+    positions = attributes['position']
+    mesh.vertices.add(len(positions))
+    mesh.vertices.foreach_set('co', positions.ravel())
+
+    for key, data_type, field in (
+        ('scale', 'FLOAT_VECTOR', 'vector'),
+        ('opacity', 'FLOAT', 'value'),
+        ('color', 'FLOAT_COLOR', 'color'),
+    ):
+        if key in attributes:
+            attribute = mesh.attributes.new(name=SPLAT_ATTRIBUTE_NAMES[key],
+                                            type=data_type, domain='POINT')
+            attribute.data.foreach_set(field, attributes[key].ravel())
+
+    if 'rotation' in attributes:
+        try:
+            attribute = mesh.attributes.new(name=SPLAT_ATTRIBUTE_NAMES['rotation'],
+                                            type='QUATERNION', domain='POINT')
+            field = 'value'
+        except TypeError:
+            # Blender < 4.0 belum punya tipe QUATERNION, simpan sebagai 4 float
+            attribute = mesh.attributes.new(name=SPLAT_ATTRIBUTE_NAMES['rotation'],
+                                            type='FLOAT_COLOR', domain='POINT')
+            field = 'color'
+        attribute.data.foreach_set(field, attributes['rotation'].ravel())
+
+    mesh.update()
+    return mesh
+
+
+def import_ply(filepath: str, object_name: str, point_budget: int = DEFAULT_POINT_BUDGET):
+    """
+    Import point cloud / Gaussian splat PLY.
+
+    Returns:
+        List berisi object yang dibuat
+    """
+    data = read_ply_vertices(filepath, point_budget)
+    attributes = decode_splats(data)
+    mesh = build_point_cloud(object_name, attributes)
+
+    obj = bpy.data.objects.new(object_name, mesh)
+    collection = bpy.context.collection or bpy.context.scene.collection
+    collection.objects.link(obj)
+
+    print(f"Imported PLY as: {object_name} ({len(attributes['position']):,} points)")
+    return [obj]
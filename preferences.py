@@ -10,7 +10,7 @@ Panel preferensi untuk konfigurasi API keys dan URLs provider.
 import bpy
 import webbrowser
 from bpy.types import AddonPreferences
-from bpy.props import StringProperty, BoolProperty, EnumProperty
+from bpy.props import StringProperty, BoolProperty, EnumProperty, IntProperty
 
 
 class AI3DGeneratorPreferences(AddonPreferences):
@@ -69,6 +69,33 @@ class AI3DGeneratorPreferences(AddonPreferences):
         default="https://api.modelslab.com"
     )
     
+    # History storage
+    history_backend: EnumProperty(
+        name="History Storage",
+        description="Backend penyimpanan generation history (berlaku setelah restart Blender)",
+        items=[
+            ('SQLITE', "SQLite", "Database SQLite dengan index (WAL mode)"),
+            ('JSON', "JSON Journal", "Snapshot JSON dengan journal append-only, tanpa dependency. "
+                     "History SQLite tidak ikut terlihat; generasi baru di JSON di-import ke SQLite "
+                     "saat kembali ke SQLite"),
+        ],
+        default='SQLITE'
+    )
+    
+    history_retention_days: IntProperty(
+        name="Keep History (days)",
+        description="Generasi yang lebih lama dipindah ke arsip terkompresi saat history dimuat (0 = tanpa batas, default)",
+        default=0,
+        min=0
+    )
+    
+    history_retention_count: IntProperty(
+        name="Keep History (entries)",
+        description="Jumlah maksimum generasi di history aktif; sisanya dipindah ke arsip (0 = tanpa batas, default)",
+        default=0,
+        min=0
+    )
+    
     def draw(self, context):
         """Draw preferences panel."""
         layout = self.layout
@@ -99,6 +126,14 @@ class AI3DGeneratorPreferences(AddonPreferences):
             self._draw_meshy_config(box_provider, context)
         elif self.active_provider == 'MODELSLAB':
             self._draw_modelslab_config(box_provider, context)
+        
+        # Storage
+        box_storage = layout.box()
+        row = box_storage.row()
+        row.prop(self, "history_backend")
+        row = box_storage.row(align=True)
+        row.prop(self, "history_retention_days")
+        row.prop(self, "history_retention_count")
     
     def _draw_tripo_config(self, box, context):
         """Draw Tripo configuration."""
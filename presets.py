@@ -9,6 +9,8 @@ import bpy
 import json
 from pathlib import Path
 
+from .persistence import keyed_merge, register_store
+
 
 class PresetsManager:
     """Manage generation presets dengan persistent storage."""
@@ -16,6 +18,10 @@ class PresetsManager:
     def __init__(self):
         """Initialize presets manager."""
         self.presets_file = self._get_presets_file()
+        self._store = register_store(
+            self.presets_file, lambda: self.presets_data, 'presets',
+            keyed_merge({'text_presets': 'name', 'image_presets': 'name'}),
+        )
         self.presets_data = self._load_presets()
     
     def _get_presets_file(self):
@@ -26,22 +32,24 @@ class PresetsManager:
     
     def _load_presets(self):
         """Load presets dari file."""
-        if self.presets_file.exists():
-            try:
-                with open(self.presets_file, 'r') as f:
-                    return json.load(f)
-            except Exception as e:
-                print(f"Error loading presets: {str(e)}")
-                return {'text_presets': [], 'image_presets': []}
-        return {'text_presets': [], 'image_presets': []}
+        return self._store.load({'text_presets': [], 'image_presets': []})
     
-    def _save_presets(self):
-        """Save presets ke file."""
-        try:
-            with open(self.presets_file, 'w') as f:
-                json.dump(self.presets_data, f, indent=2)
-        except Exception as e:
-            print(f"Error saving presets: {str(e)}")
+    def _refresh(self):
+        """Muat ulang presets jika file diubah proses Blender lain."""
+        data = self._store.refresh()
+        if data is not None:
+            self.presets_data = data
+    
+    def _save_presets(self, name=None, preset_type='text', removed=False):
+        """Tandai presets berubah; file ditulis oleh persistence layer (debounced, atomic).
+        
+        Args:
+            name (str): Preset yang berubah (None = semua), untuk merge antar proses
+            preset_type (str): 'text' atau 'image'
+            removed (bool): Preset dihapus
+        """
+        key = (f'{preset_type}_presets', name) if name is not None else None
+        self._store.mark_dirty(key, removed)
     
     def create_text_preset(self, name, prompt, style, quality, output_format):
         """Create text-to-3D preset.
@@ -65,8 +73,9 @@ class PresetsManager:
             'output_format': output_format,
         }
         
+        self._refresh()
         self.presets_data['text_presets'].append(preset)
-        self._save_presets()
+        self._save_presets(name, 'text')
         return preset
     
     def create_image_preset(self, name, style, quality, output_format, background_removal):
@@ -91,16 +100,19 @@ class PresetsManager:
             'background_removal': background_removal,
         }
         
+        self._refresh()
         self.presets_data['image_presets'].append(preset)
-        self._save_presets()
+        self._save_presets(name, 'image')
         return preset
     
     def get_text_presets(self):
         """Get semua text presets."""
+        self._refresh()
         return self.presets_data['text_presets']
     
     def get_image_presets(self):
         """Get semua image presets."""
+        self._refresh()
         return self.presets_data['image_presets']
     
     def get_preset_by_name(self, name, preset_type='text'):
@@ -113,6 +125,7 @@ class PresetsManager:
         Returns:
             dict: Preset jika ditemukan, None jika tidak
         """
+        self._refresh()
         presets = self.presets_data['text_presets'] if preset_type == 'text' else self.presets_data['image_presets']
         for preset in presets:
             if preset['name'] == name:
@@ -130,11 +143,14 @@ class PresetsManager:
         Returns:
             dict: Preset yang diupdate
         """
+        self._refresh()
         presets = self.presets_data['text_presets'] if preset_type == 'text' else self.presets_data['image_presets']
         for preset in presets:
             if preset['name'] == name:
                 preset.update(updates)
-                self._save_presets()
+                if preset['name'] != name:
+                    self._save_presets(name, preset_type, removed=True)
+                self._save_presets(preset['name'], preset_type)
                 return preset
         return None
     
@@ -145,6 +161,7 @@ class PresetsManager:
             name (str): Nama preset
             preset_type (str): 'text' atau 'image'
         """
+        self._refresh()
         if preset_type == 'text':
             self.presets_data['text_presets'] = [
                 p for p in self.presets_data['text_presets'] if p['name'] != name
@@ -153,7 +170,7 @@ class PresetsManager:
             self.presets_data['image_presets'] = [
                 p for p in self.presets_data['image_presets'] if p['name'] != name
             ]
-        self._save_presets()
+        self._save_presets(name, preset_type, removed=True)
     
     def duplicate_preset(self, name, new_name, preset_type='text'):
         """Duplicate preset dengan nama baru.
@@ -175,7 +192,7 @@ class PresetsManager:
         
         presets = self.presets_data['text_presets'] if preset_type == 'text' else self.presets_data['image_presets']
         presets.append(new_preset)
-        self._save_presets()
+        self._save_presets(new_name, preset_type)
         
         return new_preset
     
@@ -203,12 +220,15 @@ class PresetsManager:
                 imported = json.load(f)
             
             if merge:
-                self.presets_data['text_presets'].extend(imported.get('text_presets', []))
-                self.presets_data['image_presets'].extend(imported.get('image_presets', []))
+                self._refresh()
+                for preset_type in ('text', 'image'):
+                    presets = imported.get(f'{preset_type}_presets', [])
+                    self.presets_data[f'{preset_type}_presets'].extend(presets)
+                    for preset in presets:
+                        self._save_presets(preset['name'], preset_type)
             else:
                 self.presets_data = imported
-            
-            self._save_presets()
+                self._save_presets()
         except Exception as e:
             print(f"Error importing presets: {str(e)}")
 
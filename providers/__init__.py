@@ -8,10 +8,12 @@ from .base_client import BaseProviderClient
 from .tripo_client import TripoClient
 from .meshy_client import MeshyClient
 from .modelslab_client import ModelsLabClient
+from .format_negotiation import negotiate_variant
 
 __all__ = [
     'BaseProviderClient',
     'TripoClient',
     'MeshyClient',
-    'ModelsLabClient'
+    'ModelsLabClient',
+    'negotiate_variant'
 ]
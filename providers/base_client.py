@@ -7,13 +7,31 @@ User harus mendaftar dan menyediakan API key sendiri.
 Abstract base class untuk semua provider (Tripo, Meshy, ModelsLab).
 """
 
+import os
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
+from urllib.parse import urlparse
+
+import requests
+
+
+# Format output yang dikenali dari ekstensi URL
+KNOWN_MODEL_FORMATS = ('glb', 'gltf', 'obj', 'fbx', 'stl', 'ply', 'usdz')
+
+# Probe yang tidak pernah diambil hasilnya (job dibatalkan) dibuang setelah ini
+SIZE_PROBE_TTL = 300
 
 
 class BaseProviderClient(ABC):
     """Abstract base class untuk AI 3D provider clients."""
     
+    # job_id -> {'threads': [...], 'sizes': {url: size}, 'started': time}
+    # (probe sekali per job, dihapus begitu hasilnya dipakai)
+    _size_probes = {}
+    _size_probes_lock = threading.Lock()
+    
     def __init__(self, api_key: str, base_url: str):
         """
         Initialize provider client.
@@ -25,6 +43,100 @@ class BaseProviderClient(ABC):
         self.api_key = api_key
         self.base_url = base_url.rstrip('/')
     
+    @staticmethod
+    def build_variant(url: str, file_format: Optional[str] = None, size: Optional[int] = None,
+                      compression: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Buat deskripsi satu output variant.
+        
+        Args:
+            url: URL download model
+            file_format: Format file (ditebak dari ekstensi URL jika kosong)
+            size: Ukuran file dalam bytes jika diketahui dari metadata
+            compression: 'draco', 'meshopt', atau None
+        
+        Returns:
+            Dict dengan kunci 'url', 'format', 'size', 'compression'
+        """
+        if not file_format:
+            ext = os.path.splitext(urlparse(url).path)[1].lstrip('.').lower()
+            file_format = ext if ext in KNOWN_MODEL_FORMATS else ''
+        
+        if compression is None:
+            lowered = url.lower()
+            if 'draco' in lowered:
+                compression = 'draco'
+            elif 'meshopt' in lowered:
+                compression = 'meshopt'
+        
+        return {
+            'url': url,
+            'format': file_format.lower(),
+            'size': size,
+            'compression': compression,
+        }
+    
+    @classmethod
+    def probe_variant_sizes(cls, job_id: str, variants: List[Dict[str, Any]],
+                            timeout: int = 5) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Lengkapi ukuran variant yang belum diketahui lewat HEAD request.
+        
+        HEAD request berjalan paralel di background thread (tidak memblok
+        main thread saat polling) dan hanya dimulai sekali per job; poll
+        berikutnya memakai hasilnya, lalu state probe job itu dibuang.
+        Variant yang gagal di-probe (mis. signed URL yang menolak HEAD)
+        tetap dengan size None.
+        
+        Returns:
+            Tuple (variants, pending); pending True selama probe masih berjalan
+        """
+        missing = [v['url'] for v in variants if not v.get('size')]
+        if not missing:
+            return variants, False
+        
+        with cls._size_probes_lock:
+            probe = cls._size_probes.get(job_id)
+            if probe is None:
+                cls._prune_size_probes()
+                probe = {'threads': [], 'sizes': {}, 'started': time.time()}
+                for url in missing:
+                    thread = threading.Thread(
+                        target=cls._probe_size, args=(url, timeout, probe['sizes']), daemon=True
+                    )
+                    thread.start()
+                    probe['threads'].append(thread)
+                cls._size_probes[job_id] = probe
+        
+        pending = any(thread.is_alive() for thread in probe['threads'])
+        if not pending:
+            for variant in variants:
+                if not variant.get('size'):
+                    variant['size'] = probe['sizes'].get(variant['url'])
+            with cls._size_probes_lock:
+                if cls._size_probes.get(job_id) is probe:
+                    del cls._size_probes[job_id]
+        return variants, pending
+    
+    @classmethod
+    def _prune_size_probes(cls):
+        """Buang probe job yang sudah selesai tapi tidak pernah di-poll lagi (caller pegang lock)."""
+        cutoff = time.time() - SIZE_PROBE_TTL
+        for job_id, probe in list(cls._size_probes.items()):
+            if probe['started'] < cutoff and not any(t.is_alive() for t in probe['threads']):
+                del cls._size_probes[job_id]
+    
+    @staticmethod
+    def _probe_size(url: str, timeout: int, sizes: Dict[str, int]):
+        """HEAD request satu variant; simpan Content-Length ke sizes."""
+        try:
+            response = requests.head(url, allow_redirects=True, timeout=timeout)
+            length = response.headers.get('Content-Length')
+            if response.ok and length and length.isdigit():
+                sizes[url] = int(length)
+        except requests.exceptions.RequestException:
+            pass
+    
     @abstractmethod
     def generate_text(self, prompt: str, style: str, quality: int, 
                      output_format: str) -> Dict[str, Any]:
@@ -53,7 +165,9 @@ class BaseProviderClient(ABC):
         Poll status dari generation job.
         
         Returns:
-            Dict dengan kunci 'status' (pending/completed/failed) dan 'model_url' jika completed
+            Dict dengan kunci 'status' (pending/completed/failed), dan jika completed
+            'model_url' serta 'model_variants' (list dari build_variant());
+            'sizes_pending' True selama ukuran variant masih di-probe
         """
         pass
     
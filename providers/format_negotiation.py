@@ -0,0 +1,117 @@
+"""
+Output Format Negotiation
+
+Addon ini hanya bertindak sebagai client untuk layanan AI 3D pihak ketiga.
+User harus mendaftar dan menyediakan API key sendiri.
+
+Pilih output variant dari provider yang meminimalkan estimasi waktu
+download + import untuk format yang diminta.
+"""
+
+from typing import Dict, Any, List, Optional
+
+
+# Format yang bisa di-import oleh downloader
+IMPORTABLE_FORMATS = ('glb', 'gltf', 'obj', 'fbx', 'stl', 'ply')
+
+# Compression yang bisa di-decode importer glTF Blender
+SUPPORTED_COMPRESSION = (None, 'draco')
+
+# Format yang dianggap setara saat negosiasi
+FORMAT_FAMILIES = {
+    'glb': ('glb', 'gltf'),
+    'gltf': ('gltf', 'glb'),
+}
+
+# Estimasi throughput import (MB/s) per format
+IMPORT_THROUGHPUT_MBPS = {
+    'glb': 40.0,
+    'gltf': 30.0,
+    'fbx': 15.0,
+    'obj': 8.0,
+    'stl': 60.0,
+    'ply': 80.0,
+}
+
+# Faktor biaya decode tambahan per compression
+COMPRESSION_DECODE_FACTOR = {
+    None: 1.0,
+    'draco': 3.0,
+    'meshopt': 1.2,
+}
+
+# Estimasi ukuran relatif terhadap GLB jika size tidak diketahui
+RELATIVE_SIZE = {
+    'glb': 1.0,
+    'gltf': 1.3,
+    'fbx': 1.5,
+    'obj': 2.5,
+    'stl': 2.0,
+    'ply': 1.5,
+}
+
+DEFAULT_BANDWIDTH_MBITS = 50.0
+DEFAULT_UNKNOWN_SIZE = 20 * 1024 * 1024
+
+
+def estimate_seconds(variant: Dict[str, Any], bandwidth_mbits: float = DEFAULT_BANDWIDTH_MBITS,
+                     fallback_size: Optional[int] = None) -> float:
+    """
+    Estimasi waktu download + import satu variant.
+
+    Args:
+        variant: Variant dari BaseProviderClient.build_variant()
+        bandwidth_mbits: Estimasi bandwidth download (Mbit/s)
+        fallback_size: Ukuran GLB acuan jika size variant tidak diketahui
+    """
+    file_format = variant.get('format') or 'glb'
+    size = variant.get('size')
+    if not size:
+        size = (fallback_size or DEFAULT_UNKNOWN_SIZE) * RELATIVE_SIZE.get(file_format, 1.0)
+
+    size_mb = size / (1024 * 1024)
+    download = size_mb * 8.0 / bandwidth_mbits
+    decode = COMPRESSION_DECODE_FACTOR.get(variant.get('compression'), 1.0)
+    import_time = size_mb * decode / IMPORT_THROUGHPUT_MBPS.get(file_format, 10.0)
+    return download + import_time
+
+
+def negotiate_variant(variants: List[Dict[str, Any]], requested_format: str,
+                      bandwidth_mbits: float = DEFAULT_BANDWIDTH_MBITS,
+                      importable_formats=IMPORTABLE_FORMATS) -> Optional[Dict[str, Any]]:
+    """
+    Pilih variant terbaik untuk format yang diminta.
+
+    Variant dengan format yang diminta (atau keluarganya, mis. glb/gltf)
+    didahulukan. Jika tidak ada, semua format yang bisa di-import ikut
+    dipertimbangkan. Di antara kandidat dipilih estimasi waktu terkecil.
+
+    Args:
+        variants: List variant dari poll_status()['model_variants']
+        requested_format: Format dari ai3d_output_format (glb, obj, fbx, stl)
+        bandwidth_mbits: Estimasi bandwidth download (Mbit/s)
+        importable_formats: Format yang bisa di-import
+
+    Returns:
+        Variant terpilih (dengan kunci 'estimated_seconds') atau None
+    """
+    requested_format = requested_format.lower()
+    usable = [
+        v for v in variants
+        if v.get('format') in importable_formats
+        and v.get('compression') in SUPPORTED_COMPRESSION
+    ]
+    if not usable:
+        return None
+
+    family = FORMAT_FAMILIES.get(requested_format, (requested_format,))
+    candidates = [v for v in usable if v['format'] in family] or usable
+
+    # Ukuran GLB yang diketahui jadi acuan estimasi variant tanpa size
+    known = [v['size'] / RELATIVE_SIZE.get(v['format'], 1.0) for v in usable if v.get('size')]
+    fallback_size = sorted(known)[len(known) // 2] if known else None
+
+    best = min(candidates, key=lambda v: estimate_seconds(v, bandwidth_mbits, fallback_size))
+    best = dict(best)
+    best['estimated_seconds'] = estimate_seconds(best, bandwidth_mbits, fallback_size)
+    return best
@@ -152,16 +152,14 @@ class MeshyClient(BaseProviderClient):
             }
             
             if status == "completed":
-                model_urls = result.get("model_urls", [])
-                if model_urls:
-                    # Pilih format yang tersedia (preferensi: glb, obj, fbx)
-                    for model_url in model_urls:
-                        if "glb" in model_url.lower() or "gltf" in model_url.lower():
-                            poll_result["model_url"] = model_url
-                            break
-                    else:
-                        # Jika tidak ada glb, gunakan yang pertama
-                        poll_result["model_url"] = model_urls[0]
+                variants = self._collect_variants(result)
+                if variants:
+                    poll_result["model_variants"], poll_result["sizes_pending"] = (
+                        self.probe_variant_sizes(job_id, variants)
+                    )
+                    # Default: glb jika ada, selain itu variant pertama
+                    glb = [v for v in variants if v["format"] in ("glb", "gltf")]
+                    poll_result["model_url"] = (glb or variants)[0]["url"]
             elif status == "failed" or status == "error":
                 poll_result["error"] = result.get("error_message", "Unknown error")
             
@@ -174,6 +172,22 @@ class MeshyClient(BaseProviderClient):
                 "error": f"Poll error: {str(e)}"
             }
     
+    def _collect_variants(self, result: Dict[str, Any]) -> list:
+        """Kumpulkan semua output variant dari task result Meshy."""
+        model_urls = result.get("model_urls") or {}
+        variants = []
+        
+        # model_urls bisa berupa dict {format: url} atau list url
+        if isinstance(model_urls, dict):
+            for file_format, url in model_urls.items():
+                if url:
+                    variants.append(self.build_variant(url, file_format))
+        else:
+            for url in model_urls:
+                variants.append(self.build_variant(url))
+        
+        return variants
+    
     def test_connection(self) -> tuple[bool, str]:
         """Test koneksi dan API key validity."""
         try:
@@ -152,6 +152,11 @@ class ModelsLabClient(BaseProviderClient):
                 model_url = data.get("model_url") or data.get("output_url")
                 if model_url:
                     poll_result["model_url"] = model_url
+                variants = self._collect_variants(data)
+                if variants:
+                    poll_result["model_variants"], poll_result["sizes_pending"] = (
+                        self.probe_variant_sizes(job_id, variants)
+                    )
                 poll_result["status"] = "completed"
             elif status == "failed" or status == "error":
                 poll_result["error"] = data.get("error_message", "Unknown error")
@@ -165,6 +170,24 @@ class ModelsLabClient(BaseProviderClient):
                 "error": f"Poll error: {str(e)}"
             }
     
+    def _collect_variants(self, data: Dict[str, Any]) -> list:
+        """Kumpulkan semua output variant dari response status ModelsLab."""
+        urls = []
+        for key in ("model_url", "output_url"):
+            if data.get(key):
+                urls.append(data[key])
+        
+        # ModelsLab kadang mengembalikan list output
+        output = data.get("output") or []
+        if isinstance(output, str):
+            output = [output]
+        urls.extend(u for u in output if isinstance(u, str))
+        
+        variants = []
+        for url in dict.fromkeys(urls):
+            variants.append(self.build_variant(url))
+        return variants
+    
     def test_connection(self) -> tuple[bool, str]:
         """Test koneksi dan API key validity."""
         try:
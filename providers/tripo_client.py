@@ -141,6 +141,11 @@ class TripoClient(BaseProviderClient):
                 model_url = data.get("model_url") or data.get("download_url")
                 if model_url:
                     result["model_url"] = model_url
+                variants = self._collect_variants(data)
+                if variants:
+                    result["model_variants"], result["sizes_pending"] = (
+                        self.probe_variant_sizes(job_id, variants)
+                    )
                 result["status"] = "completed"
             elif status == "failed" or status == "error":
                 result["error"] = data.get("error_message", "Unknown error")
@@ -154,6 +159,28 @@ class TripoClient(BaseProviderClient):
                 "error": f"Poll error: {str(e)}"
             }
     
+    def _collect_variants(self, data: Dict[str, Any]) -> list:
+        """Kumpulkan semua output variant dari response job Tripo."""
+        variants = []
+        seen = set()
+        
+        # Output tambahan (jika ada) dengan metadata format/size/compression
+        for output in data.get("outputs", []) or []:
+            url = output.get("url")
+            if url and url not in seen:
+                seen.add(url)
+                variants.append(self.build_variant(
+                    url, output.get("format"), output.get("size"), output.get("compression")
+                ))
+        
+        for key in ("model_url", "download_url", "pbr_model_url", "base_model_url"):
+            url = data.get(key)
+            if url and url not in seen:
+                seen.add(url)
+                variants.append(self.build_variant(url))
+        
+        return variants
+    
     def test_connection(self) -> tuple[bool, str]:
         """Test koneksi dan API key validity."""
         try:
@@ -0,0 +1,55 @@
+"""
+Stub modul Blender untuk menjalankan test di luar Blender.
+
+bpy, bmesh, dan mathutils diganti MagicMock; folder user Blender diarahkan
+ke folder sementara. Addon dimuat sebagai package 'ai_3d_generator' dari
+root repository, sama seperti saat di-install di Blender.
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+from unittest import mock
+
+
+ADDON_NAME = 'ai_3d_generator'
+ADDON_ROOT = Path(__file__).resolve().parent.parent
+
+
+def install(user_dir):
+    """Pasang stub bpy dan import addon.
+
+    Args:
+        user_dir (str): Folder yang dipakai sebagai resource_path('USER')
+
+    Returns:
+        Module addon
+    """
+    if ADDON_NAME in sys.modules:
+        set_user_dir(user_dir)
+        return sys.modules[ADDON_NAME]
+
+    bpy = mock.MagicMock()
+    bpy.app.version = (4, 2, 0)
+    # Timer tidak pernah terdaftar: store ditulis lewat flush()/flush_all()
+    bpy.app.timers.is_registered.return_value = True
+    sys.modules['bpy'] = bpy
+    for name in ('types', 'props', 'app', 'app.handlers', 'utils'):
+        sys.modules[f'bpy.{name}'] = getattr(bpy, name.split('.')[-1])
+    sys.modules['bmesh'] = mock.MagicMock()
+    sys.modules['mathutils'] = mock.MagicMock()
+    set_user_dir(user_dir)
+
+    spec = importlib.util.spec_from_file_location(
+        ADDON_NAME, ADDON_ROOT / '__init__.py',
+        submodule_search_locations=[str(ADDON_ROOT)],
+    )
+    addon = importlib.util.module_from_spec(spec)
+    sys.modules[ADDON_NAME] = addon
+    spec.loader.exec_module(addon)
+    return addon
+
+
+def set_user_dir(user_dir):
+    """Arahkan bpy.utils.resource_path('USER') ke user_dir."""
+    sys.modules['bpy'].utils.resource_path = lambda kind: str(user_dir)
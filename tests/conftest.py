@@ -0,0 +1,37 @@
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+import bpy_stub
+
+
+addon = bpy_stub.install(tempfile.mkdtemp(prefix='ai3d_user_'))
+
+WORKERS = Path(__file__).with_name('workers.py')
+
+
+@pytest.fixture
+def user_dir(tmp_path):
+    """Folder user Blender baru per test; return folder config addon."""
+    bpy_stub.set_user_dir(tmp_path)
+    return tmp_path / 'ai_3d_generator'
+
+
+@pytest.fixture
+def run_workers(tmp_path):
+    """Jalankan beberapa proses worker (tests/workers.py) paralel dan tunggu selesai."""
+    def run(command, count, *args):
+        procs = [
+            subprocess.Popen(
+                [sys.executable, str(WORKERS), command, str(tmp_path), str(index), *map(str, args)],
+                stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True,
+            )
+            for index in range(count)
+        ]
+        for proc in procs:
+            output, _ = proc.communicate(timeout=120)
+            assert proc.returncode == 0, output
+    return run
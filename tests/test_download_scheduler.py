@@ -0,0 +1,182 @@
+"""Test DownloadScheduler: prioritas, batas per host, pause/resume, dan Range resume."""
+
+import os
+import threading
+import time
+
+import pytest
+
+from conftest import addon
+
+download_scheduler = addon.download_scheduler
+downloader = addon.downloader
+Scheduler = download_scheduler.DownloadScheduler
+
+
+class FakeDownloads:
+    """Pengganti download_model_file(): kirim chunk sampai URL-nya dilepas."""
+
+    def __init__(self):
+        self.started = []
+        self.gates = {}
+        self.lock = threading.Lock()
+
+    def gate(self, url):
+        with self.lock:
+            return self.gates.setdefault(url, threading.Event())
+
+    def finish(self, url):
+        self.gate(url).set()
+
+    def __call__(self, url, file_type=None, chunk_hook=None, resume_from=None):
+        with self.lock:
+            self.started.append((url, resume_from))
+        gate = self.gate(url)
+        try:
+            while not gate.is_set():
+                chunk_hook(1)
+                time.sleep(0.005)
+        except download_scheduler.DownloadPaused as e:
+            e.partial_path = f"{url}.part"
+            raise
+        return f"{url}.done"
+
+    def urls(self):
+        with self.lock:
+            return [url for url, _ in self.started]
+
+
+@pytest.fixture
+def fake(monkeypatch):
+    fake = FakeDownloads()
+    monkeypatch.setattr(downloader, 'download_model_file', fake)
+    return fake
+
+
+def _wait_for(predicate, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.005)
+
+
+def test_pending_jobs_start_in_priority_order(fake):
+    scheduler = Scheduler(max_concurrent=1)
+    first = scheduler.submit('https://a.test/first.glb')
+    _wait_for(lambda: fake.urls() == ['https://a.test/first.glb'])
+
+    jobs = [
+        scheduler.submit('https://a.test/prefetch.glb', priority=download_scheduler.PRIORITY_PREFETCH),
+        scheduler.submit('https://a.test/batch.glb', priority=download_scheduler.PRIORITY_BATCH),
+        scheduler.submit('https://a.test/interactive.glb'),
+    ]
+    for url in ('first', 'interactive', 'batch', 'prefetch'):
+        fake.finish(f'https://a.test/{url}.glb')
+    for job in [first] + jobs:
+        job.wait(5)
+
+    assert fake.urls() == [
+        'https://a.test/first.glb', 'https://a.test/interactive.glb',
+        'https://a.test/batch.glb', 'https://a.test/prefetch.glb',
+    ]
+
+
+def test_per_host_limit(fake):
+    scheduler = Scheduler(max_concurrent=4, max_per_host=1)
+    a1 = scheduler.submit('https://a.test/1.glb', priority=download_scheduler.PRIORITY_BATCH)
+    a2 = scheduler.submit('https://a.test/2.glb', priority=download_scheduler.PRIORITY_BATCH)
+    b1 = scheduler.submit('https://b.test/1.glb', priority=download_scheduler.PRIORITY_BATCH)
+    _wait_for(lambda: len(fake.urls()) == 2)
+    assert fake.urls() == ['https://a.test/1.glb', 'https://b.test/1.glb']
+
+    fake.finish('https://a.test/1.glb')
+    assert a1.wait(5) == 'https://a.test/1.glb.done'
+    _wait_for(lambda: len(fake.urls()) == 3)
+    assert fake.urls()[2] == 'https://a.test/2.glb'
+
+    fake.finish('https://a.test/2.glb')
+    fake.finish('https://b.test/1.glb')
+    a2.wait(5)
+    b1.wait(5)
+
+
+def test_interactive_pauses_and_resumes_background_download(fake):
+    scheduler = Scheduler(max_concurrent=1)
+    batch = scheduler.submit('https://a.test/batch.glb', priority=download_scheduler.PRIORITY_BATCH)
+    _wait_for(lambda: len(fake.urls()) == 1)
+
+    interactive = scheduler.submit('https://a.test/user.glb')
+    _wait_for(lambda: len(fake.urls()) == 2)
+    assert batch.preempted
+
+    fake.finish('https://a.test/user.glb')
+    interactive.wait(5)
+    _wait_for(lambda: not batch.preempted)
+    fake.finish('https://a.test/batch.glb')
+
+    assert batch.wait(5) == 'https://a.test/batch.glb.done'
+    # Download yang di-pause singkat melanjutkan koneksi yang sama
+    assert fake.started.count(('https://a.test/batch.glb', None)) == 1
+
+
+def test_long_pause_closes_connection_and_resumes_from_partial_file(fake, monkeypatch):
+    monkeypatch.setattr(download_scheduler, 'MAX_PAUSE_SECONDS', 0.05)
+    scheduler = Scheduler(max_concurrent=1)
+    batch = scheduler.submit('https://a.test/batch.glb', priority=download_scheduler.PRIORITY_BATCH)
+    _wait_for(lambda: len(fake.urls()) == 1)
+
+    interactive = scheduler.submit('https://a.test/user.glb')
+    _wait_for(lambda: batch.partial_path is not None)
+    assert batch in [item[2] for item in scheduler._pending]
+    assert batch not in scheduler._running
+
+    fake.finish('https://a.test/user.glb')
+    interactive.wait(5)
+    fake.finish('https://a.test/batch.glb')
+
+    assert batch.wait(5) == 'https://a.test/batch.glb.done'
+    assert fake.started[-1] == ('https://a.test/batch.glb', 'https://a.test/batch.glb.part')
+
+
+class _Response:
+    def __init__(self, status_code, body):
+        self.status_code = status_code
+        self.body = body
+        self.closed = False
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size):
+        for i in range(0, len(self.body), chunk_size):
+            yield self.body[i:i + chunk_size]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.closed = True
+
+
+@pytest.mark.parametrize('status_code, body, expected', [
+    (206, b'world', b'hello world'),
+    (200, b'hello world', b'hello world'),
+])
+def test_download_resumes_with_range_request(monkeypatch, tmp_path, status_code, body, expected):
+    partial = tmp_path / 'partial.glb'
+    partial.write_bytes(b'hello ')
+    requests_made = []
+
+    def get(url, headers=None, **kwargs):
+        requests_made.append(headers)
+        return _Response(status_code, body)
+
+    monkeypatch.setattr(downloader.requests, 'get', get)
+    path = downloader.download_model_file('https://a.test/m.glb', 'glb', resume_from=str(partial))
+
+    assert requests_made == [{'Range': 'bytes=6-'}]
+    with open(path, 'rb') as f:
+        assert f.read() == expected
+    assert (path == str(partial)) == (status_code == 206)
+    assert partial.exists() == (status_code == 206)
+    os.remove(path)
@@ -0,0 +1,85 @@
+"""Test reader STL/OBJ fast path (weld vertex, index negatif OBJ, dan UV)."""
+
+import numpy as np
+import pytest
+
+from conftest import addon
+
+fast_mesh_io = addon.fast_mesh_io
+
+# Dua triangle yang berbagi satu edge (quad di bidang XY); -0.0 harus di-weld dengan 0.0
+TRIANGLES = [
+    [(0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (1.0, 1.0, 0.0)],
+    [(-0.0, 0.0, 0.0), (1.0, 1.0, 0.0), (0.0, 1.0, 0.0)],
+]
+
+
+def _write_binary_stl(path, triangles):
+    data = np.zeros(len(triangles), dtype=fast_mesh_io.STL_TRIANGLE_DTYPE)
+    data['normal'] = (0.0, 0.0, 1.0)
+    data['vertices'] = np.array(triangles, dtype=np.float32).reshape(-1, 3, 3)
+    path.write_bytes(b'\0' * 80 + len(triangles).to_bytes(4, 'little') + data.tobytes())
+    return str(path)
+
+
+def _write_ascii_stl(path, triangles):
+    lines = ['solid test']
+    for triangle in triangles:
+        lines += ['facet normal 0 0 1', '  outer loop']
+        lines += [f'    vertex {x:e} {y:e} {z:e}' for x, y, z in triangle]
+        lines += ['  endloop', 'endfacet']
+    lines.append('endsolid test')
+    path.write_text('\n'.join(lines) + '\n')
+    return str(path)
+
+
+@pytest.mark.parametrize('writer', [_write_binary_stl, _write_ascii_stl])
+def test_read_stl_welds_shared_vertices(tmp_path, writer):
+    vertices, faces = fast_mesh_io.read_stl(writer(tmp_path / 'quad.stl', TRIANGLES))
+
+    assert vertices.dtype == np.float32 and vertices.shape == (4, 3)
+    assert faces.shape == (2, 3)
+    np.testing.assert_array_equal(vertices[faces], np.array(TRIANGLES, dtype=np.float32) + 0.0)
+
+
+def test_read_empty_binary_stl(tmp_path):
+    vertices, faces = fast_mesh_io.read_stl(_write_binary_stl(tmp_path / 'empty.stl', []))
+
+    assert vertices.shape == (0, 3) and faces.shape == (0, 3)
+
+
+def test_read_obj_negative_indices_and_uvs(tmp_path):
+    path = tmp_path / 'model.obj'
+    path.write_text(
+        '# quad + triangle, index relatif\n'
+        'v 0 0 0\nv 1 0 0\nv 1 1 0\nv 0 1 0\n'
+        'vt 0 0\nvt 1 0\nvt 1 1\nvt 0 1\n'
+        'f -4/-4 -3/-3 -2/-2 -1/-1\n'
+        'v 0 0 2\nv 0 0 0\n'
+        'vt 0.5 0.5\n'
+        'f 5/5 -1/1 2/2\n'
+    )
+    mesh = fast_mesh_io.read_obj(str(path))
+
+    # Vertex ke-6 sama dengan vertex 1 dan di-weld
+    assert mesh['vertices'].shape == (5, 3)
+    np.testing.assert_array_equal(mesh['loop_totals'], [4, 3])
+    loops = mesh['vertices'][mesh['loop_vertices']]
+    # Y-up OBJ menjadi Z-up: (x, y, z) -> (x, -z, y)
+    np.testing.assert_array_equal(loops, [
+        (0, 0, 0), (1, 0, 0), (1, 0, 1), (0, 0, 1),
+        (0, -2, 0), (0, 0, 0), (1, 0, 0),
+    ])
+    np.testing.assert_array_equal(mesh['loop_uvs'], [
+        (0, 0), (1, 0), (1, 1), (0, 1),
+        (0.5, 0.5), (0, 0), (1, 0),
+    ])
+
+
+def test_read_obj_without_uvs_on_every_face(tmp_path):
+    path = tmp_path / 'partial.obj'
+    path.write_text('v 0 0 0\nv 1 0 0\nv 0 1 0\nvt 0 0\nf 1/1 2/1 3/1\nf 3//1 2 1\n')
+    mesh = fast_mesh_io.read_obj(str(path))
+
+    assert mesh['loop_uvs'] is None
+    assert len(mesh['loop_vertices']) == 6
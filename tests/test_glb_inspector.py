@@ -0,0 +1,121 @@
+"""Test parser chunk GLB (header, JSON chunk, dan header image di BIN chunk)."""
+
+import json
+import struct
+
+import pytest
+
+from conftest import addon
+
+glb_inspector = addon.glb_inspector
+
+PNG = b'\x89PNG\r\n\x1a\n' + struct.pack('>I4sII', 13, b'IHDR', 64, 32) + b'\x08\x06\x00\x00\x00'
+# SOI, APP0 kosong, lalu SOF0 dengan height 50 dan width 100
+JPEG = b'\xff\xd8' + b'\xff\xe0\x00\x04\x00\x00' + b'\xff\xc0\x00\x11\x08' + struct.pack('>HH', 50, 100) + bytes(12)
+
+
+def _pad(data, fill):
+    return data + fill * (-len(data) % 4)
+
+
+def _write_glb(path, gltf, bin_chunk=None, magic=glb_inspector.GLB_MAGIC, version=2):
+    json_chunk = _pad(json.dumps(gltf).encode(), b' ')
+    chunks = struct.pack('<II', len(json_chunk), glb_inspector.CHUNK_JSON) + json_chunk
+    if bin_chunk is not None:
+        bin_chunk = _pad(bin_chunk, b'\0')
+        chunks += struct.pack('<II', len(bin_chunk), glb_inspector.CHUNK_BIN) + bin_chunk
+    path.write_bytes(struct.pack('<III', magic, version, 12 + len(chunks)) + chunks)
+    return str(path)
+
+
+@pytest.fixture
+def glb(tmp_path):
+    binary = _pad(PNG, b'\0') + JPEG
+    gltf = {
+        'accessors': [
+            {'componentType': 5126, 'type': 'VEC3', 'count': 100},   # POSITION bersama
+            {'componentType': 5125, 'type': 'SCALAR', 'count': 300},  # indices
+            {'componentType': 5126, 'type': 'VEC2', 'count': 100},
+            {'componentType': 5126, 'type': 'VEC3', 'count': 30},
+        ],
+        'meshes': [
+            {'primitives': [
+                {'attributes': {'POSITION': 0, 'TEXCOORD_0': 2}, 'indices': 1},
+                {'attributes': {'POSITION': 0}, 'indices': 1},
+            ]},
+            {'primitives': [
+                {'attributes': {'POSITION': 3}},
+                {'attributes': {'POSITION': 3}, 'mode': 1},  # LINES
+            ]},
+        ],
+        'buffers': [{'byteLength': len(binary)}],
+        'bufferViews': [
+            {'buffer': 0, 'byteOffset': 0, 'byteLength': len(PNG)},
+            {'buffer': 0, 'byteOffset': len(_pad(PNG, b'\0')), 'byteLength': len(JPEG)},
+        ],
+        'images': [
+            {'name': 'albedo', 'mimeType': 'image/png', 'bufferView': 0},
+            {'mimeType': 'image/jpeg', 'bufferView': 1},
+            {'uri': 'external.png'},
+        ],
+        'extensionsUsed': ['KHR_draco_mesh_compression'],
+    }
+    return _write_glb(tmp_path / 'model.glb', gltf, binary)
+
+
+def test_inspect_counts_geometry_from_accessors(glb):
+    info = glb_inspector.inspect_glb(glb)
+
+    assert info['mesh_count'] == 2
+    assert info['primitive_count'] == 4
+    # Accessor POSITION yang di-share hanya dihitung sekali
+    assert info['vertex_count'] == 130
+    # 2 x 300 index + 30 vertex tanpa index; primitive LINES dilewati
+    assert info['triangle_count'] == 210
+    assert info['accessor_bytes'] == 100 * 12 + 300 * 4 + 100 * 8 + 30 * 12
+    assert info['extensions'] == ['KHR_draco_mesh_compression']
+
+
+def test_inspect_reads_embedded_image_headers(glb):
+    info = glb_inspector.inspect_glb(glb)
+
+    assert info['image_count'] == 3
+    assert [(t['name'], t['width'], t['height']) for t in info['textures']] == [
+        ('albedo', 64, 32), ('image_1', 100, 50), ('image_2', 0, 0),
+    ]
+    assert info['image_bytes'] == len(PNG) + len(JPEG)
+
+
+def test_glb_without_bin_chunk(tmp_path):
+    path = _write_glb(tmp_path / 'empty.glb', {'meshes': [], 'images': [{'bufferView': 0}]})
+    info = glb_inspector.inspect_glb(path)
+
+    assert info['triangle_count'] == 0
+    assert info['textures'][0]['bytes'] == 0
+
+
+@pytest.mark.parametrize('kwargs, message', [
+    ({'magic': 0x12345678}, 'Not a GLB'),
+    ({'version': 1}, 'Unsupported GLB version'),
+])
+def test_invalid_header_raises(tmp_path, kwargs, message):
+    path = _write_glb(tmp_path / 'bad.glb', {}, **kwargs)
+    with pytest.raises(ValueError, match=message):
+        glb_inspector.inspect_glb(path)
+
+
+def test_truncated_json_chunk_raises(tmp_path):
+    path = tmp_path / 'truncated.glb'
+    _write_glb(path, {'meshes': []})
+    path.write_bytes(path.read_bytes()[:24])
+    with pytest.raises(ValueError, match='Invalid GLB JSON chunk'):
+        glb_inspector.inspect_glb(str(path))
+
+
+def test_select_import_profile():
+    info = {'triangle_count': 10, 'textures': [{'width': 4096, 'height': 4096}]}
+    assert glb_inspector.select_import_profile(info) == 'heavy'
+    info['textures'] = []
+    assert glb_inspector.select_import_profile(info) == 'light'
+    info['triangle_count'] = glb_inspector.PROFILE_LIGHT_TRIANGLES + 1
+    assert glb_inspector.select_import_profile(info) == 'standard'
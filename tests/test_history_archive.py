@@ -0,0 +1,43 @@
+"""Test retention dan arsip history."""
+
+from conftest import addon
+
+history = addon.history
+
+
+def _add_done(h, count):
+    for i in range(count):
+        h.add_generation({'job_id': f'job-{i}', 'provider': 'TRIPO', 'type': 'text'})
+        h.update_generation(f'job-{i}', 'completed')
+
+
+def test_retention_is_off_by_default(user_dir):
+    h = history.GenerationHistory()
+    _add_done(h, 5)
+
+    assert h.apply_retention() == 0
+    assert len(h.get_all_generations()) == 5
+
+
+def test_retention_moves_entries_to_archive(user_dir):
+    h = history.GenerationHistory()
+    _add_done(h, 5)
+
+    assert h.apply_retention(max_age_days=0, max_count=2) == 3
+    assert [g['id'] for g in h.get_all_generations()] == [4, 5]
+    assert h.get_statistics()['total'] == 5
+    assert h.query(include_archive=True, sort='id', descending=False)['total'] == 5
+
+
+def test_archive_append_skips_already_archived_ids(user_dir):
+    h = history.GenerationHistory()
+    _add_done(h, 4)
+    entries = h.get_all_generations()[:3]
+
+    assert h.archive.append(entries) == 3
+    # Crash sebelum record 'archive' ditulis: entry yang sama diarsip ulang
+    assert h.archive.append(entries) == 0
+    assert h.archive.get_aggregates()['count'] == 3
+    assert h.apply_retention(max_age_days=0, max_count=1) == 3
+    assert h.archive.get_aggregates()['count'] == 3
+    assert [e['id'] for e in h.archive.iter_entries()] == [1, 2, 3]
@@ -0,0 +1,111 @@
+"""Test journal JSON history: replay, torn line, compaction, dan multi-proses."""
+
+import json
+
+import pytest
+
+from conftest import addon
+
+history = addon.history
+
+
+def _add(h, job_id, **fields):
+    return h.add_generation(dict({'job_id': job_id, 'provider': 'TRIPO', 'type': 'text'}, **fields))
+
+
+@pytest.fixture
+def threshold(monkeypatch):
+    """Set COMPACT_THRESHOLD untuk satu test."""
+    def set_threshold(value):
+        monkeypatch.setattr(history, 'COMPACT_THRESHOLD', value)
+    return set_threshold
+
+
+def test_journal_replay_restores_state(user_dir):
+    h = history.GenerationHistory()
+    _add(h, 'a', prompt='red chair')
+    _add(h, 'b')
+    _add(h, 'c')
+    h.update_generation('a', 'completed', model_url='https://example.com/a.glb')
+    h.delete_generation('b')
+
+    assert not h.history_file.exists()
+    reloaded = history.GenerationHistory()
+    assert [g['job_id'] for g in reloaded.get_all_generations()] == ['a', 'c']
+    assert reloaded.get_generation('a')['status'] == 'completed'
+    assert reloaded.get_generation('a')['model_url'] == 'https://example.com/a.glb'
+    assert reloaded.query(search='chair')['total'] == 1
+    assert reloaded.history_data['total_count'] == 3
+
+
+def test_replay_after_compaction_is_idempotent(user_dir):
+    h = history.GenerationHistory()
+    for i in range(5):
+        _add(h, f'job-{i}')
+    h.update_generation('job-1', 'failed')
+    journal = h.journal_file.read_bytes()
+    h.compact(wait=True)
+
+    assert h.history_file.exists()
+    assert not h.journal_file.exists()
+    # Crash setelah snapshot ditulis tapi sebelum file compacting dihapus
+    h.compacting_file.write_bytes(journal)
+
+    reloaded = history.GenerationHistory()
+    assert [g['id'] for g in reloaded.get_all_generations()] == [1, 2, 3, 4, 5]
+    assert reloaded.get_generation('job-1')['status'] == 'failed'
+    assert reloaded.get_statistics()['total'] == 5
+
+
+def test_torn_last_line_is_ignored_and_overwritten(user_dir):
+    h = history.GenerationHistory()
+    _add(h, 'a')
+    _add(h, 'b')
+    with open(h.journal_file, 'ab') as f:
+        f.write(b'{"op": "add", "entry": {"id": 3, "job')
+
+    reloaded = history.GenerationHistory()
+    assert [g['job_id'] for g in reloaded.get_all_generations()] == ['a', 'b']
+
+    _add(reloaded, 'c')
+    lines = reloaded.journal_file.read_bytes().splitlines()
+    assert all(json.loads(line) for line in lines)
+    assert [g['job_id'] for g in history.GenerationHistory().get_all_generations()] == ['a', 'b', 'c']
+
+
+def test_compaction_during_appends_keeps_every_record(user_dir, threshold):
+    threshold(4)
+    h = history.GenerationHistory()
+    for i in range(60):
+        _add(h, f'job-{i}')
+        if i % 2:
+            h.update_generation(f'job-{i}', 'completed')
+    h.compact(wait=True)
+
+    reloaded = history.GenerationHistory()
+    generations = reloaded.get_all_generations()
+    assert [g['id'] for g in generations] == list(range(1, 61))
+    assert reloaded.get_statistics()['completed'] == 30
+    assert not reloaded.compacting_file.exists()
+
+
+def test_other_instance_changes_are_synced(user_dir):
+    first = history.GenerationHistory()
+    second = history.GenerationHistory()
+    _add(first, 'a')
+    _add(second, 'b')
+    first.update_generation('b', 'completed')
+
+    assert [g['id'] for g in first.get_all_generations()] == [1, 2]
+    assert second.get_generation('b')['status'] == 'completed'
+
+
+def test_multi_process_adds_with_compaction(user_dir, run_workers):
+    run_workers('history_adds', 4, 60, 9)
+
+    h = history.GenerationHistory()
+    generations = h.get_all_generations()
+    assert len(generations) == 240
+    assert sorted(g['id'] for g in generations) == list(range(1, 241))
+    assert len({g['job_id'] for g in generations}) == 240
+    assert h.get_statistics()['completed'] == 4 * 20
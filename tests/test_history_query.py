@@ -0,0 +1,91 @@
+"""Test query() dan cursor pagination untuk backend JSON dan SQLite."""
+
+import importlib
+
+import pytest
+
+from conftest import addon
+
+history = addon.history
+history_sqlite = importlib.import_module('ai_3d_generator.history_sqlite')
+
+PROMPTS = ('red wooden chair', 'blue chair', 'wooden table', 'red car', 'small red wooden boat')
+
+
+@pytest.fixture(params=['json', 'sqlite', 'sqlite_like'])
+def backend(request, user_dir):
+    """History berisi 23 entry dengan provider, quality, style, dan status berbeda."""
+    if request.param == 'json':
+        h = history.GenerationHistory()
+    else:
+        h = history_sqlite.SQLiteGenerationHistory()
+        if request.param == 'sqlite_like':
+            # Fallback saat SQLite tanpa FTS5
+            h._fts = False
+    for i in range(23):
+        h.add_generation({
+            'job_id': f'job-{i}',
+            'provider': ('TRIPO', 'MESHY', 'MODELSLAB')[i % 3],
+            'type': 'text' if i % 4 else 'image',
+            'prompt': PROMPTS[i % len(PROMPTS)],
+            'style': ('', 'realistic', 'cartoon')[i % 3],
+            'quality': i % 5,
+        })
+        if i % 2:
+            h.update_generation(f'job-{i}', 'completed')
+    yield h
+    if request.param != 'json':
+        h.close()
+
+
+def _pages(h, limit, **kwargs):
+    """Kumpulkan semua halaman lewat next_cursor."""
+    items, cursor, pages = [], None, 0
+    while True:
+        page = h.query(limit=limit, cursor=cursor, **kwargs)
+        assert len(page['items']) <= limit
+        items.extend(page['items'])
+        pages += 1
+        cursor = page['next_cursor']
+        if cursor is None:
+            return items, page['total'], pages
+
+
+def _expected(h, sort, descending, predicate=lambda g: True):
+    gens = [g for g in h.get_all_generations() if predicate(g)]
+    return [g['id'] for g in sorted(gens, key=lambda g: history._sort_key(g, sort), reverse=descending)]
+
+
+@pytest.mark.parametrize('sort', history.SORT_FIELDS)
+@pytest.mark.parametrize('descending', [True, False])
+def test_cursor_round_trip_visits_every_entry_once(backend, sort, descending):
+    items, total, pages = _pages(backend, 5, sort=sort, descending=descending)
+
+    assert [g['id'] for g in items] == _expected(backend, sort, descending)
+    assert total == 23
+    assert pages == 5
+
+
+def test_cursor_round_trip_with_filters(backend):
+    items, total, _ = _pages(backend, 2, provider='TRIPO', status='completed', sort='quality')
+
+    expected = _expected(backend, 'quality', True,
+                         lambda g: g['provider'] == 'TRIPO' and g['status'] == 'completed')
+    assert [g['id'] for g in items] == expected
+    assert total == len(expected) == 4
+
+
+def test_search_matches_all_prompt_tokens(backend):
+    items, total, _ = _pages(backend, 3, search='Red Wooden', sort='id', descending=False)
+
+    expected = [g['id'] for g in backend.get_all_generations()
+                if {'red', 'wooden'} <= history.tokenize_prompt(g['prompt'])]
+    assert [g['id'] for g in items] == expected
+    assert total == len(expected) == 9
+
+
+def test_exact_page_size_has_no_next_cursor(backend):
+    page = backend.query(provider='MESHY', sort='id', limit=8)
+
+    assert len(page['items']) == 8
+    assert page['next_cursor'] is None
@@ -0,0 +1,49 @@
+"""Test migrasi history JSON ke SQLite."""
+
+import importlib
+
+from conftest import addon
+
+history = addon.history
+# Dimuat lazy oleh get_history(), jadi tidak ada di namespace addon
+history_sqlite = importlib.import_module('ai_3d_generator.history_sqlite')
+
+
+def _add(h, job_id):
+    return h.add_generation({'job_id': job_id, 'provider': 'TRIPO', 'type': 'text'})
+
+
+def test_json_history_is_migrated_then_reimported(user_dir):
+    json_history = history.GenerationHistory()
+    _add(json_history, 'a')
+    _add(json_history, 'b')
+    json_history.update_generation('b', 'completed')
+
+    db = history_sqlite.SQLiteGenerationHistory()
+    assert [(g['id'], g['job_id']) for g in db.get_all_generations()] == [(1, 'a'), (2, 'b')]
+    assert db.get_generation('b')['status'] == 'completed'
+    assert not json_history.journal_file.exists()
+    _add(db, 'c')
+    db._conn.close()
+
+    # Backend sempat diganti ke JSON: history JSON baru mulai dari ID 1
+    json_history = history.GenerationHistory()
+    _add(json_history, 'd')
+    _add(json_history, 'e')
+
+    db = history_sqlite.SQLiteGenerationHistory()
+    assert [(g['id'], g['job_id']) for g in db.get_all_generations()] == [
+        (1, 'a'), (2, 'b'), (3, 'c'), (4, 'd'), (5, 'e'),
+    ]
+    assert _add(db, 'f')['id'] == 6
+    assert not json_history.journal_file.exists()
+    assert len(list(user_dir.glob('generation_history.journal.jsonl*.migrated'))) == 2
+
+
+def test_multi_process_updates_are_not_lost(user_dir, run_workers):
+    db = history_sqlite.SQLiteGenerationHistory()
+    _add(db, 'shared')
+    run_workers('sqlite_updates', 4, 25)
+
+    gen = db.get_generation('shared')
+    assert {f'w{w}_{i}' for w in range(4) for i in range(25)} <= set(gen)
@@ -0,0 +1,54 @@
+"""Test parsing LOD ratio dan validasinya sebelum import."""
+
+import pytest
+
+from conftest import addon
+
+lod_generator = addon.lod_generator
+downloader = addon.downloader
+
+BAD_SETTINGS = {'generate_lods': True, 'lod_ratios': '100,fifty'}
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('100,50,25,10', [1.0, 0.5, 0.25, 0.1]),
+    ('25%, 50 ,,10', [1.0, 0.5, 0.25, 0.1]),
+    ('50,50', [1.0, 0.5]),
+    ('', [1.0]),
+])
+def test_parse_lod_ratios(text, expected):
+    assert lod_generator.parse_lod_ratios(text) == expected
+
+
+@pytest.mark.parametrize('text', ['100,fifty', '0', '150', '-10'])
+def test_parse_lod_ratios_rejects_invalid_values(text):
+    with pytest.raises(ValueError):
+        lod_generator.parse_lod_ratios(text)
+
+
+def _fail(*args, **kwargs):
+    raise AssertionError("must not run with invalid LOD ratios")
+
+
+def test_invalid_ratios_fail_before_import(monkeypatch):
+    monkeypatch.setattr(downloader, 'inspect_glb', _fail)
+    monkeypatch.setattr(downloader, '_import_gltf', _fail)
+    monkeypatch.setattr(downloader, 'file_content_hash', _fail)
+
+    with pytest.raises(ValueError):
+        downloader.import_model_file('model.glb', 'glb', 'Model', BAD_SETTINGS)
+
+
+def test_invalid_ratios_fail_before_download(monkeypatch):
+    monkeypatch.setattr(downloader, '_scheduled_download', _fail)
+
+    with pytest.raises(ValueError):
+        downloader.download_and_import_model('https://a.test/m.glb', 'glb', 'Model', BAD_SETTINGS)
+
+
+def test_point_cloud_ignores_lod_ratios(monkeypatch):
+    monkeypatch.setattr(downloader, 'file_content_hash', lambda path: 'hash')
+    monkeypatch.setattr(downloader, 'instance_model', lambda content_hash, name: ['existing'])
+
+    result = downloader.import_model_file('cloud.ply', 'ply', 'Cloud', BAD_SETTINGS, fit_view=False)
+    assert result['instanced']
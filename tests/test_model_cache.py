@@ -0,0 +1,90 @@
+"""Test model cache: tier hot/cold, acquire, dan index bersama antar proses."""
+
+import os
+import time
+
+import pytest
+
+from conftest import addon
+
+model_cache = addon.model_cache
+
+
+def _model_file(tmp_path, name, size=4096):
+    path = tmp_path / name
+    path.write_bytes(os.urandom(size // 2) * 2)
+    return str(path)
+
+
+def _make_stale(cache, key):
+    cache.index['entries'][key]['last_access'] = time.time() - model_cache.HOT_MAX_AGE_DAYS * 86400 - 1
+
+
+def test_acquired_entry_is_not_demoted(user_dir, tmp_path):
+    cache = model_cache.ModelCache()
+    hot_path = cache.put('a', _model_file(tmp_path, 'a.glb'), acquire=True)
+    _make_stale(cache, 'a')
+
+    assert cache.maintain() == 0
+    assert os.path.exists(hot_path)
+
+    cache.release('a')
+    assert cache.maintain() == 1
+    assert not os.path.exists(hot_path)
+    assert cache.index['entries']['a']['tier'] == 'cold'
+
+
+def test_put_over_cold_entry_removes_old_tier_file(user_dir, tmp_path):
+    cache = model_cache.ModelCache(codec='zlib')
+    cache.put('a', _model_file(tmp_path, 'a.glb'))
+    _make_stale(cache, 'a')
+    cache.maintain()
+    cold_files = list(cache.cold_dir.iterdir())
+    assert len(cold_files) == 1
+
+    cache.put('a', _model_file(tmp_path, 'a2.glb'))
+    assert list(cache.cold_dir.iterdir()) == []
+    assert cache.index['entries']['a']['tier'] == 'hot'
+
+
+def test_index_changes_of_other_instances_are_merged(user_dir, tmp_path):
+    first, second = model_cache.ModelCache(), model_cache.ModelCache()
+    first.put('a', _model_file(tmp_path, 'a.glb'))
+    second.put('b', _model_file(tmp_path, 'b.glb'))
+    first.get('a')
+
+    assert set(model_cache.ModelCache().index['entries']) == {'a', 'b'}
+    assert first.get('b')[0] is not None
+
+    second.get('b')
+    second._drop('a')
+    assert set(model_cache.ModelCache().index['entries']) == {'b'}
+    assert first.get('a') == (None, False)
+
+
+@pytest.mark.parametrize('codec', ['lzma', 'zlib'])
+def test_round_trip_hot_cold_hot(user_dir, tmp_path, codec):
+    cache = model_cache.ModelCache(codec=codec)
+    source = _model_file(tmp_path, 'a.glb')
+    with open(source, 'rb') as f:
+        content = f.read()
+    hot_path = cache.put('a', source)
+    _make_stale(cache, 'a')
+    assert cache.maintain() == 1
+    assert not os.path.exists(hot_path)
+
+    # Akses pertama di cold tier: hasil dekompresi sementara, entry tetap cold
+    path, temporary = cache.get('a')
+    assert temporary and path != hot_path
+    with open(path, 'rb') as f:
+        assert f.read() == content
+    os.remove(path)
+    assert cache.index['entries']['a']['tier'] == 'cold'
+
+    # Akses ke-PROMOTE_HITS dalam window: naik lagi ke hot tier
+    path, temporary = cache.get('a')
+    assert (path, temporary) == (hot_path, False)
+    with open(path, 'rb') as f:
+        assert f.read() == content
+    assert cache.index['entries']['a']['tier'] == 'hot'
+    assert list(cache.cold_dir.iterdir()) == []
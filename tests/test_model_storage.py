@@ -0,0 +1,18 @@
+"""Test path penyimpanan model eksternal."""
+
+from conftest import addon
+
+model_storage = addon.model_storage
+
+
+def test_storage_path_limits_long_prompt_names(user_dir):
+    path = model_storage._storage_path('tripo_' + 'very long prompt ' * 40, 'ab' * 32)
+
+    assert len(path.name) <= 255
+    assert path.name.endswith('_abababababab.blend')
+    assert path.name.startswith('tripo_very_long_prompt')
+    path.touch()
+
+
+def test_storage_path_falls_back_for_empty_names(user_dir):
+    assert model_storage._storage_path('').name == 'model.blend'
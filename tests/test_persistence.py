@@ -0,0 +1,90 @@
+"""Test persistence: atomic write, merge antar proses, dan file lock."""
+
+import json
+import threading
+
+from conftest import addon
+
+persistence = addon.persistence
+
+
+def _store(path, data):
+    return persistence.JSONStore(path, lambda: data, 'test store', persistence.keyed_merge({'items': 'id'}))
+
+
+def test_atomic_write_replaces_without_temp_files(tmp_path):
+    path = tmp_path / 'data.json'
+    persistence.atomic_write(path, '{"a":1}')
+    persistence.atomic_write(path, '{"a":2}')
+
+    assert json.loads(path.read_text()) == {'a': 2}
+    assert [p.name for p in tmp_path.iterdir()] == ['data.json']
+
+
+def test_keyed_merge_keeps_untouched_disk_items():
+    merge = persistence.keyed_merge({'items': 'id'})
+    disk = {'items': [{'id': 'a', 'v': 1}, {'id': 'b', 'v': 1}, {'id': 'c', 'v': 1}]}
+    local = {'items': [{'id': 'a', 'v': 2}, {'id': 'b', 'v': 0}, {'id': 'd', 'v': 1}]}
+    changes = {'keys': {('items', 'a'), ('items', 'd')}, 'removed': {('items', 'c')}, 'all': False}
+
+    assert merge(disk, local, changes) == {
+        'items': [{'id': 'a', 'v': 2}, {'id': 'b', 'v': 1}, {'id': 'd', 'v': 1}],
+    }
+
+
+def test_store_write_merges_changes_of_other_writer(tmp_path):
+    path = tmp_path / 'store.json'
+    first_data, second_data = {'items': []}, {'items': []}
+    first, second = _store(path, first_data), _store(path, second_data)
+    first.load({'items': []})
+    second.load({'items': []})
+
+    first_data['items'].append({'id': 'a'})
+    first.mark_dirty(('items', 'a'))
+    first.flush(wait=True)
+    second_data['items'].append({'id': 'b'})
+    second.mark_dirty(('items', 'b'))
+    second.flush(wait=True)
+
+    assert [item['id'] for item in json.loads(path.read_text())['items']] == ['a', 'b']
+    assert [item['id'] for item in first.refresh()['items']] == ['a', 'b']
+
+    second_data['items'] = [item for item in second_data['items'] if item['id'] != 'b']
+    second.mark_dirty(('items', 'b'), removed=True)
+    second.flush(wait=True)
+    assert [item['id'] for item in json.loads(path.read_text())['items']] == ['a']
+
+
+def test_multi_process_store_writes_are_merged(tmp_path, run_workers):
+    path = tmp_path / 'shared.json'
+    run_workers('store_items', 4, 15, path)
+
+    ids = [item['id'] for item in json.loads(path.read_text())['items']]
+    assert len(ids) == 60
+    assert set(ids) == {f'w{w}-{i}' for w in range(4) for i in range(15)}
+
+
+def test_file_lock_is_reentrant_and_excludes_threads(tmp_path):
+    lock = persistence.file_lock(tmp_path / 'data.json')
+    assert persistence.file_lock(tmp_path / 'data.json') is lock
+
+    acquired = threading.Event()
+
+    def other_thread():
+        with lock:
+            acquired.set()
+
+    with lock:
+        with lock:
+            thread = threading.Thread(target=other_thread)
+            thread.start()
+            assert not acquired.wait(0.2)
+    thread.join(5)
+    assert acquired.is_set()
+
+
+def test_file_lock_excludes_processes(tmp_path, run_workers):
+    path = tmp_path / 'counter.txt'
+    run_workers('lock_counter', 4, 50, path)
+
+    assert path.read_text() == '200'
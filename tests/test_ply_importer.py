@@ -0,0 +1,105 @@
+"""Test decoder PLY (header, binary big-endian, ASCII, dan attribute splat)."""
+
+import numpy as np
+import pytest
+
+from conftest import addon
+
+ply_importer = addon.ply_importer
+
+
+def _header(ply_format, count, properties, extra=''):
+    lines = ['ply', f'format {ply_format} 1.0', 'comment synthetic', f'element vertex {count}']
+    lines += [f'property {t} {n}' for n, t in properties]
+    return ('\n'.join(lines) + '\n' + extra + 'end_header\n').encode('ascii')
+
+
+SPLAT_PROPERTIES = [
+    ('x', 'float'), ('y', 'float'), ('z', 'float'),
+    ('scale_0', 'float'), ('scale_1', 'float'), ('scale_2', 'float'),
+    ('rot_0', 'float'), ('rot_1', 'float'), ('rot_2', 'float'), ('rot_3', 'float'),
+    ('opacity', 'float'),
+    ('f_dc_0', 'float'), ('f_dc_1', 'float'), ('f_dc_2', 'float'),
+]
+
+
+@pytest.fixture
+def splat_rows():
+    rows = np.zeros((3, len(SPLAT_PROPERTIES)), dtype=np.float32)
+    rows[:, 0:3] = [(1, 2, 3), (-1, 0, 0.5), (0, 0, 0)]
+    rows[:, 3:6] = np.log([[1, 2, 4]] * 3)
+    rows[:, 6:10] = [(2, 0, 0, 0), (0, 3, 0, 4), (1, 1, 1, 1)]
+    rows[:, 10] = [0, 20, -20]
+    rows[:, 11:14] = [(0, 0, 0), (10, -10, 0), (0.5, 0.5, 0.5)]
+    return rows
+
+
+def test_read_binary_big_endian(tmp_path, splat_rows):
+    path = tmp_path / 'splat.ply'
+    path.write_bytes(
+        _header('binary_big_endian', 3, SPLAT_PROPERTIES, 'element face 0\nproperty list uchar int vertex_indices\n')
+        + splat_rows.astype('>f4').tobytes()
+    )
+    data = ply_importer.read_ply_vertices(str(path))
+
+    assert data.dtype['x'].isnative
+    attributes = ply_importer.decode_splats(data)
+
+    np.testing.assert_array_equal(attributes['position'], splat_rows[:, 0:3])
+    np.testing.assert_allclose(attributes['scale'], [[1, 2, 4]] * 3, rtol=1e-6)
+    np.testing.assert_allclose(attributes['rotation'][:2], [(1, 0, 0, 0), (0, 0.6, 0, 0.8)])
+    np.testing.assert_allclose(attributes['opacity'], [0.5, 1.0, 0.0], atol=1e-6)
+    color = attributes['color']
+    assert color.shape == (3, 4)
+    np.testing.assert_allclose(color[0], [0.5, 0.5, 0.5, 0.5])
+    # Warna di-clip ke [0, 1], alpha dari opacity
+    np.testing.assert_allclose(color[1], [1.0, 0.0, 0.5, 1.0])
+
+
+def test_read_binary_with_point_budget(tmp_path):
+    points = np.arange(30, dtype='<f4').reshape(10, 3)
+    path = tmp_path / 'points.ply'
+    path.write_bytes(_header('binary_little_endian', 10, [('x', 'float'), ('y', 'float'), ('z', 'float')])
+                     + points.tobytes())
+    data = ply_importer.read_ply_vertices(str(path), point_budget=4)
+
+    # Stride ceil(10 / 4) = 3
+    np.testing.assert_array_equal(data['x'], [0, 9, 18, 27])
+
+
+def test_read_ascii_with_uchar_colors(tmp_path):
+    properties = [('x', 'float'), ('y', 'float'), ('z', 'float'),
+                  ('red', 'uchar'), ('green', 'uchar'), ('blue', 'uchar')]
+    path = tmp_path / 'colors.ply'
+    path.write_bytes(_header('ascii', 2, properties) + b'0 0 0 255 0 51\n1.5 -2 3 0 255 102\n')
+    data = ply_importer.read_ply_vertices(str(path))
+
+    assert data['red'].dtype == np.uint8
+    attributes = ply_importer.decode_splats(data)
+
+    np.testing.assert_array_equal(attributes['position'], [(0, 0, 0), (1.5, -2, 3)])
+    np.testing.assert_allclose(attributes['color'], [(1, 0, 0.2, 1), (0, 1, 0.4, 1)], rtol=1e-6)
+    assert 'opacity' not in attributes and 'scale' not in attributes
+
+
+def test_read_ply_header(tmp_path):
+    path = tmp_path / 'header.ply'
+    path.write_bytes(_header('ascii', 1, [('x', 'double')],
+                             'element face 4\nproperty list uchar int vertex_indices\n') + b'1\n')
+    with open(path, 'rb') as f:
+        ply_format, elements, offset = ply_importer.read_ply_header(f.read())
+
+    assert ply_format == 'ascii'
+    assert elements == [('vertex', 1, [('x', 'f8')]), ('face', 4, [('vertex_indices', None)])]
+    assert path.read_bytes()[offset:] == b'1\n'
+
+
+def test_invalid_files_raise(tmp_path):
+    path = tmp_path / 'bad.ply'
+    path.write_bytes(b'not a ply file at all\n')
+    with pytest.raises(ValueError, match='Not a PLY'):
+        ply_importer.read_ply_vertices(str(path))
+
+    path.write_bytes(_header('ascii', 1, [('x', 'float')]).replace(b'element vertex', b'element point'))
+    with pytest.raises(ValueError, match='vertex element'):
+        ply_importer.read_ply_vertices(str(path))
@@ -0,0 +1,64 @@
+"""Test HEAD probe ukuran variant provider."""
+
+import importlib
+import threading
+import time
+
+base_client = importlib.import_module('ai_3d_generator.providers.base_client')
+Client = base_client.BaseProviderClient
+
+
+class _Response:
+    ok = True
+
+    def __init__(self, size):
+        self.headers = {'Content-Length': str(size)}
+
+
+def _variants():
+    return [Client.build_variant('https://cdn.test/a.glb'), Client.build_variant('https://cdn.test/b.obj', size=7)]
+
+
+def test_probe_state_is_dropped_once_sizes_are_resolved(monkeypatch):
+    release = threading.Event()
+    calls = []
+
+    def head(url, **kwargs):
+        calls.append(url)
+        release.wait(5)
+        return _Response(123)
+
+    monkeypatch.setattr(base_client.requests, 'head', head)
+
+    variants, pending = Client.probe_variant_sizes('job-1', _variants())
+    assert pending and 'job-1' in Client._size_probes
+    # Poll berikutnya selama probe berjalan tidak memulai HEAD baru
+    assert Client.probe_variant_sizes('job-1', _variants())[1]
+
+    release.set()
+    for thread in Client._size_probes['job-1']['threads']:
+        thread.join(5)
+    variants, pending = Client.probe_variant_sizes('job-1', _variants())
+
+    assert not pending
+    assert [v['size'] for v in variants] == [123, 7]
+    assert calls == ['https://cdn.test/a.glb']
+    assert 'job-1' not in Client._size_probes
+
+
+def test_abandoned_probes_are_pruned(monkeypatch):
+    release = threading.Event()
+    monkeypatch.setattr(base_client.requests, 'head', lambda url, **kwargs: release.wait(5) and _Response(1))
+    Client.probe_variant_sizes('abandoned', _variants())
+    probe = Client._size_probes['abandoned']
+    release.set()
+    for thread in probe['threads']:
+        thread.join(5)
+    probe['started'] = time.time() - base_client.SIZE_PROBE_TTL - 1
+
+    release.clear()
+    Client.probe_variant_sizes('job-2', _variants())
+
+    assert 'abandoned' not in Client._size_probes
+    release.set()
+    Client._size_probes.pop('job-2', None)
@@ -0,0 +1,75 @@
+"""
+Worker untuk test multi-proses (dijalankan lewat subprocess).
+
+Usage: workers.py <command> <user_dir> <index> [args...]
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import bpy_stub
+
+
+def history_adds(index, count, threshold):
+    """Tambah generasi ke history JSON dengan compaction yang sering."""
+    from ai_3d_generator import history
+    history.COMPACT_THRESHOLD = int(threshold)
+    h = history.GenerationHistory()
+    for i in range(int(count)):
+        h.add_generation({'job_id': f'w{index}-{i}', 'provider': 'TRIPO', 'type': 'text'})
+        if i % 3 == 0:
+            h.update_generation(f'w{index}-{i}', 'completed')
+    h.compact(wait=True)
+
+
+def sqlite_updates(index, count):
+    """Update field berbeda pada entry SQLite history yang sama."""
+    import importlib
+    history_sqlite = importlib.import_module('ai_3d_generator.history_sqlite')
+    h = history_sqlite.SQLiteGenerationHistory()
+    for i in range(int(count)):
+        h.update_generation('shared', 'processing', **{f'w{index}_{i}': i})
+        h.record_metrics('shared', {f'w{index}': i})
+
+
+def store_items(index, count, path):
+    """Tambah item ke JSONStore bersama, flush setiap item."""
+    from ai_3d_generator import persistence
+    data = {'items': []}
+    store = persistence.register_store(
+        Path(path), lambda: data, 'test store', persistence.keyed_merge({'items': 'id'})
+    )
+    for i in range(int(count)):
+        reloaded = store.refresh()
+        if reloaded is not None:
+            data = reloaded
+        item_id = f'w{index}-{i}'
+        data['items'].append({'id': item_id})
+        store.mark_dirty(('items', item_id))
+        store.flush(wait=True)
+
+
+def lock_counter(index, count, path):
+    """Increment counter di file (read-modify-write) di bawah file_lock."""
+    from ai_3d_generator import persistence
+    path = Path(path)
+    for _ in range(int(count)):
+        with persistence.file_lock(path):
+            value = int(path.read_text()) if path.exists() else 0
+            path.write_text(str(value + 1))
+
+
+COMMANDS = {
+    'history_adds': history_adds,
+    'sqlite_updates': sqlite_updates,
+    'store_items': store_items,
+    'lock_counter': lock_counter,
+}
+
+
+if __name__ == '__main__':
+    command, user_dir, index, *args = sys.argv[1:]
+    bpy_stub.install(user_dir)
+    COMMANDS[command](index, *args)
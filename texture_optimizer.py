@@ -0,0 +1,182 @@
+"""
+Texture Optimizer
+
+Addon ini hanya bertindak sebagai client untuk layanan AI 3D pihak ketiga.
+User harus mendaftar dan menyediakan API key sendiri.
+
+Downscale texture hasil import ke resolusi maksimum atau VRAM budget.
+Resolusi dan data asli disimpan supaya texture bisa dikembalikan ke
+kualitas penuh kapan saja.
+"""
+
+import bpy
+import hashlib
+import math
+import os
+from pathlib import Path
+
+import numpy as np
+
+
+# Custom property yang disimpan di image datablock
+PROP_ORIGINAL_SIZE = "ai3d_original_size"
+PROP_ORIGINAL_PATH = "ai3d_original_path"
+PROP_ORIGINAL_PACKED = "ai3d_original_packed"
+
+# Estimasi overhead mipmap di GPU
+MIPMAP_FACTOR = 4.0 / 3.0
+
+MIN_TEXTURE_SIZE = 4
+
+
+def _get_originals_dir():
+    """Get folder untuk backup texture original."""
+    originals_dir = Path(bpy.utils.resource_path('USER')) / 'ai_3d_generator' / 'texture_originals'
+    originals_dir.mkdir(parents=True, exist_ok=True)
+    return originals_dir
+
+
+def estimate_texture_bytes(image, width: int = None, height: int = None) -> int:
+    """Estimasi memory GPU image (RGBA, 8 atau 32 bit per channel, plus mipmap)."""
+    width = width if width is not None else image.size[0]
+    height = height if height is not None else image.size[1]
+    bytes_per_pixel = 16 if image.is_float else 4
+    return int(width * height * bytes_per_pixel * MIPMAP_FACTOR)
+
+
+def _backup_original(image):
+    """Simpan data asli image ke folder backup dan catat resolusi aslinya."""
+    if PROP_ORIGINAL_SIZE in image:
+        return
+
+    image[PROP_ORIGINAL_SIZE] = list(image.size)
+    image[PROP_ORIGINAL_PACKED] = image.packed_file is not None
+
+    if image.packed_file is not None:
+        data = image.packed_file.data
+        ext = os.path.splitext(image.filepath_raw or image.name)[1] or '.png'
+        backup = _get_originals_dir() / f"{hashlib.sha1(data).hexdigest()}{ext}"
+        if not backup.exists():
+            backup.write_bytes(data)
+        image[PROP_ORIGINAL_PATH] = str(backup)
+    else:
+        image[PROP_ORIGINAL_PATH] = bpy.path.abspath(image.filepath)
+
+
+def _has_alpha(image) -> bool:
+    """Cek apakah image memakai alpha channel, secara vectorized."""
+    if image.channels < 4:
+        return False
+    pixels = np.empty(image.size[0] * image.size[1] * 4, dtype=np.float32)
+    image.pixels.foreach_get(pixels)
+    return bool((pixels[3::4] < 1.0).any())
+
+
+def _target_sizes(images, max_resolution: int, vram_budget_mb: int) -> dict:
+    """Hitung ukuran target tiap image dari max resolution dan VRAM budget."""
+    targets = {}
+    for image in images:
+        width, height = image.size
+        longest = max(width, height)
+        scale = 1.0
+        if max_resolution and longest > max_resolution:
+            scale = max_resolution / longest
+        targets[image] = (width * scale, height * scale)
+
+    if vram_budget_mb:
+        budget = vram_budget_mb * 1024 * 1024
+        total = sum(estimate_texture_bytes(img, int(w), int(h)) for img, (w, h) in targets.items())
+        if total > budget:
+            # Skala seragam untuk semua image supaya total masuk budget
+            scale = math.sqrt(budget / total)
+            targets = {img: (w * scale, h * scale) for img, (w, h) in targets.items()}
+
+    return {
+        img: (max(MIN_TEXTURE_SIZE, int(w)), max(MIN_TEXTURE_SIZE, int(h)))
+        for img, (w, h) in targets.items()
+    }
+
+
+def optimize_textures(images, max_resolution: int = 0, vram_budget_mb: int = 0,
+                      repack: bool = False) -> dict:
+    """
+    Downscale texture hasil import.
+
+    Args:
+        images: Image datablock yang dibuat oleh import
+        max_resolution: Sisi terpanjang maksimum (0 = tanpa batas)
+        vram_budget_mb: Total estimasi memory GPU maksimum (0 = tanpa batas)
+        repack: Pack ulang image yang di-downscale sebagai JPEG (tanpa alpha)
+            atau PNG supaya ukuran .blend tetap kecil
+
+    Returns:
+        Dict dengan kunci 'images', 'scaled', 'bytes_before', 'bytes_after'
+    """
+    images = [img for img in images if img.size[0] > 0 and img.size[1] > 0]
+    bytes_before = sum(estimate_texture_bytes(img) for img in images)
+
+    scaled = 0
+    for image, (width, height) in _target_sizes(images, max_resolution, vram_budget_mb).items():
+        if (width, height) == tuple(image.size):
+            continue
+        if width >= image.size[0] and height >= image.size[1]:
+            continue
+
+        _backup_original(image)
+        image.scale(width, height)
+        scaled += 1
+
+        if repack or image.packed_file is not None:
+            if repack:
+                image.file_format = 'PNG' if _has_alpha(image) else 'JPEG'
+            image.pack()
+
+    bytes_after = sum(estimate_texture_bytes(img) for img in images)
+    print(
+        f"Texture optimization: {scaled}/{len(images)} images scaled, "
+        f"{bytes_before / 1048576:.1f} MB -> {bytes_after / 1048576:.1f} MB"
+    )
+
+    return {
+        'images': len(images),
+        'scaled': scaled,
+        'bytes_before': bytes_before,
+        'bytes_after': bytes_after,
+    }
+
+
+def restore_texture(image) -> bool:
+    """
+    Kembalikan image ke resolusi dan data aslinya.
+
+    Returns:
+        True jika image berhasil dikembalikan
+    """
+    if PROP_ORIGINAL_SIZE not in image:
+        return False
+
+    original_path = image.get(PROP_ORIGINAL_PATH, '')
+    if not original_path or not os.path.exists(original_path):
+        print(f"Original texture not found for: {image.name}")
+        return False
+
+    was_packed = image.get(PROP_ORIGINAL_PACKED, False)
+    if image.packed_file is not None:
+        image.unpack(method='REMOVE')
+
+    image.filepath = original_path
+    image.source = 'FILE'
+    image.reload()
+
+    if was_packed:
+        image.pack()
+
+    for prop in (PROP_ORIGINAL_SIZE, PROP_ORIGINAL_PATH, PROP_ORIGINAL_PACKED):
+        del image[prop]
+
+    return True
+
+
+def restore_all_textures() -> int:
+    """Kembalikan semua image yang pernah di-downscale. Returns jumlah image."""
+    return sum(1 for image in bpy.data.images if restore_texture(image))
@@ -10,6 +10,10 @@ Panel UI di 3D View sidebar untuk Text-to-3D dan Image-to-3D generation.
 import bpy
 from bpy.types import Panel
 
+from .import_queue import get_import_queue
+from .import_workers import get_worker_pool
+from .download_scheduler import get_download_scheduler
+
 
 class AI3DGeneratorPanel(Panel):
     """Panel untuk AI 3D Generator di 3D View sidebar."""
@@ -49,6 +53,9 @@ class AI3DGeneratorPanel(Panel):
         elif context.window_manager.ai3d_panel_tab == 'IMAGE':
             self._draw_image_to_3d(layout, scene)
         
+        # Import options
+        self._draw_import_options(layout, scene)
+        
         # Status section
         self._draw_status(layout, scene)
     
@@ -125,8 +132,104 @@ class AI3DGeneratorPanel(Panel):
         row.scale_y = 1.5
         row.operator("ai3d.generate_image", icon='MESH_DATA')
     
+    def _draw_import_options(self, layout, scene):
+        """Draw import options section."""
+        box = layout.box()
+        box.label(text="Import Options", icon='IMPORT')
+        
+        # Import budget
+        col = box.column(align=True)
+        col.prop(scene, "ai3d_import_max_file_mb")
+        col.prop(scene, "ai3d_import_max_triangles")
+        
+        box.prop(scene, "ai3d_fast_obj_import")
+        box.prop(scene, "ai3d_link_duplicates")
+        box.prop(scene, "ai3d_dedupe_datablocks")
+        
+        # Background import workers
+        row = box.row(align=True)
+        row.prop(scene, "ai3d_background_import")
+        sub = row.row()
+        sub.enabled = scene.ai3d_background_import
+        sub.prop(scene, "ai3d_background_link")
+        
+        # Time-sliced import queue
+        row = box.row(align=True)
+        row.prop(scene, "ai3d_time_sliced_import")
+        sub = row.row()
+        sub.enabled = scene.ai3d_time_sliced_import
+        sub.prop(scene, "ai3d_queue_budget_ms", text="ms")
+        box.prop(scene, "ai3d_point_budget")
+        
+        # Normalize on import
+        box.prop(scene, "ai3d_normalize_import")
+        col = box.column(align=True)
+        col.enabled = scene.ai3d_normalize_import
+        col.prop(scene, "ai3d_normalize_size")
+        row = col.row(align=True)
+        row.prop(scene, "ai3d_normalize_ground")
+        row.prop(scene, "ai3d_normalize_center")
+        col.prop(scene, "ai3d_normalize_origin")
+        
+        # Mesh optimization
+        box.prop(scene, "ai3d_optimize_mesh")
+        row = box.row()
+        row.enabled = scene.ai3d_optimize_mesh
+        row.prop(scene, "ai3d_triangle_budget")
+        
+        # LOD chain
+        box.prop(scene, "ai3d_generate_lods")
+        row = box.row()
+        row.enabled = scene.ai3d_generate_lods
+        row.prop(scene, "ai3d_lod_ratios")
+        
+        # Texture budget
+        col = box.column(align=True)
+        col.prop(scene, "ai3d_texture_max_resolution")
+        col.prop(scene, "ai3d_texture_vram_budget_mb")
+        col.prop(scene, "ai3d_texture_repack")
+        box.operator("ai3d.restore_textures", icon='IMAGE_DATA')
+        
+        box.prop(scene, "ai3d_record_metrics")
+        
+        # Tiered model cache
+        row = box.row(align=True)
+        row.prop(scene, "ai3d_model_cache")
+        sub = row.row(align=True)
+        sub.enabled = scene.ai3d_model_cache
+        sub.prop(scene, "ai3d_cache_hot_mb", text="Hot MB")
+        sub.prop(scene, "ai3d_cache_codec", text="")
+        
+        # Download scheduler
+        col = box.column(align=True)
+        row = col.row(align=True)
+        row.prop(scene, "ai3d_max_downloads")
+        row.prop(scene, "ai3d_max_downloads_per_host")
+        col.prop(scene, "ai3d_bandwidth_limit_mbps")
+        
+        # Asset library export
+        box.prop(scene, "ai3d_asset_library")
+        
+        # External per-model storage
+        row = box.row(align=True)
+        row.prop(scene, "ai3d_external_storage")
+        sub = row.row()
+        sub.enabled = scene.ai3d_external_storage
+        sub.prop(scene, "ai3d_storage_override")
+        row = box.row(align=True)
+        row.operator("ai3d.load_stored_model", icon='LINK_BLEND')
+        row.operator("ai3d.unload_stored_model", icon='UNLINKED')
+    
     def _draw_status(self, layout, scene):
         """Draw status section."""
+        queue_depth = get_import_queue().depth()
+        worker_depth = get_worker_pool().queue_depth()
+        download_depth = get_download_scheduler().queue_depth()
+        if queue_depth or worker_depth or download_depth:
+            box = layout.box()
+            box.label(text=f"Import queue: {queue_depth} | Background: {worker_depth}", icon='SORTTIME')
+            box.label(text=f"Downloads: {download_depth}", icon='IMPORT')
+        
         if scene.ai3d_current_job_id:
             box = layout.box()
             box.label(text="Generation Status", icon='PROGRESS')